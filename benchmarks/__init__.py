@@ -0,0 +1,4 @@
+"""End-to-end benchmarks for the job search pipeline.
+
+Run with ``python -m benchmarks.run`` (see benchmarks/README.md).
+"""
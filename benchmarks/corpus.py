@@ -0,0 +1,129 @@
+"""Synthetic job corpora for benchmarks."""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+
+from src.database import db, Job
+from src.database.payload_store import encode_payload
+from src.scrapers import JobRecord
+from src.scrapers.stub_server import synthetic_posting
+from src.utils import geo
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ["serpapi", "adzuna", "indeed", "linkedin", "glassdoor", "monster"]
+
+# Rows per INSERT when bulk-loading a corpus
+LOAD_CHUNK_SIZE = 5000
+
+
+def synthetic_job(index: int, seed: str = "corpus") -> JobRecord:
+    """
+    Build a normalized job (what scrapers return).
+
+    Args:
+        index: Job number; the same index and seed give the same job
+        seed: Corpus seed
+
+    Returns:
+        Normalized job
+    """
+    posting = synthetic_posting(index, seed)
+    source = SOURCES[index % len(SOURCES)]
+
+    return JobRecord(
+        external_id=f"{source}_{posting['id']}",
+        source=source,
+        title=posting["title"],
+        company=posting["company"],
+        location=f"{posting['city']}, {posting['state']}".strip(", "),
+        description=posting["description"],
+        url=f"https://example.com/jobs/{posting['id']}",
+        job_type="Full-time",
+        remote_type="Remote" if posting["remote"] else "On-site",
+        salary_min=float(posting["salary_min"]),
+        salary_max=float(posting["salary_max"]),
+        posted_date=posting["posted"],
+        raw_data=dict(posting, posted=posting["posted"].isoformat()),
+    )
+
+
+def iter_jobs(count: int, start: int = 0, seed: str = "corpus") -> Iterator[JobRecord]:
+    """Yield ``count`` synthetic jobs starting at index ``start``."""
+    for index in range(start, start + count):
+        yield synthetic_job(index, seed)
+
+
+def analysis_for(job: JobRecord) -> Dict[str, Any]:
+    """Analysis dict (analyzer output shape) for a synthetic job."""
+    description = job.description.lower()
+    skills = [
+        skill
+        for skill in ("Python", "Go", "SQL", "AWS", "Docker", "Kubernetes", "React")
+        if skill.lower() in description
+    ]
+    return {
+        "required_skills": skills,
+        "technologies": skills,
+        "experience_years": 3,
+    }
+
+
+def _row(job: JobRecord, now: datetime) -> Dict[str, Any]:
+    """Column values for a bulk insert."""
+    return dict(
+        job.to_dict(),
+        posted_date=job.posted_date,
+        content_hash=Job.make_content_hash(job.title, job.company, job.description),
+        salary_currency="USD",
+        salary_period="year",
+        **geo.location_columns(job.location),
+        annual_salary_min=job.salary_min,
+        annual_salary_max=job.salary_max,
+        ai_summary=f"{job.title} at {job.company}.",
+        ai_extracted_skills=analysis_for(job)["required_skills"],
+        scraped_date=now,
+        updated_date=now,
+        is_active=True,
+    )
+
+
+def load_corpus(count: int, with_payloads: bool = False) -> int:
+    """
+    Bulk-load ``count`` synthetic jobs into the configured database.
+
+    Bypasses the ORM so million-row corpora build in minutes; use
+    JobSearchAgent.save_jobs_to_db to benchmark the real save path.
+
+    Args:
+        count: Number of jobs to insert
+        with_payloads: Also store compressed raw payloads
+
+    Returns:
+        Number of jobs inserted
+    """
+    now = datetime.utcnow()
+    inserted = 0
+
+    for start in range(0, count, LOAD_CHUNK_SIZE):
+        jobs: List[JobRecord] = list(
+            iter_jobs(min(LOAD_CHUNK_SIZE, count - start), start)
+        )
+        rows = [_row(job, now) for job in jobs]
+
+        with db.get_write_session() as session:
+            if with_payloads:
+                payloads = {}
+                for row, job in zip(rows, jobs):
+                    payload = encode_payload(job.raw_data)
+                    row["payload_hash"] = payload.content_hash
+                    payloads[payload.content_hash] = payload
+                session.add_all(payloads.values())
+            session.execute(Job.__table__.insert(), rows)
+
+        inserted += len(rows)
+        if inserted % (LOAD_CHUNK_SIZE * 20) == 0:
+            logger.info(f"Loaded {inserted}/{count} jobs")
+
+    return inserted
@@ -0,0 +1,162 @@
+"""Timing, resource measurement and environment setup for benchmarks."""
+
+import math
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+from src.utils import load_config, offline_config
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of samples.
+
+    Args:
+        samples: Sample values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Percentile value (0.0 for no samples)
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100.0 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def latency_summary(samples: List[float]) -> Dict[str, float]:
+    """Summarize latency samples (seconds) in milliseconds."""
+    to_ms = 1000.0
+    return {
+        "p50": round(percentile(samples, 50) * to_ms, 3),
+        "p95": round(percentile(samples, 95) * to_ms, 3),
+        "p99": round(percentile(samples, 99) * to_ms, 3),
+        "mean": round(sum(samples) / len(samples) * to_ms, 3) if samples else 0.0,
+        "max": round(max(samples) * to_ms, 3) if samples else 0.0,
+    }
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None if unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    divisor = 1024.0 * 1024.0 if os.uname().sysname == "Darwin" else 1024.0
+    return round(peak / divisor, 1)
+
+
+def file_size_mb(path: str) -> float:
+    """Size of a SQLite database including its WAL, in MB."""
+    total = 0
+    for candidate in (path, f"{path}-wal"):
+        if os.path.exists(candidate):
+            total += os.path.getsize(candidate)
+    return round(total / (1024.0 * 1024.0), 2)
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements for one benchmark case at one corpus size."""
+
+    benchmark: str
+    case: str
+    size: int
+    ops: int = 0
+    items: int = 0
+    seconds: float = 0.0
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    throughput: float = 0.0
+    items_per_second: float = 0.0
+    peak_rss_mb: Optional[float] = None
+    db_size_mb: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert result to dictionary."""
+        return asdict(self)
+
+
+class Recorder:
+    """Collect per-operation latencies for one benchmark case."""
+
+    def __init__(self, benchmark: str, case: str, size: int):
+        """
+        Initialize recorder.
+
+        Args:
+            benchmark: Benchmark name
+            case: Case within the benchmark (route, query shape, ...)
+            size: Corpus size
+        """
+        self.benchmark = benchmark
+        self.case = case
+        self.size = size
+        self.samples: List[float] = []
+        self.items = 0
+
+    def measure(
+        self, func: Callable[[], Any], items: Union[int, Callable[[Any], int]] = 1
+    ) -> Any:
+        """
+        Time one operation.
+
+        Args:
+            func: Operation to run
+            items: Number of jobs the operation processed, or a function
+                computing it from the return value
+
+        Returns:
+            Return value of ``func``
+        """
+        start = time.perf_counter()
+        value = func()
+        self.samples.append(time.perf_counter() - start)
+        self.items += items(value) if callable(items) else items
+        return value
+
+    def result(self) -> BenchmarkResult:
+        """Build the result from recorded samples."""
+        seconds = sum(self.samples)
+        return BenchmarkResult(
+            benchmark=self.benchmark,
+            case=self.case,
+            size=self.size,
+            ops=len(self.samples),
+            items=self.items,
+            seconds=round(seconds, 4),
+            latency_ms=latency_summary(self.samples),
+            throughput=round(len(self.samples) / seconds, 2) if seconds else 0.0,
+            items_per_second=round(self.items / seconds, 2) if seconds else 0.0,
+        )
+
+
+def benchmark_config(
+    database_path: str,
+    stub_url: str,
+    llm_latency_ms: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Build an application config wired to local, offline dependencies.
+
+    Args:
+        database_path: SQLite file for the benchmark database
+        stub_url: Base URL of the running stub provider server
+        llm_latency_ms: Simulated latency per fake LLM call
+
+    Returns:
+        Configuration dictionary
+    """
+    return offline_config(
+        load_config(),
+        stub_url,
+        database_url=f"sqlite:///{database_path}",
+        llm_options={"latency_ms": llm_latency_ms},
+    )
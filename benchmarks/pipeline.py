@@ -0,0 +1,305 @@
+"""Benchmarks for the search pipeline, storage layer and API routes."""
+
+import logging
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from src.agents import JobAnalyzer, JobSearchAgent
+from src.database import db, export
+from src.scrapers.stub_server import PROVIDERS, synthetic_posting
+from src.utils import geo, json_backend
+
+from .corpus import analysis_for, iter_jobs
+from .harness import BenchmarkResult, Recorder
+
+logger = logging.getLogger(__name__)
+
+# Jobs per save_jobs_to_db call; half of each batch is already stored
+SAVE_BATCH_SIZE = 100
+
+# match_job_to_profile is pure CPU, so cap the jobs scored per run
+MAX_MATCH_JOBS = 100000
+
+# Jobs per encoded search response / decoded provider page
+JSON_BATCH_SIZE = 50
+
+# Full-table exports per format; each one reads the whole corpus
+EXPORT_ITERATIONS = 3
+
+# get_jobs cases that must be served by an index (name prefix) on SQLite
+INDEXED_CASES = {
+    "posted_since": "ix_jobs_posted_date",
+    "salary_range": "ix_jobs_annual_salary_",
+    "near": "ix_jobs_lat_lon",
+}
+
+SEMANTIC_QUERIES = [
+    "backend python developer",
+    "machine learning engineer",
+    "frontend react",
+    "data analyst sql",
+    "devops kubernetes aws",
+]
+
+PROFILE = {
+    "skills": ["Python", "SQL", "AWS", "Docker", "Kubernetes"],
+    "experience_years": 5,
+}
+
+
+@dataclass
+class BenchmarkContext:
+    """Everything a benchmark needs to run against a prepared corpus."""
+
+    size: int
+    iterations: int
+    config: Dict[str, Any]
+    seed: int = 0
+
+
+def bench_save_jobs(ctx: BenchmarkContext) -> List[BenchmarkResult]:
+    """Save batches of half-new, half-known jobs through save_jobs_to_db."""
+    agent = JobSearchAgent(ctx.config)
+    recorder = Recorder("save_jobs", f"batch_{SAVE_BATCH_SIZE}", ctx.size)
+    half = SAVE_BATCH_SIZE // 2
+
+    for i in range(ctx.iterations):
+        start = max(ctx.size - half, 0) + i * half
+        jobs = list(iter_jobs(SAVE_BATCH_SIZE, start))
+        recorder.measure(lambda: agent.save_jobs_to_db(jobs), items=len(jobs))
+
+    return [recorder.result()]
+
+
+def bench_execute_search(ctx: BenchmarkContext) -> List[BenchmarkResult]:
+    """Run full searches (stub providers, fake LLM), first fresh then repeated."""
+    agent = JobSearchAgent(ctx.config)
+    searches = max(ctx.iterations // 10, 5)
+    keywords = [f"benchmark query {ctx.seed}-{i}" for i in range(searches)]
+    results = []
+
+    for case in ("new_results", "known_results"):
+        recorder = Recorder("execute_search", case, ctx.size)
+        for query in keywords:
+            recorder.measure(
+                lambda: agent.execute_search(
+                    keywords=query, location="Remote", response_mode="ids"
+                ),
+                items=lambda response: response["total_jobs"],
+            )
+        results.append(recorder.result())
+
+    # Incremental crawls take a starting page; fail if that drops the results
+    recorder = Recorder("execute_search", "incremental_page", ctx.size)
+    for query in keywords:
+        response = recorder.measure(
+            lambda: agent.execute_search(
+                keywords=f"{query} incremental",
+                location="Remote",
+                response_mode="ids",
+                incremental=True,
+                page=1,
+            ),
+            items=lambda response: response["total_jobs"],
+        )
+        if not response["total_jobs"]:
+            raise RuntimeError(f"Incremental search with page found no jobs: {query}")
+    results.append(recorder.result())
+
+    return results
+
+
+def bench_get_jobs(ctx: BenchmarkContext) -> List[BenchmarkResult]:
+    """Query stored jobs with the filter shapes the API exposes."""
+    agent = JobSearchAgent(ctx.config)
+    cases = {
+        "latest": {},
+        "by_source": {"source": "indeed"},
+        "by_keywords": {"keywords": "engineer"},
+        "posted_since": {"posted_since": datetime.utcnow() - timedelta(days=7)},
+        "salary_range": {"min_salary": 150000, "max_salary": 200000},
+        "near": {"near": geo.parse_point("Austin, TX"), "radius_km": 50},
+    }
+    results = []
+
+    for case, filters in cases.items():
+        index = INDEXED_CASES.get(case)
+        if index and db.is_sqlite:
+            plan = agent.explain_jobs_query(**filters)
+            if not any(index in line for line in plan):
+                raise RuntimeError(f"get_jobs/{case} does not use {index}*: {plan}")
+
+        recorder = Recorder("get_jobs", case, ctx.size)
+        for _ in range(ctx.iterations):
+            recorder.measure(
+                lambda: agent.get_jobs_from_db(limit=50, **filters), items=len
+            )
+        results.append(recorder.result())
+
+    return results
+
+
+def bench_export(ctx: BenchmarkContext) -> List[BenchmarkResult]:
+    """Stream the whole corpus in each export format, discarding the output."""
+    agent = JobSearchAgent(ctx.config)
+    formats = [name for name in export.EXPORT_FORMATS if name != "parquet"]
+    if export.pq is not None:
+        formats.append("parquet")
+    results = []
+
+    def run(export_format: str) -> int:
+        chunk_sizes = []
+
+        def chunks():
+            for chunk in agent.iter_job_rows():
+                chunk_sizes.append(len(chunk))
+                yield chunk
+
+        for _ in export.encode(chunks(), export_format):
+            pass
+        return sum(chunk_sizes)
+
+    for export_format in formats:
+        recorder = Recorder("export", export_format, ctx.size)
+        for _ in range(EXPORT_ITERATIONS):
+            recorder.measure(lambda: run(export_format), items=lambda rows: rows)
+        results.append(recorder.result())
+
+    return results
+
+
+def bench_semantic(ctx: BenchmarkContext) -> List[BenchmarkResult]:
+    """Build the vector index over the corpus, then run semantic queries."""
+    agent = JobSearchAgent(ctx.config)
+    if agent.vector_index is None:
+        logger.warning("Skipping semantic benchmark: numpy is not installed")
+        return []
+
+    recorder = Recorder("semantic", "build_index", ctx.size)
+    recorder.measure(agent.build_vector_index, items=lambda count: count)
+    results = [recorder.result()]
+
+    rng = random.Random(ctx.seed)
+    cases = {
+        "search": lambda: agent.semantic_search(
+            rng.choice(SEMANTIC_QUERIES), limit=20
+        ),
+        "similar": lambda: agent.similar_jobs(
+            rng.randint(1, max(ctx.size, 1)), limit=10
+        ),
+    }
+    for case, call in cases.items():
+        recorder = Recorder("semantic", case, ctx.size)
+        for _ in range(ctx.iterations):
+            recorder.measure(call, items=lambda jobs: len(jobs or []))
+        results.append(recorder.result())
+
+    return results
+
+
+def bench_match_profile(ctx: BenchmarkContext) -> List[BenchmarkResult]:
+    """Score synthetic analyzed jobs against a user profile."""
+    analyzer = JobAnalyzer(model="fake", provider="fake")
+    jobs = []
+    for job in iter_jobs(min(ctx.size, MAX_MATCH_JOBS)):
+        jobs.append(dict(job.to_dict(), ai_extracted_skills=analysis_for(job)))
+
+    recorder = Recorder("match_profile", "skills_overlap", ctx.size)
+    for job in jobs:
+        recorder.measure(lambda: analyzer.match_job_to_profile(job, PROFILE))
+
+    return [recorder.result()]
+
+
+def bench_api(ctx: BenchmarkContext) -> List[BenchmarkResult]:
+    """Drive the Flask routes in-process through the test client."""
+    # Imported lazily: the server module builds its agent from CONFIG_PATH
+    from src.api.server import app
+
+    logging.getLogger().setLevel(logging.WARNING)
+    client = app.test_client()
+    rng = random.Random(ctx.seed)
+
+    cases: Dict[str, Callable[[int], Any]] = {
+        "GET /api/jobs": lambda i: client.get("/api/jobs?limit=50"),
+        "GET /api/jobs?source": lambda i: client.get("/api/jobs?limit=50&source=indeed"),
+        "GET /api/jobs/<id>": lambda i: client.get(
+            f"/api/jobs/{rng.randint(1, max(ctx.size, 1))}"
+        ),
+        "GET /api/stats": lambda i: client.get("/api/stats"),
+        "POST /api/search": lambda i: client.post(
+            "/api/search",
+            json={
+                "keywords": f"api benchmark {ctx.seed}-{i}",
+                "location": "Remote",
+                "response_mode": "ids",
+            },
+        ),
+    }
+    results = []
+
+    for case, call in cases.items():
+        recorder = Recorder("api", case, ctx.size)
+        iterations = max(ctx.iterations // 10, 5) if case.startswith("POST") else ctx.iterations
+        for i in range(iterations):
+            response = recorder.measure(lambda: call(i))
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"{case} returned {response.status_code}: {response.get_data(as_text=True)}"
+                )
+        results.append(recorder.result())
+
+    return results
+
+
+def bench_json(ctx: BenchmarkContext) -> List[BenchmarkResult]:
+    """
+    Encode and decode realistic payloads with every available JSON backend.
+
+    Independent of corpus size: a full 50-job search response with raw
+    payloads, a 50-result provider page and an analysis JSON column value.
+    """
+    jobs = []
+    for job in iter_jobs(JSON_BATCH_SIZE, seed=str(ctx.seed)):
+        job.ai_analysis = analysis_for(job)
+        job.ai_summary = f"{job.title} at {job.company}."
+        jobs.append(job.to_dict(include_raw=True))
+    response = {"total_jobs": len(jobs), "jobs": jobs}
+
+    results_key, _, _, build, _ = PROVIDERS["api.adzuna.com"]
+    page = json_backend.BACKENDS["json"][0](
+        {results_key: [build(synthetic_posting(i)) for i in range(JSON_BATCH_SIZE)]}
+    )
+    analysis = analysis_for(next(iter_jobs(1)))
+
+    results = []
+    for name, (dumps_bytes, loads) in json_backend.BACKENDS.items():
+        cases = {
+            "encode_search_response": (
+                lambda: dumps_bytes(response, default=str),
+                JSON_BATCH_SIZE,
+            ),
+            "decode_provider_page": (lambda: loads(page), JSON_BATCH_SIZE),
+            "json_column_roundtrip": (lambda: loads(dumps_bytes(analysis)), 1),
+        }
+        for case, (call, items) in cases.items():
+            recorder = Recorder("json", f"{case}/{name}", ctx.size)
+            for _ in range(ctx.iterations):
+                recorder.measure(call, items=items)
+            results.append(recorder.result())
+
+    return results
+
+
+BENCHMARKS: Dict[str, Callable[[BenchmarkContext], List[BenchmarkResult]]] = {
+    "save_jobs": bench_save_jobs,
+    "execute_search": bench_execute_search,
+    "get_jobs": bench_get_jobs,
+    "export": bench_export,
+    "semantic": bench_semantic,
+    "match_profile": bench_match_profile,
+    "api": bench_api,
+    "json": bench_json,
+}
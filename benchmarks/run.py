@@ -0,0 +1,331 @@
+"""
+Command-line runner for the pipeline benchmarks.
+
+Each (benchmark, corpus size) pair runs in a fresh process against its own
+copy of a pre-built synthetic corpus, so peak RSS and database size are
+attributable to that benchmark alone. Scrapers hit the local stub server
+and analysis uses the fake LLM provider; no network access or API keys
+are needed.
+
+Examples:
+    python -m benchmarks.run --sizes 1000,10000 --output bench.json
+    python -m benchmarks.run --benchmarks get_jobs,api --sizes 1000000 \\
+        --work-dir .bench --compare baseline.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from typing import Any, Dict, List, Optional
+
+from src.utils import write_config
+
+from .harness import benchmark_config, file_size_mb, peak_rss_mb
+from .pipeline import BENCHMARKS, BenchmarkContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [1000, 10000]
+
+
+def _configure_database(database_path: str):
+    """Point the global database at a benchmark SQLite file."""
+    from src.database import db
+
+    db.configure(config={"url": f"sqlite:///{database_path}"})
+    db.create_tables()
+    return db
+
+
+def build_corpus(database_path: str, size: int, with_payloads: bool) -> Dict[str, Any]:
+    """
+    Build a corpus database (runs in a child process).
+
+    Args:
+        database_path: SQLite file to create
+        size: Number of jobs
+        with_payloads: Also store compressed raw payloads
+
+    Returns:
+        Build statistics
+    """
+    from .corpus import load_corpus
+
+    logging.basicConfig(level=logging.WARNING)
+    start = time.perf_counter()
+    db = _configure_database(database_path)
+    load_corpus(size, with_payloads=with_payloads)
+    db.close()
+
+    return {
+        "size": size,
+        "seconds": round(time.perf_counter() - start, 2),
+        "db_size_mb": file_size_mb(database_path),
+    }
+
+
+def run_benchmark(
+    name: str, size: int, database_path: str, options: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Run one benchmark against a corpus copy (runs in a child process).
+
+    Args:
+        name: Benchmark name (key of BENCHMARKS)
+        size: Corpus size
+        database_path: Corpus copy to run against
+        options: iterations, llm_latency_ms, stub_latency_ms, seed
+
+    Returns:
+        List of result dictionaries
+    """
+    from src.scrapers.stub_server import start_stub_server
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    stub = start_stub_server(
+        latency_ms=options["stub_latency_ms"], total_results=1000, seed=options["seed"]
+    )
+    config = benchmark_config(database_path, stub.url, options["llm_latency_ms"])
+    os.environ["CONFIG_PATH"] = write_config(config, f"{database_path}.yaml")
+    db = _configure_database(database_path)
+
+    try:
+        ctx = BenchmarkContext(
+            size=size,
+            iterations=options["iterations"],
+            config=config,
+            seed=options["seed"],
+        )
+        results = BENCHMARKS[name](ctx)
+    finally:
+        stub.shutdown()
+        db.close()
+
+    rss = peak_rss_mb()
+    db_size = file_size_mb(database_path)
+    for result in results:
+        result.peak_rss_mb = rss
+        result.db_size_mb = db_size
+    return [result.to_dict() for result in results]
+
+
+def _in_child(func, *args):
+    """Run a function in a fresh spawned process and return its result."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(func, *args).result()
+
+
+def _git_revision() -> Optional[str]:
+    """Current git commit, if available."""
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """
+    Compare results with a previous run.
+
+    A case regresses when its p95 latency grows, or its item throughput
+    drops, by more than ``tolerance`` (a fraction).
+
+    Args:
+        results: Current result dictionaries
+        baseline: Previously written benchmark JSON
+        tolerance: Allowed relative change
+
+    Returns:
+        Human-readable regression descriptions
+    """
+    previous = {
+        (r["benchmark"], r["case"], r["size"]): r for r in baseline.get("results", [])
+    }
+    regressions = []
+
+    for result in results:
+        key = (result["benchmark"], result["case"], result["size"])
+        base = previous.get(key)
+        if not base:
+            continue
+
+        label = f"{key[0]}/{key[1]} @ {key[2]}"
+        old_p95, new_p95 = base["latency_ms"]["p95"], result["latency_ms"]["p95"]
+        if old_p95 and new_p95 > old_p95 * (1 + tolerance):
+            regressions.append(f"{label}: p95 {old_p95:.3f}ms -> {new_p95:.3f}ms")
+
+        old_rate, new_rate = base["items_per_second"], result["items_per_second"]
+        if old_rate and new_rate < old_rate * (1 - tolerance):
+            regressions.append(
+                f"{label}: throughput {old_rate:.1f}/s -> {new_rate:.1f}/s"
+            )
+
+    return regressions
+
+
+def print_table(results: List[Dict[str, Any]]):
+    """Print results as a plain-text table."""
+    header = (
+        f"{'benchmark':<15} {'case':<34} {'size':>8} {'items/s':>11} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'rss MB':>8} {'db MB':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        latency = r["latency_ms"]
+        print(
+            f"{r['benchmark']:<15} {r['case']:<34} {r['size']:>8} "
+            f"{r['items_per_second']:>11.1f} {latency['p50']:>9.3f} "
+            f"{latency['p95']:>9.3f} {latency['p99']:>9.3f} "
+            f"{r['peak_rss_mb'] or 0:>8.1f} {r['db_size_mb'] or 0:>8.2f}"
+        )
+
+
+def main():
+    """Run benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description="Job search pipeline benchmarks")
+    parser.add_argument(
+        "--benchmarks",
+        default=",".join(BENCHMARKS),
+        help=f"Comma-separated benchmarks to run ({', '.join(BENCHMARKS)})",
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="Comma-separated corpus sizes (jobs already stored)",
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=200, help="Operations per benchmark case"
+    )
+    parser.add_argument(
+        "--llm-latency-ms", type=float, default=0.0, help="Fake LLM latency per call"
+    )
+    parser.add_argument(
+        "--stub-latency-ms", type=float, default=0.0, help="Stub provider latency"
+    )
+    parser.add_argument(
+        "--payloads", action="store_true", help="Store raw payloads in the corpus"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--work-dir",
+        help="Directory for corpus databases (reused across runs; default: temp dir)",
+    )
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON to check for regressions")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed relative regression for --compare (default: 0.10)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    names = [name.strip() for name in args.benchmarks.split(",") if name.strip()]
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmark(s): {', '.join(unknown)}")
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="jobsearch-bench-")
+    os.makedirs(work_dir, exist_ok=True)
+    options = {
+        "iterations": args.iterations,
+        "llm_latency_ms": args.llm_latency_ms,
+        "stub_latency_ms": args.stub_latency_ms,
+        "seed": args.seed,
+    }
+
+    results = []
+    corpora = []
+    try:
+        for size in sizes:
+            suffix = "-payloads" if args.payloads else ""
+            corpus_path = os.path.join(work_dir, f"corpus-{size}{suffix}.db")
+            if os.path.exists(corpus_path):
+                logger.info(f"Reusing corpus {corpus_path}")
+            else:
+                logger.info(f"Building corpus of {size} jobs")
+                corpora.append(
+                    _in_child(build_corpus, corpus_path, size, args.payloads)
+                )
+
+            for name in names:
+                bench_path = os.path.join(work_dir, f"bench-{name}-{size}.db")
+                shutil.copyfile(corpus_path, bench_path)
+                logger.info(f"Running {name} @ {size}")
+                try:
+                    results.extend(
+                        _in_child(run_benchmark, name, size, bench_path, options)
+                    )
+                finally:
+                    for path in (bench_path, f"{bench_path}-wal", f"{bench_path}-shm"):
+                        if os.path.exists(path):
+                            os.remove(path)
+                    if os.path.exists(f"{bench_path}.yaml"):
+                        os.remove(f"{bench_path}.yaml")
+                    # Semantic index built from jobs saved during the run
+                    shutil.rmtree(f"{bench_path}.vectors", ignore_errors=True)
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "options": options,
+            "corpora": corpora,
+        },
+        "results": results,
+    }
+
+    print()
+    print_table(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) vs {args.compare}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions vs {args.compare} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
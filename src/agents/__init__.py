@@ -2,5 +2,14 @@
 
 from .job_analyzer import JobAnalyzer
 from .job_search_agent import JobSearchAgent
+from .liveness_sweeper import LivenessSweeper
+from .sweep_scheduler import SweepScheduler
+from .task_worker import TaskWorker
 
-__all__ = ["JobAnalyzer", "JobSearchAgent"]
+__all__ = [
+    "JobAnalyzer",
+    "JobSearchAgent",
+    "LivenessSweeper",
+    "SweepScheduler",
+    "TaskWorker",
+]
@@ -1,21 +1,84 @@
 """AI agent for analyzing job postings."""
 
 import os
+import time
 from typing import Dict, Any, List, Optional
 import json
 import logging
 
+from ..scrapers import JobRecord
+from ..utils import metrics
+from .llm_providers import LLMUsage, create_provider, estimate_cost
+
 logger = logging.getLogger(__name__)
 
+LLM_SECONDS = metrics.histogram(
+    "jobsearch_llm_request_seconds",
+    "LLM call latency per analyzed job in seconds",
+    ["provider", "model"],
+)
+LLM_REQUESTS_TOTAL = metrics.counter(
+    "jobsearch_llm_requests_total",
+    "LLM calls by outcome (ok or error)",
+    ["provider", "outcome"],
+)
+LLM_TOKENS_TOTAL = metrics.counter(
+    "jobsearch_llm_tokens_total",
+    "LLM tokens used by direction (input or output)",
+    ["provider", "model", "direction"],
+)
+LLM_COST_TOTAL = metrics.counter(
+    "jobsearch_llm_cost_usd_total",
+    "Estimated LLM cost in USD",
+    ["provider", "model"],
+)
+
+SYSTEM_PROMPT = (
+    "You are a job posting analyzer. Extract structured information from job "
+    "descriptions and return valid JSON."
+)
+
+# Output token cap of one analysis call
+MAX_OUTPUT_TOKENS = 1000
+
+# Rough characters per token, for estimating prompt size before a call
+CHARS_PER_TOKEN = 4
+
+
+def _analysis_prompt(title: str, description: str) -> str:
+    """Prompt asking for the structured analysis of one posting."""
+    return f"""Analyze the following job posting and extract structured information.
+
+Job Title: {title}
+Job Description: {description}
+
+Extract and return a JSON object with the following fields:
+{{
+    "required_skills": ["list", "of", "skills"],
+    "preferred_skills": ["list", "of", "preferred", "skills"],
+    "experience_years": <number or null>,
+    "education_level": "Bachelor's/Master's/PhD/etc or null",
+    "remote_friendly": true/false,
+    "key_responsibilities": ["list", "of", "main", "responsibilities"],
+    "technologies": ["list", "of", "specific", "technologies"],
+    "soft_skills": ["list", "of", "soft", "skills"],
+    "salary_indicators": "any salary information mentioned",
+    "summary": "brief 2-3 sentence summary of the role"
+}}
+
+Return ONLY the JSON object, no other text."""
+
 
 class JobAnalyzer:
-    """AI-powered job analyzer using OpenAI or Anthropic."""
+    """AI-powered job analyzer using OpenAI, Anthropic or an offline fake."""
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: str = "gpt-3.5-turbo",
         provider: Optional[str] = None,
+        provider_options: Optional[Dict[str, Any]] = None,
+        pricing: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize job analyzer.
@@ -23,7 +86,10 @@ class JobAnalyzer:
         Args:
             api_key: API key (OpenAI or Anthropic)
             model: Model to use (gpt-4, gpt-3.5-turbo, claude-3-5-sonnet-20241022, etc.)
-            provider: "openai" or "anthropic" (auto-detected if not specified)
+            provider: "openai", "anthropic" or "fake" (auto-detected if not specified)
+            provider_options: Options for the fake provider (latency_ms,
+                malformed_rate, rate_limit_rate, ...; see FakeProvider)
+            pricing: Per-model price overrides (see estimate_cost)
         """
         # Auto-detect provider if not specified
         if provider is None:
@@ -34,6 +100,15 @@ class JobAnalyzer:
 
         self.provider = provider
         self.model = model
+        self.pricing = pricing
+
+        if self.provider == "fake":
+            # Offline backend for benchmarks and tests; no key needed
+            self.api_key = None
+            self.llm = create_provider("fake", model, options=provider_options)
+            self.client = None
+            logger.info(f"Using fake LLM provider: {model}")
+            return
 
         # Validate that at least one AI provider key is available
         openai_key = api_key if provider == "openai" else os.getenv("OPENAI_API_KEY")
@@ -52,114 +127,104 @@ class JobAnalyzer:
 
         # Initialize the appropriate client
         if self.provider == "anthropic":
-            try:
-                from anthropic import Anthropic
-
-                self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-                self.client = Anthropic(api_key=self.api_key)
-                logger.info(f"Using Anthropic Claude: {model}")
-            except ImportError:
-                logger.error(
-                    "Anthropic package not installed. Install with: pip install anthropic"
-                )
-                raise
+            self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+            self.llm = create_provider("anthropic", model, api_key=self.api_key)
+            logger.info(f"Using Anthropic Claude: {model}")
         else:  # openai
-            try:
-                from openai import OpenAI
+            self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+            self.llm = create_provider("openai", model, api_key=self.api_key)
+            logger.info(f"Using OpenAI: {model}")
 
-                self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-                self.client = OpenAI(api_key=self.api_key)
-                logger.info(f"Using OpenAI: {model}")
-            except ImportError:
-                logger.error("OpenAI package not installed. Install with: pip install openai")
-                raise
+        self.client = self.llm.client
 
-    def analyze_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze_job(
+        self, job: JobRecord, usage: Optional[LLMUsage] = None
+    ) -> Dict[str, Any]:
         """
         Analyze a job posting and extract structured information.
 
         Args:
-            job: Job dictionary with description
+            job: Job with description
+            usage: Accumulator the call's tokens and cost are added to
 
         Returns:
             Dictionary with analyzed information
         """
         try:
-            description = job.get("description", "")
-            title = job.get("title", "")
+            description = job.description or ""
+            title = job.title or ""
 
             if not description:
                 logger.warning(f"No description for job: {title}")
                 return {}
 
-            prompt = f"""Analyze the following job posting and extract structured information.
+            prompt = _analysis_prompt(title, description)
 
-Job Title: {title}
-Job Description: {description}
-
-Extract and return a JSON object with the following fields:
-{{
-    "required_skills": ["list", "of", "skills"],
-    "preferred_skills": ["list", "of", "preferred", "skills"],
-    "experience_years": <number or null>,
-    "education_level": "Bachelor's/Master's/PhD/etc or null",
-    "remote_friendly": true/false,
-    "key_responsibilities": ["list", "of", "main", "responsibilities"],
-    "technologies": ["list", "of", "specific", "technologies"],
-    "soft_skills": ["list", "of", "soft", "skills"],
-    "salary_indicators": "any salary information mentioned",
-    "summary": "brief 2-3 sentence summary of the role"
-}}
-
-Return ONLY the JSON object, no other text."""
-
-            # Call appropriate AI provider
-            if self.provider == "anthropic":
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=1000,
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                response = self.llm.complete(
+                    system=SYSTEM_PROMPT,
+                    prompt=prompt,
+                    max_tokens=MAX_OUTPUT_TOKENS,
                     temperature=0.3,
-                    system="You are a job posting analyzer. Extract structured information from job descriptions and return valid JSON.",
-                    messages=[{"role": "user", "content": prompt}],
                 )
-                result = response.content[0].text
-            else:  # openai
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a job posting analyzer. Extract structured information from job descriptions and return valid JSON.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    temperature=0.3,
-                    max_tokens=1000,
+                outcome = "ok"
+            finally:
+                LLM_SECONDS.labels(self.provider, self.model).observe(
+                    time.perf_counter() - start
                 )
-                result = response.choices[0].message.content
+                LLM_REQUESTS_TOTAL.labels(self.provider, outcome).inc()
 
-            # Parse JSON response
-            try:
-                analysis = json.loads(result)
-                return analysis
-            except json.JSONDecodeError:
-                # Try to extract JSON from markdown code blocks
-                if "```json" in result:
-                    json_str = result.split("```json")[1].split("```")[0].strip()
-                    analysis = json.loads(json_str)
-                    return analysis
-                elif "```" in result:
-                    json_str = result.split("```")[1].split("```")[0].strip()
-                    analysis = json.loads(json_str)
-                    return analysis
-                else:
-                    logger.error(f"Failed to parse JSON response: {result}")
-                    return {}
+            LLM_TOKENS_TOTAL.labels(self.provider, self.model, "input").inc(
+                response.input_tokens
+            )
+            LLM_TOKENS_TOTAL.labels(self.provider, self.model, "output").inc(
+                response.output_tokens
+            )
+
+            cost = estimate_cost(
+                response.model or self.model,
+                response.input_tokens,
+                response.output_tokens,
+                self.pricing,
+            )
+            LLM_COST_TOTAL.labels(self.provider, self.model).inc(cost)
+            if usage is not None:
+                usage.add(response.input_tokens, response.output_tokens, cost)
+            result = response.text
+
+            return self.parse_analysis(result)
 
         except Exception as e:
             logger.error(f"Error analyzing job: {str(e)}")
             return {}
 
+    @staticmethod
+    def parse_analysis(result: str) -> Dict[str, Any]:
+        """
+        Parse the model's JSON answer, tolerating markdown code fences.
+
+        Args:
+            result: Raw model output
+
+        Returns:
+            Parsed analysis, or an empty dict if unparseable
+        """
+        try:
+            return json.loads(result)
+        except json.JSONDecodeError:
+            # Try to extract JSON from markdown code blocks
+            if "```json" in result:
+                json_str = result.split("```json")[1].split("```")[0].strip()
+                return json.loads(json_str)
+            elif "```" in result:
+                json_str = result.split("```")[1].split("```")[0].strip()
+                return json.loads(json_str)
+            else:
+                logger.error(f"Failed to parse JSON response: {result}")
+                return {}
+
     def match_job_to_profile(
         self, job: Dict[str, Any], user_profile: Dict[str, Any]
     ) -> float:
@@ -216,32 +281,73 @@ Return ONLY the JSON object, no other text."""
             logger.error(f"Error matching job to profile: {str(e)}")
             return 0.0
 
+    def max_cost(self, jobs: List[JobRecord]) -> float:
+        """
+        Upper estimate of what analyzing jobs will cost, before any call.
+
+        Assumes every call uses its full output allowance; prompt tokens
+        are estimated from the prompt's length.
+
+        Args:
+            jobs: Jobs to analyze
+
+        Returns:
+            Estimated cost in USD (0.0 for unpriced models)
+        """
+        total = 0.0
+        for job in jobs:
+            if not job.description:
+                continue
+            prompt = SYSTEM_PROMPT + _analysis_prompt(job.title or "", job.description)
+            total += estimate_cost(
+                self.model,
+                len(prompt) // CHARS_PER_TOKEN + 1,
+                MAX_OUTPUT_TOKENS,
+                self.pricing,
+            )
+        return total
+
     def batch_analyze_jobs(
-        self, jobs: List[Dict[str, Any]], max_jobs: int = 50
-    ) -> List[Dict[str, Any]]:
+        self,
+        jobs: List[JobRecord],
+        max_jobs: int = 50,
+        usage: Optional[LLMUsage] = None,
+        budget_usd: Optional[float] = None,
+    ) -> List[JobRecord]:
         """
         Analyze multiple jobs in batch.
 
         Args:
-            jobs: List of job dictionaries
+            jobs: List of jobs (updated in place)
             max_jobs: Maximum number of jobs to analyze
+            usage: Accumulator for tokens and cost of this batch
+            budget_usd: Stop once ``usage`` has cost this much (the call
+                that crosses the limit still completes)
 
         Returns:
             List of jobs with analysis added
         """
         analyzed_jobs = []
+        if usage is None:
+            usage = LLMUsage()
+        total = min(len(jobs), max_jobs)
 
         for i, job in enumerate(jobs[:max_jobs]):
-            logger.info(f"Analyzing job {i+1}/{min(len(jobs), max_jobs)}: {job.get('title')}")
+            if budget_usd is not None and usage.cost_usd >= budget_usd:
+                logger.warning(
+                    f"LLM budget of ${budget_usd:.4f} reached, skipping analysis "
+                    f"of {total - i} job(s)"
+                )
+                break
+
+            logger.debug("Analyzing job %d/%d: %s", i + 1, total, job.title)
 
-            analysis = self.analyze_job(job)
-            job["ai_extracted_skills"] = analysis.get("required_skills", [])
-            job["ai_summary"] = analysis.get("summary", "")
+            analysis = self.analyze_job(job, usage=usage)
+            job.ai_extracted_skills = analysis.get("required_skills", [])
+            job.ai_summary = analysis.get("summary", "")
 
-            # Store full analysis in raw_data if it exists
-            if "raw_data" not in job:
-                job["raw_data"] = {}
-            job["raw_data"]["ai_analysis"] = analysis
+            # Full analysis is archived with the raw payload
+            job.ai_analysis = analysis
 
             analyzed_jobs.append(job)
 
@@ -1,23 +1,128 @@
 """Main job search orchestration agent."""
 
+import math
 import os
+import time
+import uuid
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+from datetime import datetime, timedelta
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 
 from ..scrapers import (
+    BaseScraper,
     IndeedScraper,
     LinkedinScraper,
     GlassdoorScraper,
     MonsterScraper,
     SerpApiScraper,
     AdzunaScraper,
+    JobRecord,
+)
+from ..scrapers.job_record import CORE_FIELDS
+from ..scrapers.adzuna_scraper import (
+    CALLS_PER_MINUTE as ADZUNA_CALLS_PER_MINUTE,
+    MAX_PARALLEL_COUNTRIES,
+)
+from ..scrapers.transport import build_transport
+from ..database import (
+    db,
+    ACTIVE_JOBS,
+    Job,
+    QuotaWindow,
+    SearchHistory,
+    SearchResult,
+    SearchWatermark,
 )
-from ..database import db, Job, SearchHistory
+from ..database import export
+from ..database.payload_store import load_payload, store_payloads
+from ..database.vector_index import VectorIndex
+from ..utils import embeddings, geo, metrics
+from ..utils.salary import SalaryNormalizer
 from .job_analyzer import JobAnalyzer
+from .llm_providers import LLMUsage
 
 logger = logging.getLogger(__name__)
 
+SEARCH_SECONDS = metrics.histogram(
+    "jobsearch_search_seconds", "End-to-end execute_search latency in seconds"
+)
+SCRAPER_SEARCH_SECONDS = metrics.histogram(
+    "jobsearch_scraper_search_seconds",
+    "Per-scraper search latency (all pages, including parsing) in seconds",
+    ["source"],
+)
+SCRAPER_SEARCHES_TOTAL = metrics.counter(
+    "jobsearch_scraper_searches_total",
+    "Per-scraper searches by outcome (ok or error)",
+    ["source", "outcome"],
+)
+SCRAPER_JOBS_TOTAL = metrics.counter(
+    "jobsearch_scraper_jobs_total", "Jobs returned per scraper", ["source"]
+)
+DB_SAVE_SECONDS = metrics.histogram(
+    "jobsearch_db_save_batch_seconds", "Time to save one batch of jobs in seconds"
+)
+DB_JOBS_TOTAL = metrics.counter(
+    "jobsearch_db_jobs_saved_total",
+    "Jobs passed to the database by result (new or existing)",
+    ["result"],
+)
+
+RESPONSE_MODES = ("full", "summary", "ids")
+
+# Maximum number of jobs sent to the AI analyzer per search
+MAX_ANALYZED_JOBS = 50
+
+# Keep IN (...) lists below SQLite's bound-parameter limit
+LOOKUP_CHUNK_SIZE = 500
+
+# quota_windows row locked while reserving LLM budget (one per day)
+BUDGET_LOCK = "llm_budget"
+
+# Recent external_ids remembered per watermark to stop pagination early
+WATERMARK_SEEN_IDS = 1000
+
+# Semantic matches fetched per requested result (inactive jobs are dropped)
+SEMANTIC_OVERFETCH = 2
+
+# Jobs embedded per batch while rebuilding the vector index
+INDEX_BUILD_CHUNK_SIZE = 5000
+
+
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Split a list into consecutive chunks."""
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def _content_hash(job: JobRecord) -> str:
+    """Content hash of a job (see Job.make_content_hash)."""
+    return Job.make_content_hash(job.title, job.company, job.description)
+
+
+def _start_of_day(now: Optional[datetime] = None) -> datetime:
+    """Midnight (UTC) of the given or current day."""
+    now = now or datetime.utcnow()
+    return now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _summarize_job(job: JobRecord, job_id: Optional[int] = None) -> Dict[str, Any]:
+    """Build a compact summary from a job."""
+    return {
+        "id": job_id,
+        "external_id": job.external_id,
+        "source": job.source,
+        "title": job.title,
+        "company": job.company,
+        "location": job.location,
+        "url": job.url,
+        "ai_summary": job.ai_summary,
+        "posted_date": job.posted_date.isoformat() if job.posted_date else None,
+    }
+
 
 class JobSearchAgent:
     """Main orchestration agent for job search."""
@@ -32,10 +137,19 @@ class JobSearchAgent:
         self.config = config or {}
 
         # Initialize scrapers (including FREE alternatives)
+        adzuna_config = self.config.get("scrapers", {}).get("adzuna", {})
         self.scrapers = {
             # FREE scrapers
             "serpapi": SerpApiScraper(),
-            "adzuna": AdzunaScraper(),
+            "adzuna": AdzunaScraper(
+                countries=adzuna_config.get("countries"),
+                max_parallel=adzuna_config.get(
+                    "max_parallel", MAX_PARALLEL_COUNTRIES
+                ),
+                calls_per_minute=adzuna_config.get(
+                    "calls_per_minute", ADZUNA_CALLS_PER_MINUTE
+                ),
+            ),
             # PAID scrapers (RapidAPI)
             "indeed": IndeedScraper(),
             "linkedin": LinkedinScraper(),
@@ -43,28 +157,63 @@ class JobSearchAgent:
             "monster": MonsterScraper(),
         }
 
+        # Route scraper HTTP through a recording/replay/stub transport if set
+        transport_config = self.config.get("scrapers", {}).get("transport")
+        if transport_config:
+            transport = build_transport(transport_config)
+            for scraper in self.scrapers.values():
+                scraper.transport = transport
+
+        # Raw payloads are only needed for the payload store
+        keep_raw = self.config.get("scrapers", {}).get("keep_raw_payloads", True)
+        for scraper in self.scrapers.values():
+            scraper.keep_raw = keep_raw
+
+        # Locations are resolved against an offline gazetteer
+        geo.configure(self.config.get("location", {}).get("gazetteer"))
+
+        # Salaries are stored annualized in one currency for range filters
+        self.salary_normalizer = SalaryNormalizer.from_config(self.config.get("salary"))
+
+        # Semantic search index, updated as jobs are saved (None if disabled)
+        self.vector_index = VectorIndex.from_config(
+            self.config.get("semantic"), db.database_url
+        )
+
         # Initialize AI analyzer with config
         ai_config = self.config.get("ai", {})
         model = ai_config.get("model", "gpt-3.5-turbo")
         provider = ai_config.get("provider")  # Optional, auto-detected
-        self.analyzer = JobAnalyzer(model=model, provider=provider)
+        self.analyzer = JobAnalyzer(
+            model=model,
+            provider=provider,
+            provider_options=ai_config.get("fake"),
+            pricing=ai_config.get("pricing"),
+        )
 
-    def search_all_platforms(
-        self, keywords: str, location: str = "", **kwargs
-    ) -> Dict[str, List[Dict[str, Any]]]:
+        # Spend caps in USD (None = unlimited)
+        budget_config = ai_config.get("budget") or {}
+        self.budget_per_search = budget_config.get("per_search_usd")
+        self.budget_per_day = budget_config.get("per_day_usd")
+
+    def iter_platform_results(
+        self, keywords: str, location: str = "", incremental: bool = False, **kwargs
+    ) -> Iterator[Tuple[str, List[JobRecord]]]:
         """
-        Search all enabled platforms for jobs.
+        Search enabled platforms one at a time.
+
+        Yielding per platform lets callers process and release each batch
+        before the next is fetched.
 
         Args:
             keywords: Job search keywords
             location: Job location
+            incremental: Only fetch postings newer than the stored watermark
             **kwargs: Additional search parameters
 
-        Returns:
-            Dictionary mapping platform name to list of jobs
+        Yields:
+            Tuples of (platform name, list of jobs)
         """
-        results = {}
-
         # Get enabled scrapers from config
         enabled_scrapers = self.config.get("scrapers", {})
 
@@ -72,91 +221,366 @@ class JobSearchAgent:
             scraper_config = enabled_scrapers.get(name, {})
 
             if scraper_config.get("enabled", True):
-                logger.info(f"Searching {name} for '{keywords}' in '{location}'")
+                logger.info("Searching %s for '%s' in '%s'", name, keywords, location)
 
+                start = time.perf_counter()
                 try:
-                    jobs = scraper.search_jobs(keywords, location, **kwargs)
-                    results[name] = jobs
-                    logger.info(f"Found {len(jobs)} jobs on {name}")
+                    if incremental:
+                        since, known_ids = self.load_watermark(keywords, location, name)
+                        jobs = scraper.search_new_jobs(
+                            keywords,
+                            location,
+                            since=since,
+                            known_ids=known_ids,
+                            max_pages=self.config.get("search", {}).get("max_pages", 1),
+                            **kwargs,
+                        )
+                    else:
+                        jobs = scraper.search_jobs(keywords, location, **kwargs)
+                    logger.info("Found %d jobs on %s", len(jobs), name)
+                    outcome = "ok"
                 except Exception as e:
-                    logger.error(f"Error searching {name}: {str(e)}")
-                    results[name] = []
+                    logger.error("Error searching %s: %s", name, e)
+                    jobs = []
+                    outcome = "error"
 
-        return results
+                SCRAPER_SEARCH_SECONDS.labels(name).observe(time.perf_counter() - start)
+                SCRAPER_SEARCHES_TOTAL.labels(name, outcome).inc()
+                SCRAPER_JOBS_TOTAL.labels(name).inc(len(jobs))
+
+                yield name, jobs
 
-    def save_jobs_to_db(self, jobs: List[Dict[str, Any]]) -> int:
+    def search_all_platforms(
+        self, keywords: str, location: str = "", **kwargs
+    ) -> Dict[str, List[JobRecord]]:
+        """
+        Search all enabled platforms for jobs.
+
+        Args:
+            keywords: Job search keywords
+            location: Job location
+            **kwargs: Additional search parameters
+
+        Returns:
+            Dictionary mapping platform name to list of jobs
+        """
+        return dict(self.iter_platform_results(keywords, location, **kwargs))
+
+    def load_watermark(
+        self, keywords: str, location: str, source: str
+    ) -> Tuple[Optional[datetime], List[str]]:
+        """
+        Load the incremental crawl watermark for a query and source.
+
+        Without a stored watermark, ``search.days_back`` bounds the first crawl.
+
+        Args:
+            keywords: Job search keywords
+            location: Job location
+            source: Platform name
+
+        Returns:
+            Tuple of (fetch postings since, recently seen external IDs)
+        """
+        with db.get_session() as session:
+            watermark = (
+                session.query(SearchWatermark)
+                .filter(
+                    SearchWatermark.keywords == keywords,
+                    SearchWatermark.location == (location or ""),
+                    SearchWatermark.source == source,
+                )
+                .first()
+            )
+
+            if watermark and watermark.latest_posted_date:
+                return watermark.latest_posted_date, watermark.seen_ids or []
+
+            seen_ids = (watermark.seen_ids or []) if watermark else []
+
+        days_back = self.config.get("search", {}).get("days_back")
+        since = datetime.utcnow() - timedelta(days=days_back) if days_back else None
+        return since, seen_ids
+
+    def advance_watermark(
+        self, keywords: str, location: str, source: str, jobs: List[JobRecord]
+    ):
+        """
+        Move the watermark past the given (saved) jobs.
+
+        Args:
+            keywords: Job search keywords
+            location: Job location
+            source: Platform name
+            jobs: Jobs fetched for this query and source
+        """
+        if not jobs:
+            return
+
+        posted_dates = [
+            posted for posted in map(BaseScraper.posted_datetime, jobs) if posted
+        ]
+        new_ids = [job.external_id for job in jobs if job.external_id]
+
+        with db.get_write_session() as session:
+            watermark = (
+                session.query(SearchWatermark)
+                .filter(
+                    SearchWatermark.keywords == keywords,
+                    SearchWatermark.location == (location or ""),
+                    SearchWatermark.source == source,
+                )
+                .first()
+            )
+
+            if watermark is None:
+                watermark = SearchWatermark(
+                    keywords=keywords, location=location or "", source=source
+                )
+                session.add(watermark)
+
+            if posted_dates:
+                latest = max(posted_dates)
+                if not watermark.latest_posted_date or latest > watermark.latest_posted_date:
+                    watermark.latest_posted_date = latest
+
+            new_id_set = set(new_ids)
+            watermark.seen_ids = (
+                new_ids + [i for i in watermark.seen_ids or [] if i not in new_id_set]
+            )[:WATERMARK_SEEN_IDS]
+
+    def save_jobs_to_db(self, jobs: List[JobRecord]) -> int:
         """
         Save jobs to database, avoiding duplicates.
 
         Args:
-            jobs: List of job dictionaries
+            jobs: List of jobs
 
         Returns:
             Number of new jobs saved
         """
-        saved_count = 0
+        saved_count = sum(1 for _, _, is_new in self._save_jobs(jobs) if is_new)
 
-        with db.get_session() as session:
-            for job_data in jobs:
-                external_id = job_data.get("external_id")
+        logger.info("Saved %d new jobs to database", saved_count)
+        return saved_count
+
+    def _save_jobs(
+        self, jobs: List[JobRecord], search_id: Optional[str] = None
+    ) -> List[Tuple[str, int, bool]]:
+        """
+        Save jobs and optionally link them to a search.
 
-                if not external_id:
+        Args:
+            jobs: List of jobs
+            search_id: Search to record results for (optional)
+
+        Returns:
+            List of (external_id, job id, is_new) for every distinct job
+            with an external_id
+        """
+        with DB_SAVE_SECONDS.time():
+            results = db.retry_on_conflict(
+                lambda: self._save_jobs_batch(jobs, search_id), "Saving jobs"
+            )
+
+        if self.vector_index is not None:
+            self._index_new_jobs(jobs, results)
+
+        new_count = sum(1 for _, _, is_new in results if is_new)
+        DB_JOBS_TOTAL.labels("new").inc(new_count)
+        DB_JOBS_TOTAL.labels("existing").inc(len(results) - new_count)
+        return results
+
+    def _save_jobs_batch(
+        self, jobs: List[JobRecord], search_id: Optional[str]
+    ) -> List[Tuple[str, int, bool]]:
+        """Insert one batch of jobs in a single write transaction (see _save_jobs)."""
+        with db.get_write_session() as session:
+            external_ids = []
+            for job in jobs:
+                if job.external_id:
+                    external_ids.append(job.external_id)
+                else:
                     logger.warning("Job missing external_id, skipping")
-                    continue
 
-                # Check if job already exists
-                existing_job = (
-                    session.query(Job)
-                    .filter(Job.external_id == external_id)
-                    .first()
+            # Check which jobs already exist in bulk
+            job_ids = {}
+            for chunk in _chunks(list(set(external_ids)), LOOKUP_CHUNK_SIZE):
+                job_ids.update(
+                    session.query(Job.external_id, Job.id).filter(
+                        Job.external_id.in_(chunk)
+                    )
                 )
 
-                if existing_job:
-                    logger.debug(f"Job {external_id} already exists, skipping")
-                    continue
+            new_jobs = {}
+            for job in jobs:
+                external_id = job.external_id
+                if external_id and external_id not in job_ids:
+                    new_jobs.setdefault(external_id, job)
+                    if job.content_hash is None:
+                        job.content_hash = _content_hash(job)
 
+            # Raw payloads go to the compressed store, deduplicated by content
+            payload_hashes = store_payloads(
+                session, [job.payload() for job in new_jobs.values()]
+            )
+
+            new_rows = {}
+            for job, payload_hash in zip(new_jobs.values(), payload_hashes):
                 # Create new job
-                job = Job(
-                    external_id=external_id,
-                    source=job_data.get("source"),
-                    title=job_data.get("title"),
-                    company=job_data.get("company"),
-                    location=job_data.get("location"),
-                    description=job_data.get("description"),
-                    url=job_data.get("url"),
-                    job_type=job_data.get("job_type"),
-                    remote_type=job_data.get("remote_type"),
-                    salary_min=job_data.get("salary_min"),
-                    salary_max=job_data.get("salary_max"),
-                    required_skills=job_data.get("required_skills"),
-                    required_experience_years=job_data.get("required_experience_years"),
-                    education_level=job_data.get("education_level"),
-                    ai_summary=job_data.get("ai_summary"),
-                    ai_extracted_skills=job_data.get("ai_extracted_skills"),
-                    match_score=job_data.get("match_score"),
-                    posted_date=job_data.get("posted_date"),
-                    raw_data=job_data.get("raw_data"),
+                new_rows[job.external_id] = Job(
+                    external_id=job.external_id,
+                    source=job.source,
+                    content_hash=job.content_hash,
+                    title=job.title,
+                    company=job.company,
+                    location=job.location,
+                    description=job.description,
+                    url=job.url,
+                    job_type=job.job_type,
+                    remote_type=job.remote_type,
+                    ai_summary=job.ai_summary,
+                    ai_extracted_skills=job.ai_extracted_skills,
+                    posted_date=job.posted_date,
+                    payload_hash=payload_hash,
+                    **geo.location_columns(job.location, job.country),
+                    **self.salary_normalizer.normalize(
+                        job.salary_min,
+                        job.salary_max,
+                        job.salary_currency,
+                        job.salary_period,
+                    ),
                 )
 
-                session.add(job)
-                saved_count += 1
+            session.add_all(new_rows.values())
+            session.flush()
 
-            session.commit()
+            results = []
+            seen = set()
+            for external_id in external_ids:
+                if external_id in seen:
+                    continue
+                seen.add(external_id)
 
-        logger.info(f"Saved {saved_count} new jobs to database")
-        return saved_count
+                if external_id in new_rows:
+                    results.append((external_id, new_rows[external_id].id, True))
+                else:
+                    logger.debug("Job %s already exists, skipping", external_id)
+                    results.append((external_id, job_ids[external_id], False))
 
-    def save_search_history(
-        self, keywords: str, location: str, source: str, results_count: int, **kwargs
+            if search_id:
+                session.add_all(
+                    SearchResult(search_id=search_id, job_id=job_id, is_new=is_new)
+                    for _, job_id, is_new in results
+                )
+
+        return results
+
+    def _index_new_jobs(
+        self, jobs: List[JobRecord], results: List[Tuple[str, int, bool]]
     ):
-        """Save search history to database."""
+        """Add newly saved jobs to the vector index (failures are only logged)."""
+        by_external_id = {job.external_id: job for job in jobs}
+        ids = []
+        vectors = []
+        for external_id, job_id, is_new in results:
+            if is_new:
+                job = by_external_id[external_id]
+                ids.append(job_id)
+                vectors.append(
+                    embeddings.embed(
+                        job.title, job.description, job.ai_extracted_skills
+                    )
+                )
+
+        try:
+            self.vector_index.add(ids, vectors)
+        except OSError as e:
+            logger.error(
+                "Could not add %d jobs to the vector index "
+                "(rebuild it with --build-index): %s",
+                len(ids),
+                e,
+            )
+
+    def reuse_known_analysis(self, jobs: List[JobRecord]) -> List[JobRecord]:
+        """
+        Copy stored AI analysis onto jobs we have already analyzed.
+
+        Jobs are matched in bulk by external_id, then by content hash (the
+        same posting syndicated under another ID or source).
+
+        Args:
+            jobs: List of jobs (updated in place)
+
+        Returns:
+            Jobs that still need analysis
+        """
+        for job in jobs:
+            job.content_hash = _content_hash(job)
+
+        external_ids = list({job.external_id for job in jobs if job.external_id})
+        content_hashes = list({job.content_hash for job in jobs})
+
+        by_external_id = {}
+        by_content_hash = {}
+        columns = (
+            Job.external_id,
+            Job.content_hash,
+            Job.ai_summary,
+            Job.ai_extracted_skills,
+        )
+
         with db.get_session() as session:
+            for chunk in _chunks(external_ids, LOOKUP_CHUNK_SIZE):
+                for row in session.query(*columns).filter(Job.external_id.in_(chunk)):
+                    by_external_id[row.external_id] = row
+            for chunk in _chunks(content_hashes, LOOKUP_CHUNK_SIZE):
+                for row in session.query(*columns).filter(Job.content_hash.in_(chunk)):
+                    if row.ai_summary or row.ai_extracted_skills:
+                        by_content_hash[row.content_hash] = row
+
+        unseen = []
+        for job in jobs:
+            known = by_external_id.get(job.external_id)
+            if not known or not (known.ai_summary or known.ai_extracted_skills):
+                known = by_content_hash.get(job.content_hash)
+
+            if known:
+                job.ai_summary = known.ai_summary
+                job.ai_extracted_skills = known.ai_extracted_skills
+            else:
+                unseen.append(job)
+
+        logger.info(
+            "Reusing stored analysis for %d/%d jobs", len(jobs) - len(unseen), len(jobs)
+        )
+        return unseen
+
+    def save_search_history(
+        self,
+        keywords: str,
+        location: str,
+        source: str,
+        results_count: int,
+        search_id: Optional[str] = None,
+        usage: Optional[LLMUsage] = None,
+        **kwargs,
+    ):
+        """Save search history (and the AI usage it incurred) to database."""
+        usage = usage or LLMUsage()
+        with db.get_write_session() as session:
             history = SearchHistory(
+                search_id=search_id,
                 keywords=keywords,
                 location=location,
                 source=source,
                 results_count=results_count,
                 parameters=kwargs,
+                llm_calls=usage.calls,
+                llm_input_tokens=usage.input_tokens,
+                llm_output_tokens=usage.output_tokens,
+                llm_cost_usd=usage.cost_usd,
             )
             session.add(history)
             session.commit()
@@ -167,75 +591,655 @@ class JobSearchAgent:
         location: str = "",
         analyze: bool = True,
         save_to_db: bool = True,
+        response_mode: str = "full",
+        page_size: int = 50,
+        incremental: Optional[bool] = None,
         **kwargs,
     ) -> Dict[str, Any]:
         """
         Execute complete job search workflow.
 
+        Platforms are processed one at a time (analyze, save, release), so
+        with ``response_mode`` "summary" or "ids" peak memory is bounded by
+        the largest single platform batch rather than the total found.
+
         Args:
             keywords: Job search keywords
             location: Job location
             analyze: Whether to analyze jobs with AI
             save_to_db: Whether to save results to database
+            response_mode: "full" (every job), "summary" (first page of
+                compact summaries, rest via get_search_results) or "ids"
+                (IDs of newly saved jobs only)
+            page_size: Number of summaries returned in "summary" mode
+            incremental: Only fetch and analyze postings newer than the
+                per-(query, source) watermark (default: search.incremental)
             **kwargs: Additional search parameters
 
         Returns:
             Dictionary with search results and statistics
         """
-        logger.info(f"Starting job search for '{keywords}' in '{location}'")
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(
+                f"Invalid response_mode '{response_mode}', "
+                f"expected one of: {', '.join(RESPONSE_MODES)}"
+            )
 
-        # Search all platforms
-        platform_results = self.search_all_platforms(keywords, location, **kwargs)
+        if incremental is None:
+            incremental = self.config.get("search", {}).get("incremental", False)
 
-        # Combine all jobs
-        all_jobs = []
-        for platform, jobs in platform_results.items():
-            all_jobs.extend(jobs)
+        logger.info("Starting job search for '%s' in '%s'", keywords, location)
 
-        logger.info(f"Total jobs found across all platforms: {len(all_jobs)}")
+        started = time.perf_counter()
+        search_id = uuid.uuid4().hex if save_to_db else None
+        platform_breakdown = {}
+        total_jobs = 0
+        new_jobs_count = 0
+        analyze_budget = MAX_ANALYZED_JOBS
+        response_jobs = []
+        new_job_ids = []
+        search_usage = LLMUsage()
+        usage_by_source = {}
+        budget_exhausted = False
+        spent_today = (
+            self.llm_cost_since(_start_of_day())
+            if analyze and self.budget_per_day is not None
+            else 0.0
+        )
 
-        # Analyze jobs with AI
-        if analyze and all_jobs:
-            logger.info("Analyzing jobs with AI...")
-            all_jobs = self.analyzer.batch_analyze_jobs(all_jobs)
+        for platform, jobs in self.iter_platform_results(
+            keywords, location, incremental=incremental, **kwargs
+        ):
+            platform_breakdown[platform] = len(jobs)
+            total_jobs += len(jobs)
 
-        # Save to database
-        new_jobs_count = 0
-        if save_to_db and all_jobs:
-            new_jobs_count = self.save_jobs_to_db(all_jobs)
+            # Analyze jobs with AI, skipping postings analyzed before
+            platform_usage = LLMUsage()
+            if analyze and jobs:
+                unseen = self.reuse_known_analysis(jobs)
+                remaining_usd = self._remaining_budget(search_usage, spent_today)
+                if unseen and remaining_usd is not None and remaining_usd <= 0:
+                    logger.warning(
+                        "LLM budget exhausted, skipping analysis of %d %s job(s)",
+                        len(unseen),
+                        platform,
+                    )
+                    budget_exhausted = True
+                elif unseen and analyze_budget > 0:
+                    logger.info("Analyzing %s jobs with AI...", platform)
+                    analyzed = self.analyzer.batch_analyze_jobs(
+                        unseen,
+                        max_jobs=analyze_budget,
+                        usage=platform_usage,
+                        budget_usd=remaining_usd,
+                    )
+                    analyze_budget -= len(analyzed)
+                    if remaining_usd is not None and platform_usage.cost_usd >= remaining_usd:
+                        budget_exhausted = True
+
+                search_usage.merge(platform_usage)
+                if platform_usage.calls:
+                    usage_by_source[platform] = platform_usage.to_dict()
+
+            # Save to database
+            saved = []
+            if save_to_db:
+                saved = self._save_jobs(jobs, search_id=search_id)
+                new_jobs_count += sum(1 for _, _, is_new in saved if is_new)
+                new_job_ids.extend(job_id for _, job_id, is_new in saved if is_new)
 
-            # Save search history for each platform
-            for platform, jobs in platform_results.items():
                 self.save_search_history(
                     keywords=keywords,
                     location=location,
                     source=platform,
                     results_count=len(jobs),
+                    search_id=search_id,
+                    usage=platform_usage,
                     **kwargs,
                 )
 
+                if incremental:
+                    self.advance_watermark(keywords, location, platform, jobs)
+
+            # Keep only what the response needs; the batch is released here
+            if response_mode == "full":
+                response_jobs.extend(job.to_dict() for job in jobs)
+            elif response_mode == "summary":
+                saved_ids = {external_id: job_id for external_id, job_id, _ in saved}
+                for job in jobs[: max(page_size - len(response_jobs), 0)]:
+                    response_jobs.append(
+                        _summarize_job(job, saved_ids.get(job.external_id))
+                    )
+
         # Prepare response
         response = {
             "keywords": keywords,
             "location": location,
-            "total_jobs": len(all_jobs),
+            "search_id": search_id,
+            "response_mode": response_mode,
+            "total_jobs": total_jobs,
             "new_jobs_saved": new_jobs_count,
-            "platform_breakdown": {
-                platform: len(jobs) for platform, jobs in platform_results.items()
-            },
-            "jobs": all_jobs,
+            "platform_breakdown": platform_breakdown,
+            "llm_usage": dict(
+                search_usage.to_dict(),
+                by_source=usage_by_source,
+                budget_exhausted=budget_exhausted,
+            ),
             "timestamp": datetime.utcnow().isoformat(),
         }
 
-        logger.info(f"Search complete. Found {len(all_jobs)} jobs, saved {new_jobs_count} new jobs")
+        if response_mode == "ids":
+            response["new_job_ids"] = new_job_ids
+        else:
+            response["jobs"] = response_jobs
+            response["has_more"] = total_jobs > len(response_jobs)
+
+        logger.info(
+            "Search complete. Found %d jobs, saved %d new jobs",
+            total_jobs,
+            new_jobs_count,
+        )
 
+        SEARCH_SECONDS.observe(time.perf_counter() - started)
         return response
 
+    def analyze_saved_jobs(
+        self,
+        job_ids: List[int],
+        keywords: str = "",
+        location: str = "",
+        search_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Analyze stored jobs that have no AI analysis yet.
+
+        Used by queue workers, which save search results first and analyze
+        them in separate tasks. Jobs are rebuilt from their stored columns
+        and raw payload, and the payload is archived again with the analysis
+        attached. Analysis is reused where possible.
+
+        With a per-search or per-day budget, the task first reserves its
+        share of the remaining budget (see _reserve_budget), so concurrent
+        workers cannot all spend the same remainder. Each worker may still
+        overshoot its reservation by the one call in flight when it runs
+        out.
+
+        Args:
+            job_ids: IDs of stored jobs
+            keywords: Search keywords (recorded with the usage)
+            location: Search location (recorded with the usage)
+            search_id: Search the jobs came from
+
+        Returns:
+            Dictionary with counts of jobs analyzed, reused and skipped
+            (already analyzed, missing or over budget), and the usage
+        """
+        jobs = {}
+        with db.get_session() as session:
+            for chunk in _chunks(job_ids, LOOKUP_CHUNK_SIZE):
+                query = session.query(Job).filter(
+                    Job.id.in_(chunk), Job.ai_summary.is_(None)
+                )
+                for row in query:
+                    if row.ai_extracted_skills:
+                        continue
+                    raw_data = load_payload(session, row.payload_hash)
+                    jobs[row.id] = JobRecord(
+                        **{field: getattr(row, field) for field in CORE_FIELDS},
+                        content_hash=row.content_hash,
+                        raw_data=raw_data,
+                    )
+
+        unseen = self.reuse_known_analysis(list(jobs.values())) if jobs else []
+        usage = LLMUsage()
+        analyzed = []
+        reservation_id = None
+        if unseen:
+            budget_usd, reservation_id = self._reserve_budget(
+                keywords, location, search_id, unseen
+            )
+            if budget_usd is not None and budget_usd <= 0:
+                logger.warning(
+                    "LLM budget spent or reserved, skipping analysis of %d job(s)",
+                    len(unseen),
+                )
+            else:
+                try:
+                    analyzed = self.analyzer.batch_analyze_jobs(
+                        unseen,
+                        max_jobs=len(unseen),
+                        usage=usage,
+                        budget_usd=budget_usd,
+                    )
+                finally:
+                    if reservation_id is not None:
+                        self._settle_reservation(reservation_id, usage, analyzed)
+
+        updated = {
+            job_id: job
+            for job_id, job in jobs.items()
+            if job.ai_summary or job.ai_extracted_skills
+        }
+        if updated:
+            db.retry_on_conflict(
+                lambda: self._save_analysis(updated), "Saving analysis"
+            )
+
+            # Skills change the embedding; the newest vector per job wins
+            if self.vector_index is not None:
+                self._index_new_jobs(
+                    list(updated.values()),
+                    [
+                        (job.external_id, job_id, True)
+                        for job_id, job in updated.items()
+                    ],
+                )
+
+        if usage.calls and reservation_id is None:
+            self.save_search_history(
+                keywords=keywords,
+                location=location,
+                source="analysis",
+                results_count=len(analyzed),
+                search_id=search_id,
+                usage=usage,
+            )
+
+        return {
+            "analyzed": len(analyzed),
+            "reused": len(jobs) - len(unseen),
+            "skipped": len(job_ids) - len(updated),
+            "llm_usage": usage.to_dict(),
+        }
+
+    def _save_analysis(self, jobs: Dict[int, JobRecord]):
+        """Store analysis of saved jobs, keyed by job ID (see analyze_saved_jobs)."""
+        now = datetime.utcnow()
+        with db.get_write_session() as session:
+            # Archive the full analysis with the payload, as _save_jobs does
+            analyzed_ids = [job_id for job_id, job in jobs.items() if job.ai_analysis]
+            payload_hashes = dict(
+                zip(
+                    analyzed_ids,
+                    store_payloads(
+                        session,
+                        [jobs[job_id].payload() for job_id in analyzed_ids],
+                    ),
+                )
+            )
+            for job_id, job in jobs.items():
+                values = {
+                    Job.ai_summary: job.ai_summary,
+                    Job.ai_extracted_skills: job.ai_extracted_skills,
+                    Job.updated_date: now,
+                }
+                if job_id in payload_hashes:
+                    values[Job.payload_hash] = payload_hashes[job_id]
+                session.query(Job).filter(Job.id == job_id).update(
+                    values, synchronize_session=False
+                )
+
+    def _reserve_budget(
+        self,
+        keywords: str,
+        location: str,
+        search_id: Optional[str],
+        jobs: List[JobRecord],
+    ) -> Tuple[Optional[float], Optional[int]]:
+        """
+        Reserve LLM budget for analyzing jobs, atomically across workers.
+
+        The reservation is an "analysis" search history row whose cost is
+        the amount reserved, so the usage sums that enforce the budgets
+        count it until _settle_reservation replaces it with the actual
+        usage. Reservations are made one at a time under a lock: SQLite's
+        writer connection already serializes them, other databases lock
+        the day's ``llm_budget`` row in ``quota_windows``.
+
+        A task reserves the most its jobs could cost (JobAnalyzer.max_cost),
+        capped at what is left; the unused part is released when it
+        settles.
+
+        Args:
+            keywords: Search keywords (recorded with the usage)
+            location: Search location (recorded with the usage)
+            search_id: Search the jobs came from
+            jobs: Jobs to analyze
+
+        Returns:
+            Tuple of (USD the task may spend, reservation row ID);
+            (None, None) when no budget is configured, and a non-positive
+            amount with no row when the budget is exhausted
+        """
+        if self.budget_per_search is None and self.budget_per_day is None:
+            return None, None
+
+        today = _start_of_day()
+        max_cost = self.analyzer.max_cost(jobs)
+
+        def reserve() -> Tuple[float, Optional[int]]:
+            with db.get_write_session() as session:
+                lock = (
+                    session.query(QuotaWindow)
+                    .filter(
+                        QuotaWindow.name == BUDGET_LOCK,
+                        QuotaWindow.window_start == today,
+                    )
+                    .with_for_update()
+                    .first()
+                )
+                if lock is None:
+                    session.add(
+                        QuotaWindow(name=BUDGET_LOCK, window_start=today, calls=0)
+                    )
+                    session.query(QuotaWindow).filter(
+                        QuotaWindow.name == BUDGET_LOCK,
+                        QuotaWindow.window_start < today,
+                    ).delete(synchronize_session=False)
+                    session.flush()
+
+                spent_today = (
+                    session.query(func.sum(SearchHistory.llm_cost_usd))
+                    .filter(SearchHistory.search_date >= today)
+                    .scalar()
+                )
+                spent_on_search = 0.0
+                if search_id:
+                    spent_on_search = (
+                        session.query(func.sum(SearchHistory.llm_cost_usd))
+                        .filter(SearchHistory.search_id == search_id)
+                        .scalar()
+                    ) or 0.0
+
+                remaining_usd = self._remaining_budget(
+                    LLMUsage(cost_usd=float(spent_on_search)),
+                    float(spent_today or 0.0),
+                )
+                if remaining_usd <= 0:
+                    return remaining_usd, None
+
+                amount = min(remaining_usd, max_cost)
+                reservation = SearchHistory(
+                    search_id=search_id,
+                    keywords=keywords,
+                    location=location,
+                    source="analysis",
+                    results_count=0,
+                    parameters={"reserved_usd": amount},
+                    llm_calls=0,
+                    llm_input_tokens=0,
+                    llm_output_tokens=0,
+                    llm_cost_usd=amount,
+                )
+                session.add(reservation)
+                session.flush()
+                # Unpriced models cost nothing as far as the budget can tell
+                return (amount if max_cost > 0 else remaining_usd), reservation.id
+
+        try:
+            return reserve()
+        except IntegrityError:
+            # Another worker created today's lock row first
+            return reserve()
+
+    def _settle_reservation(
+        self, reservation_id: int, usage: LLMUsage, analyzed: List[JobRecord]
+    ):
+        """Replace a budget reservation with the usage it covered."""
+        with db.get_write_session() as session:
+            query = session.query(SearchHistory).filter(
+                SearchHistory.id == reservation_id
+            )
+            if not usage.calls:
+                query.delete(synchronize_session=False)
+                return
+            query.update(
+                {
+                    SearchHistory.results_count: len(analyzed),
+                    SearchHistory.llm_calls: usage.calls,
+                    SearchHistory.llm_input_tokens: usage.input_tokens,
+                    SearchHistory.llm_output_tokens: usage.output_tokens,
+                    SearchHistory.llm_cost_usd: usage.cost_usd,
+                },
+                synchronize_session=False,
+            )
+
+    def _remaining_budget(
+        self, search_usage: LLMUsage, spent_today: float
+    ) -> Optional[float]:
+        """USD left under the per-search and per-day caps (None = unlimited)."""
+        limits = []
+        if self.budget_per_search is not None:
+            limits.append(self.budget_per_search - search_usage.cost_usd)
+        if self.budget_per_day is not None:
+            limits.append(self.budget_per_day - spent_today - search_usage.cost_usd)
+        return min(limits) if limits else None
+
+    def llm_cost_since(self, since: datetime) -> float:
+        """
+        Total recorded AI cost since a point in time.
+
+        Args:
+            since: Start time (naive UTC)
+
+        Returns:
+            Cost in USD
+        """
+        with db.get_session() as session:
+            total = (
+                session.query(func.sum(SearchHistory.llm_cost_usd))
+                .filter(SearchHistory.search_date >= since)
+                .scalar()
+            )
+        return float(total or 0.0)
+
+    def get_llm_usage(self, days: int = 30) -> Dict[str, Any]:
+        """
+        Aggregate recorded AI usage.
+
+        Args:
+            days: Number of days (including today) to report
+
+        Returns:
+            Dictionary with today's totals, per-day and per-source breakdowns
+            over the period, and the configured budgets
+        """
+        today = _start_of_day()
+        since = today - timedelta(days=days - 1)
+        totals = (
+            func.count(func.distinct(SearchHistory.search_id)),
+            func.sum(SearchHistory.llm_calls),
+            func.sum(SearchHistory.llm_input_tokens),
+            func.sum(SearchHistory.llm_output_tokens),
+            func.sum(SearchHistory.llm_cost_usd),
+        )
+
+        def usage_row(row) -> Dict[str, Any]:
+            searches, calls, input_tokens, output_tokens, cost = row
+            return {
+                "searches": searches or 0,
+                "calls": calls or 0,
+                "input_tokens": input_tokens or 0,
+                "output_tokens": output_tokens or 0,
+                "cost_usd": round(cost or 0.0, 6),
+            }
+
+        with db.get_session() as session:
+            period = session.query(SearchHistory).filter(
+                SearchHistory.search_date >= since
+            )
+            day = func.date(SearchHistory.search_date)
+
+            by_day = [
+                dict(usage_row(row[1:]), date=str(row[0]))
+                for row in period.with_entities(day, *totals)
+                .group_by(day)
+                .order_by(day.desc())
+            ]
+            by_source = {
+                row[0]: usage_row(row[1:])
+                for row in period.with_entities(SearchHistory.source, *totals)
+                .group_by(SearchHistory.source)
+                if row[0]
+            }
+            today_usage = usage_row(
+                period.filter(SearchHistory.search_date >= today)
+                .with_entities(*totals)
+                .one()
+            )
+
+        remaining_today = None
+        if self.budget_per_day is not None:
+            remaining_today = round(
+                max(self.budget_per_day - today_usage["cost_usd"], 0.0), 6
+            )
+
+        return {
+            "today": today_usage,
+            "days": days,
+            "by_day": by_day,
+            "by_source": by_source,
+            "budget": {
+                "per_search_usd": self.budget_per_search,
+                "per_day_usd": self.budget_per_day,
+                "remaining_today_usd": remaining_today,
+            },
+        }
+
+    def get_search_results(
+        self,
+        search_id: str,
+        page: int = 1,
+        per_page: int = 50,
+        view: str = "summary",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Page through the jobs recorded for a search.
+
+        Args:
+            search_id: ID returned by execute_search
+            page: Page number (1-based)
+            per_page: Jobs per page
+            view: "summary" for compact jobs or "full" for complete jobs
+
+        Returns:
+            Dictionary with paging info and jobs (an empty page for a search
+            that found nothing), or None if there is no such search
+        """
+        page = max(page, 1)
+
+        with db.get_session() as session:
+            query = session.query(SearchResult).filter(
+                SearchResult.search_id == search_id
+            )
+            total = query.count()
+            if total == 0:
+                searched = (
+                    session.query(SearchHistory.id)
+                    .filter(SearchHistory.search_id == search_id)
+                    .first()
+                )
+                if searched is None:
+                    return None
+
+            rows = (
+                session.query(Job, SearchResult.is_new)
+                .join(SearchResult, SearchResult.job_id == Job.id)
+                .filter(SearchResult.search_id == search_id)
+                .order_by(SearchResult.id)
+                .offset((page - 1) * per_page)
+                .limit(per_page)
+                .all()
+            )
+
+            jobs = []
+            for job, is_new in rows:
+                job_dict = job.to_dict() if view == "full" else job.to_summary()
+                job_dict["is_new"] = is_new
+                jobs.append(job_dict)
+
+        return {
+            "search_id": search_id,
+            "page": page,
+            "per_page": per_page,
+            "total": total,
+            "has_more": page * per_page < total,
+            "jobs": jobs,
+        }
+
+    def _jobs_query(
+        self,
+        session,
+        source: Optional[str] = None,
+        keywords: Optional[str] = None,
+        posted_since: Optional[datetime] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        near: Optional[Tuple[float, float]] = None,
+        radius_km: float = geo.DEFAULT_RADIUS_KM,
+    ):
+        """Build the filtered, ordered query behind get_jobs_from_db."""
+        query = session.query(Job).filter(ACTIVE_JOBS)
+
+        if source:
+            query = query.filter(Job.source == source)
+
+        if keywords:
+            query = query.filter(
+                (Job.title.ilike(f"%{keywords}%"))
+                | (Job.description.ilike(f"%{keywords}%"))
+            )
+
+        # Salary ranges overlap the requested range; each bound is a range
+        # scan on its annual salary index
+        if min_salary is not None:
+            query = query.filter(Job.annual_salary_max >= min_salary)
+        if max_salary is not None:
+            query = query.filter(Job.annual_salary_min <= max_salary)
+
+        if near is not None:
+            # Bounding box is a range scan on the (latitude, longitude) index;
+            # the circle test is equirectangular distance in plain arithmetic
+            # so it runs in SQL on every backend
+            latitude, longitude = near
+            min_lat, max_lat, min_lon, max_lon = geo.bounding_box(
+                latitude, longitude, radius_km
+            )
+            dlat = Job.latitude - latitude
+            dlon = (Job.longitude - longitude) * math.cos(math.radians(latitude))
+            query = query.filter(
+                Job.latitude.between(min_lat, max_lat),
+                Job.longitude.between(min_lon, max_lon),
+                dlat * dlat + dlon * dlon <= (radius_km / geo.KM_PER_DEGREE) ** 2,
+            )
+
+        if posted_since:
+            # Range scan on the posted_date index, newest first
+            return query.filter(Job.posted_date >= posted_since).order_by(
+                Job.posted_date.desc()
+            )
+
+        newest_first = Job.scraped_date
+        if min_salary is not None or max_salary is not None or near is not None:
+            # Without this SQLite plans "SCAN jobs USING INDEX
+            # ix_jobs_active_scraped_date": it walks every active row in
+            # order and tests the range on each, which is linear in the table
+            # for selective ranges. With the ordering index ruled out it
+            # range-scans the salary or (latitude, longitude) index and sorts
+            # only the matches.
+            newest_first = db.unindexed(Job.scraped_date)
+        return query.order_by(newest_first.desc())
+
     def get_jobs_from_db(
         self,
         limit: int = 100,
         source: Optional[str] = None,
         keywords: Optional[str] = None,
+        posted_since: Optional[datetime] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        near: Optional[Tuple[float, float]] = None,
+        radius_km: float = geo.DEFAULT_RADIUS_KM,
     ) -> List[Dict[str, Any]]:
         """
         Retrieve jobs from database.
@@ -244,22 +1248,204 @@ class JobSearchAgent:
             limit: Maximum number of jobs to return
             source: Filter by source platform
             keywords: Filter by keywords in title or description
+            posted_since: Only jobs posted at or after this time (naive UTC);
+                results are then ordered newest posting first
+            min_salary: Only jobs whose annual salary range reaches this
+                amount (base currency)
+            max_salary: Only jobs whose annual salary range starts at or
+                below this amount (base currency)
+            near: (latitude, longitude) to search around; results then
+                include distance_km
+            radius_km: Search radius around ``near``
 
         Returns:
             List of job dictionaries
         """
         with db.get_session() as session:
-            query = session.query(Job).filter(Job.is_active == True)
+            query = self._jobs_query(
+                session,
+                source,
+                keywords,
+                posted_since,
+                min_salary,
+                max_salary,
+                near,
+                radius_km,
+            )
+            jobs = query.limit(limit).all()
+
+            results = [job.to_dict() for job in jobs]
+            if near is not None:
+                for job in results:
+                    job["distance_km"] = round(
+                        geo.haversine_km(*near, job["latitude"], job["longitude"]), 1
+                    )
+            return results
+
+    def iter_job_rows(
+        self,
+        limit: Optional[int] = None,
+        chunk_size: int = export.EXPORT_CHUNK_SIZE,
+        **filters,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream stored jobs as chunks of row dictionaries (for exports).
+
+        Rows are read with a server-side cursor, so memory use is bounded by
+        the chunk size rather than the number of jobs.
+
+        Args:
+            limit: Maximum number of jobs (None for all)
+            chunk_size: Rows per chunk
+            **filters: get_jobs_from_db filters (source, keywords, ...)
+
+        Yields:
+            Lists of {column: value} dictionaries
+        """
+        with db.get_session() as session:
+            query = self._jobs_query(session, **filters)
+            if limit:
+                query = query.limit(limit)
+            yield from export.iter_row_chunks(query, chunk_size)
 
-            if source:
-                query = query.filter(Job.source == source)
+    def explain_jobs_query(self, **filters) -> List[str]:
+        """
+        Database query plan for a get_jobs_from_db call.
 
-            if keywords:
-                query = query.filter(
-                    (Job.title.ilike(f"%{keywords}%"))
-                    | (Job.description.ilike(f"%{keywords}%"))
+        Args:
+            **filters: get_jobs_from_db filters (source, keywords, ...)
+
+        Returns:
+            Plan lines as reported by the database
+        """
+        with db.get_session() as session:
+            return db.explain(session, self._jobs_query(session, **filters))
+
+    def _semantic_results(
+        self, vector, limit: int, exclude: Tuple[int, ...] = ()
+    ) -> List[Dict[str, Any]]:
+        """Active jobs nearest to a vector, with similarity scores."""
+        if self.vector_index is None:
+            raise RuntimeError(
+                "Semantic search is disabled (set semantic.enabled and install numpy)"
+            )
+
+        hits = self.vector_index.search(
+            vector, k=limit * SEMANTIC_OVERFETCH, exclude=exclude
+        )
+        scores = dict(hits)
+        with db.get_session() as session:
+            jobs = {
+                job.id: job
+                for job in session.query(Job).filter(
+                    Job.id.in_(list(scores)), ACTIVE_JOBS
                 )
+            }
+            results = []
+            for job_id, score in hits:
+                if job_id in jobs:
+                    results.append(dict(jobs[job_id].to_dict(), score=round(score, 4)))
+                    if len(results) >= limit:
+                        break
+            return results
+
+    def semantic_search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Find active jobs related to a free-text query, by meaning rather
+        than exact keywords.
+
+        Args:
+            query: Query text ("backend python developer")
+            limit: Maximum number of jobs
+
+        Returns:
+            Job dictionaries with a ``score`` (cosine similarity), best first
+
+        Raises:
+            RuntimeError: If semantic search is disabled
+        """
+        return self._semantic_results(embeddings.embed_query(query), limit)
+
+    def similar_jobs(
+        self, job_id: int, limit: int = 10
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find active jobs similar to a stored job.
+
+        Args:
+            job_id: Job ID
+            limit: Maximum number of jobs
+
+        Returns:
+            Job dictionaries with a ``score``, best first (the job itself is
+            excluded), or None if the job does not exist
+
+        Raises:
+            RuntimeError: If semantic search is disabled
+        """
+        with db.get_session() as session:
+            job = session.query(Job).filter(Job.id == job_id).first()
+            if job is None:
+                return None
+            vector = embeddings.embed(
+                job.title,
+                job.description,
+                job.ai_extracted_skills or job.required_skills,
+            )
+        return self._semantic_results(vector, limit, exclude=(job_id,))
+
+    def build_vector_index(self, chunk_size: int = INDEX_BUILD_CHUNK_SIZE) -> int:
+        """
+        Rebuild the vector index from every stored job.
+
+        Needed once for jobs saved before semantic search was enabled and
+        after bulk imports; saves keep the index current otherwise.
+
+        Args:
+            chunk_size: Jobs embedded per batch
+
+        Returns:
+            Number of jobs indexed
+
+        Raises:
+            RuntimeError: If semantic search is disabled
+        """
+        if self.vector_index is None:
+            raise RuntimeError(
+                "Semantic search is disabled (set semantic.enabled and install numpy)"
+            )
+
+        def batches():
+            with db.get_session() as session:
+                query = session.query(
+                    Job.id,
+                    Job.title,
+                    Job.description,
+                    Job.ai_extracted_skills,
+                    Job.required_skills,
+                ).order_by(Job.id)
 
-            jobs = query.order_by(Job.scraped_date.desc()).limit(limit).all()
+                ids = []
+                vectors = []
+                embedded = 0
+                for row in query.yield_per(chunk_size):
+                    ids.append(row.id)
+                    vectors.append(
+                        embeddings.embed(
+                            row.title,
+                            row.description,
+                            row.ai_extracted_skills or row.required_skills,
+                        )
+                    )
+                    if len(ids) >= chunk_size:
+                        embedded += len(ids)
+                        logger.info("Embedded %d jobs", embedded)
+                        yield ids, vectors
+                        ids = []
+                        vectors = []
+                if ids:
+                    yield ids, vectors
 
-            return [job.to_dict() for job in jobs]
+        count = self.vector_index.rebuild(batches())
+        logger.info("Vector index rebuilt with %d jobs", count)
+        return count
@@ -0,0 +1,275 @@
+"""Posting liveness sweeper that keeps ``Job.is_active`` current."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import zip_longest
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from sqlalchemy import func, or_
+
+from ..database import db, ACTIVE_JOBS, Job
+from ..scrapers.transport import build_transport
+from ..utils import metrics
+from ..utils.rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+LIVENESS_CHECKS_TOTAL = metrics.counter(
+    "jobsearch_liveness_checks_total",
+    "Posting URL liveness checks by outcome (alive, dead or unknown)",
+    ["outcome"],
+)
+JOBS_DEACTIVATED_TOTAL = metrics.counter(
+    "jobsearch_jobs_deactivated_total",
+    "Jobs flagged inactive by reason (dead or expired)",
+    ["reason"],
+)
+
+# Statuses meaning the posting is gone. Anything else that isn't a success
+# (rate limiting, 405 for HEAD, server errors) leaves the job active.
+DEAD_STATUSES = {404, 410}
+
+# Job IDs per UPDATE ... WHERE id IN (...)
+UPDATE_CHUNK_SIZE = 500
+
+
+class LivenessSweeper:
+    """
+    Check posting URLs and flag dead or expired jobs inactive.
+
+    Each run first expires active jobs older than ``max_age_days`` in one
+    UPDATE, then HEAD-checks up to ``batch_size`` active jobs not checked
+    within ``recheck_hours``, oldest postings first. Checks run concurrently,
+    interleaved across hosts and rate limited per host, and their outcomes
+    are written back in a few batched UPDATEs.
+
+    Only 404 and 410 responses deactivate a job; errors and other statuses
+    count as unknown, and the job is re-checked after ``recheck_hours``.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, transport=None):
+        """
+        Initialize liveness sweeper.
+
+        Args:
+            config: Configuration dictionary
+            transport: HTTP transport (default: built from scrapers.transport)
+        """
+        self.config = config or {}
+        liveness_config = self.config.get("liveness", {})
+
+        self.batch_size = liveness_config.get("batch_size", 500)
+        self.max_parallel = liveness_config.get("max_parallel", 16)
+        self.per_host_rate = liveness_config.get("per_host_rate", 1.0)
+        self.recheck_interval = timedelta(
+            hours=liveness_config.get("recheck_hours", 24)
+        )
+        max_age_days = liveness_config.get("max_age_days", 60)
+        self.max_age = timedelta(days=max_age_days) if max_age_days else None
+        self.timeout = liveness_config.get("timeout_seconds", 10)
+
+        self.transport = transport or build_transport(
+            self.config.get("scrapers", {}).get("transport")
+        )
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._limiters_lock = threading.Lock()
+
+    def _limiter(self, host: str) -> RateLimiter:
+        """Rate limiter shared by all checks against one host."""
+        with self._limiters_lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = RateLimiter(self.per_host_rate, 1.0, burst=1)
+                self._limiters[host] = limiter
+            return limiter
+
+    def expire_old_jobs(self, now: datetime) -> int:
+        """
+        Flag active jobs older than ``max_age`` inactive without checking them.
+
+        Args:
+            now: Reference time (naive UTC)
+
+        Returns:
+            Number of jobs expired
+        """
+        if self.max_age is None:
+            return 0
+
+        age = func.coalesce(Job.posted_date, Job.scraped_date)
+        with db.get_write_session() as session:
+            expired = (
+                session.query(Job)
+                .filter(ACTIVE_JOBS, age < now - self.max_age)
+                .update(
+                    {Job.is_active: False, Job.updated_date: now},
+                    synchronize_session=False,
+                )
+            )
+
+        JOBS_DEACTIVATED_TOTAL.labels("expired").inc(expired)
+        return expired
+
+    def due_jobs(self, now: datetime) -> List[Tuple[int, str]]:
+        """
+        Active jobs due for a check, oldest postings first.
+
+        Args:
+            now: Reference time (naive UTC)
+
+        Returns:
+            Up to ``batch_size`` (job id, url) pairs
+        """
+        with db.get_session() as session:
+            return [
+                tuple(row)
+                for row in session.query(Job.id, Job.url)
+                .filter(
+                    ACTIVE_JOBS,
+                    Job.url.isnot(None),
+                    Job.url != "",
+                    or_(
+                        Job.last_checked_date.is_(None),
+                        Job.last_checked_date < now - self.recheck_interval,
+                    ),
+                )
+                .order_by(func.coalesce(Job.posted_date, Job.scraped_date), Job.id)
+                .limit(self.batch_size)
+            ]
+
+    @staticmethod
+    def interleave_hosts(jobs: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+        """
+        Reorder jobs round-robin across hosts, keeping age order per host.
+
+        Concurrent workers then wait on different hosts' rate limits instead
+        of queueing behind one busy host.
+
+        Args:
+            jobs: (job id, url) pairs in priority order
+
+        Returns:
+            The same pairs, interleaved by host
+        """
+        by_host: Dict[str, List[Tuple[int, str]]] = {}
+        for job in jobs:
+            by_host.setdefault(urlsplit(job[1]).netloc.lower(), []).append(job)
+        return [
+            job
+            for round_ in zip_longest(*by_host.values())
+            for job in round_
+            if job is not None
+        ]
+
+    def check_url(self, url: str) -> Optional[bool]:
+        """
+        HEAD-check one posting URL, respecting its host's rate limit.
+
+        Args:
+            url: Posting URL
+
+        Returns:
+            True if the posting is live, False if it is gone, None if the
+            check was inconclusive
+        """
+        self._limiter(urlsplit(url).netloc.lower()).acquire()
+        try:
+            response = self.transport.head(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.debug("Liveness check of %s failed: %s", url, e)
+            return None
+
+        if response.status_code in DEAD_STATUSES:
+            return False
+        if response.status_code < 400:
+            return True
+        return None
+
+    def _record_results(self, checked: List[int], dead: List[int], now: datetime):
+        """Write check times and dead postings in batched UPDATEs."""
+        with db.get_write_session() as session:
+            for start in range(0, len(checked), UPDATE_CHUNK_SIZE):
+                session.query(Job).filter(
+                    Job.id.in_(checked[start:start + UPDATE_CHUNK_SIZE])
+                ).update({Job.last_checked_date: now}, synchronize_session=False)
+
+            for start in range(0, len(dead), UPDATE_CHUNK_SIZE):
+                session.query(Job).filter(
+                    Job.id.in_(dead[start:start + UPDATE_CHUNK_SIZE])
+                ).update(
+                    {Job.is_active: False, Job.updated_date: now},
+                    synchronize_session=False,
+                )
+
+    def run_once(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Expire old jobs, then check one batch of due jobs.
+
+        Args:
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            Counts of expired, checked, alive, dead and unknown jobs
+        """
+        now = now or datetime.utcnow()
+        expired = self.expire_old_jobs(now)
+        jobs = self.interleave_hosts(self.due_jobs(now))
+
+        outcomes = []
+        if jobs:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_parallel, len(jobs)),
+                thread_name_prefix="liveness",
+            ) as executor:
+                outcomes = list(executor.map(self.check_url, [url for _, url in jobs]))
+
+        dead = [job_id for (job_id, _), alive in zip(jobs, outcomes) if alive is False]
+        self._record_results([job_id for job_id, _ in jobs], dead, now)
+
+        counts = {
+            "expired": expired,
+            "checked": len(jobs),
+            "alive": sum(1 for alive in outcomes if alive),
+            "dead": len(dead),
+            "unknown": sum(1 for alive in outcomes if alive is None),
+        }
+        for outcome in ("alive", "dead", "unknown"):
+            LIVENESS_CHECKS_TOTAL.labels(outcome).inc(counts[outcome])
+        JOBS_DEACTIVATED_TOTAL.labels("dead").inc(len(dead))
+
+        logger.info(
+            "Liveness: %d checked, %d dead, %d unknown, %d expired",
+            counts["checked"],
+            counts["dead"],
+            counts["unknown"],
+            expired,
+        )
+        return counts
+
+    def run_forever(self, poll_seconds: int = 300):
+        """
+        Run the sweeper loop until interrupted.
+
+        Full batches are followed by the next batch straight away; the loop
+        only sleeps once it has caught up.
+
+        Args:
+            poll_seconds: Seconds to sleep when no full batch was due
+        """
+        logger.info(
+            f"Liveness sweeper started: {self.batch_size} jobs per batch, "
+            f"{self.max_parallel} at a time, {self.per_host_rate}/s per host"
+        )
+
+        try:
+            while True:
+                counts = self.run_once()
+                if counts["checked"] < self.batch_size:
+                    time.sleep(poll_seconds)
+        except KeyboardInterrupt:
+            logger.info("Liveness sweeper stopped")
@@ -0,0 +1,369 @@
+"""LLM provider backends used by the job analyzer."""
+
+import json
+import logging
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# USD per million (input, output) tokens; the longest matching model-name
+# prefix wins, so dated model names resolve to their family. Override or
+# extend with ai.pricing in config.yaml.
+MODEL_PRICING = {
+    "gpt-3.5-turbo": (0.50, 1.50),
+    "gpt-4": (30.00, 60.00),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "claude-3-haiku": (0.25, 1.25),
+    "claude-3-5-haiku": (0.80, 4.00),
+    "claude-3-5-sonnet": (3.00, 15.00),
+    "claude-3-opus": (15.00, 75.00),
+    "fake": (0.0, 0.0),
+}
+
+_unpriced_models = set()
+
+
+@dataclass
+class LLMResponse:
+    """Text and token usage returned by a provider."""
+
+    text: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    model: str = ""
+
+
+@dataclass
+class LLMUsage:
+    """Accumulated LLM calls, tokens and estimated cost."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+
+    def add(self, input_tokens: int, output_tokens: int, cost_usd: float):
+        """Record one call."""
+        self.calls += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.cost_usd += cost_usd
+
+    def merge(self, other: "LLMUsage"):
+        """Add another accumulator's totals to this one."""
+        self.calls += other.calls
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cost_usd += other.cost_usd
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert usage to dictionary."""
+        usage = asdict(self)
+        usage["cost_usd"] = round(self.cost_usd, 6)
+        return usage
+
+
+def estimate_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    pricing: Optional[Dict[str, Any]] = None,
+) -> float:
+    """
+    Estimate the USD cost of a call.
+
+    Args:
+        model: Model name
+        input_tokens: Prompt tokens
+        output_tokens: Completion tokens
+        pricing: Overrides keyed by model prefix, each with
+            ``input_per_million`` and ``output_per_million``
+
+    Returns:
+        Estimated cost (0.0 for unknown models)
+    """
+    prices = dict(MODEL_PRICING)
+    for name, price in (pricing or {}).items():
+        prices[name] = (
+            float(price.get("input_per_million", 0)),
+            float(price.get("output_per_million", 0)),
+        )
+
+    matches = [name for name in prices if model.startswith(name)]
+    if not matches:
+        if model not in _unpriced_models:
+            _unpriced_models.add(model)
+            logger.warning(f"No pricing for model '{model}'; cost counted as 0")
+        return 0.0
+
+    input_price, output_price = prices[max(matches, key=len)]
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+class RateLimitError(Exception):
+    """Raised when a provider rejects a call for exceeding its rate limit."""
+
+
+class LLMProvider(ABC):
+    """Abstract base class for LLM providers."""
+
+    name = ""
+
+    def __init__(self, model: str):
+        """Initialize provider for a model."""
+        self.model = model
+
+    @abstractmethod
+    def complete(
+        self,
+        system: str,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.3,
+    ) -> LLMResponse:
+        """
+        Run a single completion.
+
+        Args:
+            system: System prompt
+            prompt: User prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+
+        Returns:
+            LLMResponse with text and token usage
+        """
+        pass
+
+
+class OpenAIProvider(LLMProvider):
+    """OpenAI chat completions."""
+
+    name = "openai"
+
+    def __init__(self, model: str, api_key: str):
+        """Initialize OpenAI client."""
+        super().__init__(model)
+        try:
+            from openai import OpenAI
+        except ImportError:
+            logger.error("OpenAI package not installed. Install with: pip install openai")
+            raise
+
+        self.client = OpenAI(api_key=api_key)
+
+    def complete(self, system, prompt, max_tokens=1000, temperature=0.3):
+        """Run a chat completion."""
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        usage = getattr(response, "usage", None)
+        return LLMResponse(
+            text=response.choices[0].message.content,
+            input_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            output_tokens=getattr(usage, "completion_tokens", 0) or 0,
+            model=self.model,
+        )
+
+
+class AnthropicProvider(LLMProvider):
+    """Anthropic messages API."""
+
+    name = "anthropic"
+
+    def __init__(self, model: str, api_key: str):
+        """Initialize Anthropic client."""
+        super().__init__(model)
+        try:
+            from anthropic import Anthropic
+        except ImportError:
+            logger.error(
+                "Anthropic package not installed. Install with: pip install anthropic"
+            )
+            raise
+
+        self.client = Anthropic(api_key=api_key)
+
+    def complete(self, system, prompt, max_tokens=1000, temperature=0.3):
+        """Run a messages call."""
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        usage = getattr(response, "usage", None)
+        return LLMResponse(
+            text=response.content[0].text,
+            input_tokens=getattr(usage, "input_tokens", 0) or 0,
+            output_tokens=getattr(usage, "output_tokens", 0) or 0,
+            model=self.model,
+        )
+
+
+# Vocabulary the fake provider "extracts" from job text
+FAKE_SKILLS = [
+    "Python",
+    "Java",
+    "Go",
+    "SQL",
+    "AWS",
+    "GCP",
+    "Azure",
+    "Docker",
+    "Kubernetes",
+    "React",
+    "Spark",
+    "Terraform",
+    "PostgreSQL",
+    "Django",
+    "Flask",
+    "Machine Learning",
+]
+
+
+class FakeProvider(LLMProvider):
+    """
+    Offline provider returning schema-valid analysis JSON.
+
+    Output is deterministic for a given prompt and seed. Latency, token
+    counts, malformed output and rate-limit errors are configurable so
+    analyzer changes can be benchmarked without network access.
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        model: str = "fake",
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        output_tokens: int = 250,
+        malformed_rate: float = 0.0,
+        code_fence_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Initialize fake provider.
+
+        Args:
+            model: Model name reported in responses
+            latency_ms: Mean simulated latency per call
+            jitter_ms: Uniform +/- jitter around the latency
+            output_tokens: Reported completion tokens per call
+            malformed_rate: Fraction of calls returning unparseable text
+            code_fence_rate: Fraction of calls wrapping JSON in ```json fences
+            rate_limit_rate: Fraction of calls raising RateLimitError
+            seed: Random seed for latency and failure injection
+        """
+        super().__init__(model)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.output_tokens = output_tokens
+        self.malformed_rate = malformed_rate
+        self.code_fence_rate = code_fence_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.calls = 0
+
+    def complete(self, system, prompt, max_tokens=1000, temperature=0.3):
+        """Return a synthetic analysis for the prompt."""
+        with self.rng_lock:
+            self.calls += 1
+            delay = self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)
+            rate_limited = self.rng.random() < self.rate_limit_rate
+            malformed = self.rng.random() < self.malformed_rate
+            fenced = self.rng.random() < self.code_fence_rate
+
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+        if rate_limited:
+            raise RateLimitError("Fake provider rate limit exceeded")
+
+        input_tokens = (len(system) + len(prompt)) // 4
+        output_tokens = min(self.output_tokens, max_tokens)
+
+        if malformed:
+            return LLMResponse(
+                text="Sorry, I could not analyze this posting {",
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                model=self.model,
+            )
+
+        text = json.dumps(self._analysis(prompt))
+        if fenced:
+            text = f"Here is the analysis:\n```json\n{text}\n```"
+
+        return LLMResponse(
+            text=text,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model=self.model,
+        )
+
+    def _analysis(self, prompt: str) -> Dict[str, Any]:
+        """Build a schema-valid analysis from the prompt text."""
+        lowered = prompt.lower()
+        skills = [skill for skill in FAKE_SKILLS if skill.lower() in lowered]
+        years = re.search(r"(\d+)\+?\s*years", lowered)
+        title = re.search(r"Job Title:\s*(.*)", prompt)
+
+        return {
+            "required_skills": skills[:6],
+            "preferred_skills": skills[6:],
+            "experience_years": int(years.group(1)) if years else None,
+            "education_level": "Bachelor's" if "degree" in lowered else None,
+            "remote_friendly": "remote" in lowered,
+            "key_responsibilities": ["Build and maintain services"],
+            "technologies": skills,
+            "soft_skills": ["Communication"],
+            "salary_indicators": "",
+            "summary": f"{title.group(1).strip() if title else 'Role'} requiring "
+            f"{', '.join(skills[:3]) or 'general skills'}.",
+        }
+
+
+def create_provider(
+    provider: str,
+    model: str,
+    api_key: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+) -> LLMProvider:
+    """
+    Create an LLM provider by name.
+
+    Args:
+        provider: "openai", "anthropic" or "fake"
+        model: Model name
+        api_key: API key for real providers
+        options: Extra keyword arguments for the provider (fake only)
+
+    Returns:
+        LLMProvider instance
+    """
+    if provider == "fake":
+        return FakeProvider(model=model, **(options or {}))
+    if provider == "anthropic":
+        return AnthropicProvider(model, api_key)
+    if provider == "openai":
+        return OpenAIProvider(model, api_key)
+    raise ValueError(f"Unknown AI provider: {provider}")
@@ -0,0 +1,344 @@
+"""Recurring keyword x location sweep scheduler."""
+
+import time
+import uuid
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import product
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+
+from ..database import db, SearchHistory, SweepRun
+from ..database.task_queue import TaskQueue
+
+logger = logging.getLogger(__name__)
+
+# How due sweeps run: in this process, or as tasks for --worker processes
+DISPATCH_MODES = ("local", "queue")
+
+
+class SweepScheduler:
+    """
+    Run the configured default searches on a schedule.
+
+    Each cycle plans the cross-product of ``search.default_keywords`` and
+    ``search.default_locations`` as SweepRun rows, spread across quota
+    windows so provider limits are respected. Due runs execute with bounded
+    parallelism; combinations searched recently enough are skipped. Because
+    run state lives in the database, a restarted scheduler picks up the
+    current cycle where it left off.
+
+    With ``scheduler.dispatch: queue`` due runs are not executed here but
+    added to the shared task queue, where any number of ``--worker``
+    processes pick them up.
+    """
+
+    def __init__(self, agent, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize sweep scheduler.
+
+        Args:
+            agent: JobSearchAgent used to execute searches
+            config: Configuration dictionary
+        """
+        self.agent = agent
+        self.config = config or {}
+
+        search_config = self.config.get("search", {})
+        scheduler_config = self.config.get("scheduler", {})
+        quota_config = scheduler_config.get("quota", {})
+
+        self.keywords = scheduler_config.get(
+            "keywords", search_config.get("default_keywords", [])
+        )
+        self.locations = scheduler_config.get(
+            "locations", search_config.get("default_locations", [""])
+        )
+        self.interval = timedelta(hours=scheduler_config.get("interval_hours", 24))
+        self.freshness = timedelta(hours=scheduler_config.get("freshness_hours", 12))
+        self.max_parallel = scheduler_config.get("max_parallel", 2)
+        self.analyze = scheduler_config.get("analyze", True)
+        self.dispatch = scheduler_config.get("dispatch", "local")
+        if self.dispatch not in DISPATCH_MODES:
+            raise ValueError(
+                f"Invalid scheduler.dispatch '{self.dispatch}', "
+                f"expected one of: {', '.join(DISPATCH_MODES)}"
+            )
+        self.queue = TaskQueue(self.config) if self.dispatch == "queue" else None
+
+        self.calls_per_window = quota_config.get("calls_per_window", 20)
+        self.window = timedelta(minutes=quota_config.get("window_minutes", 60))
+
+    def _calls_per_sweep(self) -> int:
+        """Number of provider calls one sweep makes across enabled scrapers."""
+        scrapers_config = self.config.get("scrapers", {})
+        calls = sum(
+            scraper.calls_per_search
+            for name, scraper in self.agent.scrapers.items()
+            if scrapers_config.get(name, {}).get("enabled", True)
+        )
+        # Sweeps crawl incrementally, fetching up to search.max_pages pages
+        # (one search's worth of calls each) per scraper
+        max_pages = self.config.get("search", {}).get("max_pages", 1)
+        return max(calls * max_pages, 1)
+
+    def _sweeps_per_window(self) -> int:
+        """Number of sweeps whose provider calls fit in one quota window."""
+        return max(self.calls_per_window // self._calls_per_sweep(), 1)
+
+    def plan_cycle(self, now: Optional[datetime] = None) -> List[SweepRun]:
+        """
+        Plan a new cycle of sweeps spread across quota windows.
+
+        Args:
+            now: Cycle start time (defaults to utcnow)
+
+        Returns:
+            List of planned SweepRun rows
+        """
+        now = now or datetime.utcnow()
+        cycle_id = uuid.uuid4().hex
+        sweeps_per_window = self._sweeps_per_window()
+
+        runs = []
+        for i, (keywords, location) in enumerate(product(self.keywords, self.locations)):
+            runs.append(
+                SweepRun(
+                    cycle_id=cycle_id,
+                    keywords=keywords,
+                    location=location,
+                    status="pending",
+                    scheduled_for=now + (i // sweeps_per_window) * self.window,
+                    created_date=now,
+                )
+            )
+
+        with db.get_write_session() as session:
+            session.add_all(runs)
+            session.flush()
+            session.expunge_all()
+
+        windows = (len(runs) + sweeps_per_window - 1) // sweeps_per_window
+        logger.info(f"Planned {len(runs)} sweeps across {windows} quota window(s)")
+        return runs
+
+    def resume(self):
+        """Return runs interrupted by a crash or restart to the queue."""
+        if self.dispatch == "queue":
+            # Queued runs belong to their tasks, which workers re-claim
+            return
+
+        with db.get_write_session() as session:
+            count = (
+                session.query(SweepRun)
+                .filter(SweepRun.status == "running")
+                .update({"status": "pending", "started_date": None})
+            )
+
+        if count:
+            logger.info(f"Resuming {count} interrupted sweep(s)")
+
+    def _needs_new_cycle(self, now: datetime) -> bool:
+        """Check whether the last cycle is finished and the interval elapsed."""
+        with db.get_session() as session:
+            pending = (
+                session.query(SweepRun).filter(SweepRun.status == "pending").count()
+            )
+            if pending:
+                return False
+
+            last_planned = session.query(func.max(SweepRun.created_date)).scalar()
+
+        return last_planned is None or last_planned + self.interval <= now
+
+    def _is_fresh(self, keywords: str, location: str, now: datetime) -> bool:
+        """Check whether a combination was searched within the freshness window."""
+        with db.get_session() as session:
+            last_search = (
+                session.query(func.max(SearchHistory.search_date))
+                .filter(
+                    SearchHistory.keywords == keywords,
+                    SearchHistory.location == location,
+                )
+                .scalar()
+            )
+
+        return last_search is not None and last_search + self.freshness > now
+
+    def _claim_due_runs(self, now: datetime) -> List[SweepRun]:
+        """
+        Mark due runs as running (or skipped if still fresh) and return them.
+
+        At most one window's worth of sweeps starts per quota window, counting
+        sweeps started within the last window. Runs that fell behind (e.g.
+        after downtime) stay pending and start in later ticks, keeping the
+        spread plan_cycle computed instead of spending the quota at once.
+        """
+        with db.get_write_session() as session:
+            started = (
+                session.query(SweepRun)
+                .filter(SweepRun.started_date > now - self.window)
+                .count()
+            )
+            budget = self._sweeps_per_window() - started
+
+            due = (
+                session.query(SweepRun)
+                .filter(SweepRun.status == "pending", SweepRun.scheduled_for <= now)
+                .order_by(SweepRun.scheduled_for, SweepRun.id)
+                .all()
+            )
+
+            claimed = []
+            for i, run in enumerate(due):
+                if len(claimed) >= budget:
+                    logger.info(
+                        f"Quota window full, deferring {len(due) - i} due sweep(s)"
+                    )
+                    break
+
+                if self._is_fresh(run.keywords, run.location, now):
+                    logger.info(
+                        f"Skipping sweep '{run.keywords}' in '{run.location}': results still fresh"
+                    )
+                    run.status = "skipped"
+                    run.finished_date = now
+                    continue
+
+                run.status = "running"
+                run.started_date = now
+                claimed.append(run)
+
+            session.flush()
+            session.expunge_all()
+
+        return claimed
+
+    @staticmethod
+    def finish_run(
+        run_id: int,
+        results: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ):
+        """
+        Persist the outcome of a sweep, run here or by a queue worker.
+
+        Args:
+            run_id: SweepRun ID
+            results: execute_search response if the sweep succeeded
+            error: Error message if it failed
+        """
+        if results is not None:
+            update = {
+                "status": "completed",
+                "search_id": results["search_id"],
+                "results_count": results["total_jobs"],
+                "new_jobs_count": results["new_jobs_saved"],
+            }
+        else:
+            update = {"status": "failed", "error": error}
+
+        update["finished_date"] = datetime.utcnow()
+        with db.get_write_session() as session:
+            session.query(SweepRun).filter(SweepRun.id == run_id).update(update)
+
+    def _execute_run(self, run: SweepRun):
+        """Execute one sweep and persist its outcome."""
+        try:
+            results = self.agent.execute_search(
+                keywords=run.keywords,
+                location=run.location,
+                analyze=self.analyze,
+                save_to_db=True,
+                response_mode="ids",
+                incremental=True,
+            )
+        except Exception as e:
+            logger.error(f"Sweep '{run.keywords}' in '{run.location}' failed: {str(e)}")
+            self.finish_run(run.id, error=str(e))
+            return
+
+        self.finish_run(run.id, results)
+
+    def enqueue_runs(self, runs: List[SweepRun]) -> List[int]:
+        """
+        Hand runs to queue workers as search tasks.
+
+        Args:
+            runs: Claimed runs
+
+        Returns:
+            Task IDs
+        """
+        return self.queue.enqueue_many(
+            "search",
+            (
+                {
+                    "keywords": run.keywords,
+                    "location": run.location,
+                    "analyze": self.analyze,
+                    "sweep_run_id": run.id,
+                }
+                for run in runs
+            ),
+        )
+
+    def run_pending(self, now: Optional[datetime] = None) -> int:
+        """
+        Execute all due sweeps with bounded parallelism (or queue them).
+
+        Args:
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            Number of sweeps executed or queued
+        """
+        now = now or datetime.utcnow()
+        runs = self._claim_due_runs(now)
+
+        if runs and self.dispatch == "queue":
+            self.enqueue_runs(runs)
+            logger.info(f"Queued {len(runs)} sweep(s) for workers")
+        elif runs:
+            logger.info(f"Running {len(runs)} sweep(s), {self.max_parallel} at a time")
+            with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+                list(executor.map(self._execute_run, runs))
+
+        return len(runs)
+
+    def tick(self, now: Optional[datetime] = None) -> int:
+        """
+        Plan a cycle if one is due, then run due sweeps.
+
+        Args:
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            Number of sweeps executed or queued
+        """
+        now = now or datetime.utcnow()
+        if self._needs_new_cycle(now):
+            self.plan_cycle(now)
+        return self.run_pending(now)
+
+    def run_forever(self, poll_seconds: int = 60):
+        """
+        Run the scheduler loop until interrupted.
+
+        Args:
+            poll_seconds: Seconds to sleep between ticks
+        """
+        self.resume()
+        logger.info(
+            f"Scheduler started: {len(self.keywords)} keyword(s) x "
+            f"{len(self.locations)} location(s) every {self.interval}"
+        )
+
+        try:
+            while True:
+                self.tick()
+                time.sleep(poll_seconds)
+        except KeyboardInterrupt:
+            logger.info("Scheduler stopped")
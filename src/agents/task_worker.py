@@ -0,0 +1,311 @@
+"""Queue worker that runs search and analysis tasks from the database."""
+
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from ..database import db, Task
+from ..database.quota import SharedRateLimiter
+from ..database.task_queue import TaskQueue
+from ..utils import metrics
+from ..utils.rate_limit import RateLimiter
+from .job_search_agent import MAX_ANALYZED_JOBS
+from .sweep_scheduler import SweepScheduler
+
+logger = logging.getLogger(__name__)
+
+TASKS_TOTAL = metrics.counter(
+    "jobsearch_tasks_total",
+    "Queue tasks run by workers, by kind and outcome (completed, retry, "
+    "failed or lost)",
+    ["kind", "outcome"],
+)
+TASK_SECONDS = metrics.histogram(
+    "jobsearch_task_seconds", "Time to run one queue task in seconds", ["kind"]
+)
+
+# Window of the shared provider quotas, matching the per-minute limits
+QUOTA_PERIOD = 60.0
+
+
+class TaskWorker:
+    """
+    Pull tasks from the shared queue and run them until stopped.
+
+    Any number of workers, in one process each and on any number of
+    machines, can share one database. A search task saves its results and
+    queues the new jobs for analysis in batches, which other workers pick
+    up in parallel. While a task runs a background thread renews its lease;
+    if the worker dies the lease expires and another worker re-claims it.
+
+    State that must be shared lives in the database: stored analysis is
+    reused across workers, watermarks and freshness come from the search
+    history, LLM budgets are reserved against recorded usage, and (with
+    ``worker.shared_quota``) provider rate limits are counted in the
+    ``quota_windows`` table instead of per process.
+    """
+
+    def __init__(
+        self,
+        agent,
+        config: Optional[Dict[str, Any]] = None,
+        worker_id: Optional[str] = None,
+    ):
+        """
+        Initialize task worker.
+
+        Args:
+            agent: JobSearchAgent used to run tasks
+            config: Configuration dictionary
+            worker_id: Unique worker ID (default: host, PID and a random
+                suffix)
+        """
+        self.agent = agent
+        self.config = config or {}
+        worker_config = self.config.get("worker", {})
+
+        self.queue = TaskQueue(self.config)
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        )
+        self.heartbeat_seconds = worker_config.get("heartbeat_seconds", 30)
+        self.poll_seconds = worker_config.get("poll_seconds", 5)
+        self.analyze_batch_size = worker_config.get("analyze_batch_size", 10)
+        self.kinds = worker_config.get("kinds")
+
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "search": self.run_search,
+            "analyze": self.run_analyze,
+        }
+
+        if worker_config.get("shared_quota", True):
+            self._share_rate_limits()
+
+    def _share_rate_limits(self):
+        """Replace per-process scraper rate limiters with database-backed ones."""
+        for name, scraper in self.agent.scrapers.items():
+            limiter = getattr(scraper, "rate_limiter", None)
+            if isinstance(limiter, RateLimiter):
+                scraper.rate_limiter = SharedRateLimiter(
+                    f"scraper:{name}", limiter.rate * QUOTA_PERIOD, QUOTA_PERIOD
+                )
+
+    def run_search(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a search task and queue analysis of the new jobs.
+
+        Args:
+            payload: keywords, location, analyze (default True) and
+                optionally the sweep_run_id it executes
+
+        Returns:
+            Search statistics and the number of analysis tasks queued
+        """
+        keywords = payload["keywords"]
+        location = payload.get("location") or ""
+        results = self.agent.execute_search(
+            keywords=keywords,
+            location=location,
+            analyze=False,
+            save_to_db=True,
+            response_mode="ids",
+            incremental=payload.get("incremental", True),
+        )
+
+        analysis_tasks = []
+        job_ids = results["new_job_ids"][:MAX_ANALYZED_JOBS]
+        if payload.get("analyze", True) and job_ids:
+            analysis_tasks = self.queue.enqueue_many(
+                "analyze",
+                (
+                    {
+                        "job_ids": job_ids[i : i + self.analyze_batch_size],
+                        "keywords": keywords,
+                        "location": location,
+                        "search_id": results["search_id"],
+                    }
+                    for i in range(0, len(job_ids), self.analyze_batch_size)
+                ),
+            )
+
+        if payload.get("sweep_run_id"):
+            SweepScheduler.finish_run(payload["sweep_run_id"], results)
+
+        return {
+            "search_id": results["search_id"],
+            "total_jobs": results["total_jobs"],
+            "new_jobs_saved": results["new_jobs_saved"],
+            "analysis_tasks": len(analysis_tasks),
+        }
+
+    def run_analyze(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run an analysis task.
+
+        Args:
+            payload: job_ids, and the keywords, location and search_id of
+                the search they came from
+
+        Returns:
+            Analysis counts (see JobSearchAgent.analyze_saved_jobs)
+        """
+        return self.agent.analyze_saved_jobs(
+            payload["job_ids"],
+            keywords=payload.get("keywords", ""),
+            location=payload.get("location", ""),
+            search_id=payload.get("search_id"),
+        )
+
+    def _heartbeat(self, task: Task, stop: threading.Event, lost: threading.Event):
+        """Renew a task's lease until stopped; flag it if the lease was lost."""
+        while not stop.wait(self.heartbeat_seconds):
+            try:
+                if not self.queue.heartbeat(task.id, self.worker_id):
+                    lost.set()
+                    return
+            except Exception as e:
+                # Keep trying; the lease outlasts several missed heartbeats
+                logger.warning(f"Heartbeat for task {task.id} failed: {str(e)}")
+
+    def _on_failed(self, task: Task, error: str):
+        """Record a task that used up its attempts."""
+        if task.kind == "search" and (task.payload or {}).get("sweep_run_id"):
+            SweepScheduler.finish_run(task.payload["sweep_run_id"], error=error)
+
+    def run_once(self) -> bool:
+        """
+        Claim and run one task.
+
+        Returns:
+            True if a task was run, False if none was available
+        """
+        task = self.queue.claim(self.worker_id, kinds=self.kinds)
+        if task is None:
+            return False
+
+        logger.info(
+            f"Running {task.kind} task {task.id} (attempt {task.attempts}/"
+            f"{task.max_attempts})"
+        )
+        stop = threading.Event()
+        lost = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(task, stop, lost), daemon=True
+        )
+        heartbeat.start()
+
+        started = time.perf_counter()
+        try:
+            handler = self.handlers.get(task.kind)
+            if handler is None:
+                raise ValueError(f"Unknown task kind '{task.kind}'")
+            result = handler(task.payload or {})
+        except KeyboardInterrupt:
+            stop.set()
+            self.queue.release(task.id, self.worker_id)
+            logger.info(f"Released task {task.id}")
+            raise
+        except Exception as e:
+            stop.set()
+            logger.error(f"{task.kind} task {task.id} failed: {str(e)}")
+            status = self.queue.fail(task.id, self.worker_id, str(e))
+            if status == "failed":
+                self._on_failed(task, str(e))
+            outcome = {"pending": "retry", None: "lost"}.get(status, status)
+            TASKS_TOTAL.labels(task.kind, outcome).inc()
+            return True
+        finally:
+            stop.set()
+            heartbeat.join()
+            TASK_SECONDS.labels(task.kind).observe(time.perf_counter() - started)
+
+        if self.queue.complete(task.id, self.worker_id, result):
+            TASKS_TOTAL.labels(task.kind, "completed").inc()
+        else:
+            # Another worker re-claimed the task after our lease lapsed
+            logger.warning(
+                f"Lost the lease on task {task.id}"
+                + (" (heartbeats were rejected)" if lost.is_set() else "")
+                + ", discarding its result"
+            )
+            TASKS_TOTAL.labels(task.kind, "lost").inc()
+        return True
+
+    def run_forever(self, drain: bool = False) -> int:
+        """
+        Run tasks until interrupted.
+
+        Args:
+            drain: Exit once no task is available instead of polling
+
+        Returns:
+            Number of tasks run
+        """
+        logger.info(f"Worker {self.worker_id} started")
+        count = 0
+        try:
+            while True:
+                if self.run_once():
+                    count += 1
+                elif drain:
+                    break
+                else:
+                    time.sleep(self.poll_seconds)
+        except KeyboardInterrupt:
+            pass
+
+        logger.info(f"Worker {self.worker_id} stopped after {count} task(s)")
+        return count
+
+
+def _worker_process(config: Dict[str, Any], drain: bool):
+    """Entry point of one spawned worker process."""
+    # Imported here: spawned children start from a fresh interpreter
+    from ..utils import configure_logging
+    from .job_search_agent import JobSearchAgent
+
+    configure_logging(config.get("logging"))
+    db.configure(config=config.get("database"))
+    metrics.configure(config.get("metrics"))
+    TaskWorker(JobSearchAgent(config=config), config=config).run_forever(drain)
+
+
+def run_worker_processes(
+    config: Dict[str, Any], processes: int, drain: bool = False
+) -> List[int]:
+    """
+    Run several workers on this machine, one process each.
+
+    Args:
+        config: Configuration dictionary
+        processes: Number of worker processes
+        drain: Let each worker exit once no task is available
+
+    Returns:
+        Exit codes of the worker processes
+    """
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(
+            target=_worker_process, args=(config, drain), name=f"worker-{i}"
+        )
+        for i in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    logger.info(f"Started {processes} worker processes")
+
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        # Children got the same SIGINT and release their tasks
+        for worker in workers:
+            worker.join()
+
+    return [worker.exitcode for worker in workers]
@@ -0,0 +1,49 @@
+"""Flask JSON provider backed by orjson."""
+
+from typing import Any, Union
+
+from flask.json.provider import DefaultJSONProvider
+
+from ..utils.json_backend import orjson
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Drop-in replacement for Flask's default provider using orjson.
+
+    Output matches ``DefaultJSONProvider``: keys are sorted when
+    ``sort_keys`` is set, dates are rendered as HTTP dates and other
+    unsupported types (Decimal, objects with ``__html__``) go through
+    Flask's ``default`` function. Calls with extra ``json.dumps`` keyword
+    arguments fall back to the stdlib implementation.
+    """
+
+    def _options(self, pretty: bool = False) -> int:
+        """orjson option flags matching the provider settings."""
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if pretty:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON text."""
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode(
+            "utf-8"
+        )
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize JSON text or bytes."""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Build a JSON response without an intermediate str."""
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        body = orjson.dumps(obj, default=self.default, option=self._options(pretty))
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
@@ -1,45 +1,169 @@
 """Flask API server for n8n integration."""
 
 import os
+import time
 import logging
-from flask import Flask, request, jsonify
+from typing import Any, Dict, Optional
+
+from flask import Flask, Response, g, request, jsonify, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
-import yaml
 
 from ..agents import JobSearchAgent
-from ..database import db
+from ..agents.job_search_agent import RESPONSE_MODES
+from ..database import db, export
+from ..utils import (
+    configure_logging,
+    geo,
+    json_backend,
+    load_config,
+    metrics,
+    profiling,
+)
+from ..utils.dates import parse_posted_date
 
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Load configuration
+config = load_config()
+
+# Configure logging (like basicConfig, leave it alone if the host process already did)
+if not logging.getLogger().handlers:
+    configure_logging(config.get("logging"))
 logger = logging.getLogger(__name__)
 
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app)
 
-# Load configuration
-config_path = os.path.join(
-    os.path.dirname(__file__), "../../config/config.yaml"
+# Encode responses with orjson when it is installed
+if json_backend.BACKEND == "orjson":
+    from .json_provider import OrjsonProvider
+
+    app.json = OrjsonProvider(app)
+
+db.configure(config=config.get("database"))
+metrics.configure(config.get("metrics"))
+profiling_config = profiling.profiling_options(config.get("profiling"))
+default_radius_km = config.get("location", {}).get(
+    "default_radius_km", geo.DEFAULT_RADIUS_KM
+)
+
+HTTP_REQUEST_SECONDS = metrics.histogram(
+    "jobsearch_http_request_seconds",
+    "API request latency in seconds",
+    ["method", "route"],
+)
+HTTP_REQUESTS_TOTAL = metrics.counter(
+    "jobsearch_http_requests_total",
+    "API requests by route and status code",
+    ["method", "route", "status"],
 )
-with open(config_path, "r") as f:
-    config = yaml.safe_load(f)
 
 # Initialize job search agent
 agent = JobSearchAgent(config=config)
 
 
+@app.before_request
+def start_request_timer():
+    """Remember when the request started for the latency histogram."""
+    g.request_start = time.perf_counter()
+
+
+@app.before_request
+def start_request_profile():
+    """Profile the request if asked via X-Profile or picked by sample_rate."""
+    requested = request.headers.get("X-Profile", "").strip().lower()
+    if requested and profiling_config["allow_header"]:
+        mode = (
+            requested
+            if requested in profiling.PROFILE_MODES
+            else profiling_config["mode"]
+        )
+    elif profiling.should_sample(profiling_config["sample_rate"]):
+        mode = profiling_config["mode"]
+    else:
+        return
+
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    g.profiler = profiling.Profiler(
+        f"{request.method}-{route}",
+        mode=mode,
+        output_dir=profiling_config["output_dir"],
+        interval_ms=profiling_config["interval_ms"],
+    )
+    g.profiler.start()
+
+
+@app.after_request
+def record_request_metrics(response):
+    """Record route latency and status."""
+    start = g.get("request_start")
+    if start is not None and metrics.is_enabled():
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        HTTP_REQUEST_SECONDS.labels(request.method, route).observe(
+            time.perf_counter() - start
+        )
+        HTTP_REQUESTS_TOTAL.labels(request.method, route, response.status_code).inc()
+    return response
+
+
+@app.after_request
+def finish_request_profile(response):
+    """Write the request's profile and report its path in X-Profile-Output."""
+    profiler = g.pop("profiler", None)
+    if profiler is not None:
+        try:
+            response.headers["X-Profile-Output"] = profiler.stop()
+        except Exception as e:
+            logger.error(f"Error writing profile: {str(e)}")
+    return response
+
+
+@app.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    """Metrics in Prometheus text format (404 when metrics are disabled)."""
+    if not metrics.is_enabled():
+        return jsonify({"error": "Metrics are disabled"}), 404
+    return app.response_class(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
+
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint."""
     return jsonify({"status": "healthy", "service": "job-search-agent"}), 200
 
 
+def _int_param(
+    value: Any, name: str, default: Optional[int], maximum: Optional[int] = None
+) -> Optional[int]:
+    """
+    Parse a positive integer request parameter.
+
+    Args:
+        value: Raw value (None if the parameter was not sent)
+        name: Parameter name, for the error message
+        default: Value when the parameter was not sent (None for no value)
+        maximum: Larger values are clamped to this
+
+    Returns:
+        Parsed value
+
+    Raises:
+        ValueError: If the value is not a positive integer (message is
+            client-facing)
+    """
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {name}: {value}")
+    if number < 1:
+        raise ValueError(f"{name} must be a positive integer")
+    return min(number, maximum) if maximum is not None else number
+
+
 @app.route("/api/search", methods=["POST"])
 def search_jobs():
     """
@@ -50,13 +174,20 @@ def search_jobs():
         "keywords": "Python Developer",
         "location": "Remote",
         "analyze": true,
-        "save_to_db": true
+        "save_to_db": true,
+        "response_mode": "full",
+        "page_size": 50
     }
 
+    response_mode is "full" (every job), "summary" (first page_size compact
+    jobs; page the rest via /api/search/<search_id>/jobs) or "ids" (IDs of
+    newly saved jobs only).
+
     Returns:
     {
         "keywords": "Python Developer",
         "location": "Remote",
+        "search_id": "...",
         "total_jobs": 150,
         "new_jobs_saved": 45,
         "platform_breakdown": {...},
@@ -73,15 +204,26 @@ def search_jobs():
         location = data.get("location", "")
         analyze = data.get("analyze", True)
         save_to_db = data.get("save_to_db", True)
+        response_mode = data.get("response_mode", "full")
+        try:
+            page_size = _int_param(data.get("page_size"), "page_size", 50)
+            page = _int_param(data.get("page"), "page", 1)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        if response_mode not in RESPONSE_MODES:
+            return jsonify({"error": f"Invalid response_mode: {response_mode}"}), 400
 
         # Optional parameters
         kwargs = {}
         if "page" in data:
-            kwargs["page"] = data["page"]
+            kwargs["page"] = page
         if "date_posted" in data:
             kwargs["date_posted"] = data["date_posted"]
         if "job_type" in data:
             kwargs["job_type"] = data["job_type"]
+        if "incremental" in data:
+            kwargs["incremental"] = data["incremental"]
 
         logger.info(f"Received search request: {keywords} in {location}")
 
@@ -91,6 +233,8 @@ def search_jobs():
             location=location,
             analyze=analyze,
             save_to_db=save_to_db,
+            response_mode=response_mode,
+            page_size=page_size,
             **kwargs,
         )
 
@@ -101,6 +245,96 @@ def search_jobs():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/search/<search_id>/jobs", methods=["GET"])
+def get_search_results(search_id):
+    """
+    Page through the jobs found by a previous search.
+
+    Query parameters:
+    - page: Page number (default: 1)
+    - per_page: Jobs per page (default: 50, max: 500)
+    - view: "summary" (default) or "full"
+
+    Returns:
+    {
+        "search_id": "...",
+        "page": 1,
+        "per_page": 50,
+        "total": 150,
+        "has_more": true,
+        "jobs": [...]
+    }
+    """
+    try:
+        try:
+            page = _int_param(request.args.get("page"), "page", 1)
+            per_page = _int_param(
+                request.args.get("per_page"), "per_page", 50, maximum=500
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        view = request.args.get("view", "summary")
+
+        results = agent.get_search_results(
+            search_id, page=page, per_page=per_page, view=view
+        )
+
+        if results is None:
+            return jsonify({"error": "Search not found"}), 404
+
+        return jsonify(results), 200
+
+    except Exception as e:
+        logger.error(f"Error in search results endpoint: {str(e)}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+
+def _job_filters(args) -> Dict[str, Any]:
+    """
+    Parse the job filter query parameters shared by the job listing routes.
+
+    Args:
+        args: Request query parameters
+
+    Returns:
+        get_jobs_from_db filters
+
+    Raises:
+        ValueError: If a parameter is invalid (message is client-facing)
+    """
+    filters = {"source": args.get("source"), "keywords": args.get("keywords")}
+
+    posted_since = args.get("posted_since")
+    if posted_since:
+        filters["posted_since"] = parse_posted_date(posted_since)
+        if filters["posted_since"] is None:
+            raise ValueError(f"Invalid posted_since: {posted_since}")
+
+    for name in ("min_salary", "max_salary"):
+        value = args.get(name)
+        if value:
+            try:
+                filters[name] = float(value)
+            except ValueError:
+                raise ValueError(f"Invalid {name}: {value}")
+
+    near = args.get("near")
+    if near:
+        point = geo.parse_point(near)
+        if point is None:
+            raise ValueError(f"Unknown location for near: {near}")
+        try:
+            radius_km = float(args.get("radius_km", default_radius_km))
+        except ValueError:
+            radius_km = 0
+        if radius_km <= 0:
+            raise ValueError("radius_km must be a positive number")
+        filters["near"] = point
+        filters["radius_km"] = radius_km
+
+    return filters
+
+
 @app.route("/api/jobs", methods=["GET"])
 def get_jobs():
     """
@@ -110,6 +344,12 @@ def get_jobs():
     - limit: Maximum number of jobs (default: 100)
     - source: Filter by platform (indeed, linkedin, etc.)
     - keywords: Filter by keywords in title/description
+    - posted_since: Only jobs posted since this date (ISO date/datetime or
+      relative, e.g. "7 days ago"); results are ordered newest posting first
+    - min_salary / max_salary: Annual salary range in the base currency;
+      returns jobs whose normalized salary range overlaps it
+    - near: Place name ("Austin, TX") or "lat,lon" to search around
+    - radius_km: Radius around near (default: location.default_radius_km)
 
     Returns:
     {
@@ -118,11 +358,13 @@ def get_jobs():
     }
     """
     try:
-        limit = int(request.args.get("limit", 100))
-        source = request.args.get("source")
-        keywords = request.args.get("keywords")
+        try:
+            limit = _int_param(request.args.get("limit"), "limit", 100)
+            filters = _job_filters(request.args)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
-        jobs = agent.get_jobs_from_db(limit=limit, source=source, keywords=keywords)
+        jobs = agent.get_jobs_from_db(limit=limit, **filters)
 
         return jsonify({"count": len(jobs), "jobs": jobs}), 200
 
@@ -131,11 +373,98 @@ def get_jobs():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/jobs/export", methods=["GET"])
+def export_jobs():
+    """
+    Stream stored jobs for bulk loading.
+
+    The body is streamed with constant server memory, so the whole table
+    can be exported in one request.
+
+    Query parameters:
+    - format: ndjson (default), csv or parquet
+    - limit: Maximum number of jobs (default: all)
+    - source, keywords, posted_since, min_salary, max_salary, near,
+      radius_km: Same filters as /api/jobs
+
+    Returns:
+        NDJSON (one job per line), CSV with a header row, or a Parquet file
+    """
+    try:
+        export_format = request.args.get("format", "ndjson").lower()
+        if export_format not in export.EXPORT_FORMATS:
+            return jsonify({"error": f"Unknown format: {export_format}"}), 400
+
+        try:
+            limit = _int_param(request.args.get("limit"), "limit", None)
+            filters = _job_filters(request.args)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        rows = agent.iter_job_rows(limit=limit, **filters)
+        try:
+            body = export.encode(rows, export_format)
+        except RuntimeError as e:
+            return jsonify({"error": str(e)}), 400
+
+        content_type, extension = export.EXPORT_FORMATS[export_format]
+        return Response(
+            stream_with_context(body),
+            content_type=content_type,
+            headers={"Content-Disposition": f"attachment; filename=jobs.{extension}"},
+        )
+
+    except Exception as e:
+        logger.error(f"Error in export_jobs endpoint: {str(e)}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/jobs/search/semantic", methods=["GET"])
+def semantic_search():
+    """
+    Find jobs related to a free-text query by meaning, not exact keywords.
+
+    Query parameters:
+    - q: Query text (required), e.g. "backend python developer"
+    - limit: Maximum number of jobs (default: 20, max: 100)
+
+    Returns:
+    {
+        "query": "backend python developer",
+        "count": 20,
+        "jobs": [{..., "score": 0.72}, ...]
+    }
+    """
+    try:
+        query = request.args.get("q", "").strip()
+        if not query:
+            return jsonify({"error": "q is required"}), 400
+
+        try:
+            limit = _int_param(request.args.get("limit"), "limit", 20, maximum=100)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        try:
+            jobs = agent.semantic_search(query, limit=limit)
+        except RuntimeError as e:
+            return jsonify({"error": str(e)}), 400
+
+        return jsonify({"query": query, "count": len(jobs), "jobs": jobs}), 200
+
+    except Exception as e:
+        logger.error(f"Error in semantic_search endpoint: {str(e)}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+
 @app.route("/api/jobs/<int:job_id>", methods=["GET"])
 def get_job(job_id):
     """
     Get a specific job by ID.
 
+    Query parameters:
+    - include: "raw" to also return the original API payload (raw_data)
+
     Returns:
     {
         "id": 123,
@@ -145,6 +474,9 @@ def get_job(job_id):
     """
     try:
         from ..database import Job
+        from ..database.payload_store import load_payload
+
+        include = request.args.get("include", "").split(",")
 
         with db.get_session() as session:
             job = session.query(Job).filter(Job.id == job_id).first()
@@ -152,13 +484,53 @@ def get_job(job_id):
             if not job:
                 return jsonify({"error": "Job not found"}), 404
 
-            return jsonify(job.to_dict()), 200
+            job_dict = job.to_dict()
+            if "raw" in include:
+                job_dict["raw_data"] = load_payload(session, job.payload_hash)
+
+            return jsonify(job_dict), 200
 
     except Exception as e:
         logger.error(f"Error in get_job endpoint: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/jobs/<int:job_id>/similar", methods=["GET"])
+def similar_jobs(job_id):
+    """
+    Find jobs similar to a stored job.
+
+    Query parameters:
+    - limit: Maximum number of jobs (default: 10, max: 100)
+
+    Returns:
+    {
+        "job_id": 123,
+        "count": 10,
+        "jobs": [{..., "score": 0.81}, ...]
+    }
+    """
+    try:
+        try:
+            limit = _int_param(request.args.get("limit"), "limit", 10, maximum=100)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        try:
+            jobs = agent.similar_jobs(job_id, limit=limit)
+        except RuntimeError as e:
+            return jsonify({"error": str(e)}), 400
+
+        if jobs is None:
+            return jsonify({"error": "Job not found"}), 404
+
+        return jsonify({"job_id": job_id, "count": len(jobs), "jobs": jobs}), 200
+
+    except Exception as e:
+        logger.error(f"Error in similar_jobs endpoint: {str(e)}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+
 @app.route("/webhook/job-search", methods=["POST"])
 def n8n_webhook():
     """
@@ -172,7 +544,9 @@ def n8n_webhook():
         "location": "Remote",
         "options": {
             "analyze": true,
-            "save_to_db": true
+            "save_to_db": true,
+            "response_mode": "summary",
+            "page_size": 50
         }
     }
 
@@ -190,6 +564,14 @@ def n8n_webhook():
 
         analyze = options.get("analyze", True)
         save_to_db = options.get("save_to_db", True)
+        response_mode = options.get("response_mode", "full")
+        try:
+            page_size = _int_param(options.get("page_size"), "page_size", 50)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        if response_mode not in RESPONSE_MODES:
+            return jsonify({"error": f"Invalid response_mode: {response_mode}"}), 400
 
         logger.info(f"n8n webhook triggered: {keywords} in {location}")
 
@@ -199,6 +581,8 @@ def n8n_webhook():
             location=location,
             analyze=analyze,
             save_to_db=save_to_db,
+            response_mode=response_mode,
+            page_size=page_size,
         )
 
         # Format response for n8n
@@ -243,9 +627,10 @@ def analyze_job():
             return jsonify({"error": "Missing required field: description"}), 400
 
         from ..agents import JobAnalyzer
+        from ..scrapers import JobRecord
 
         analyzer = JobAnalyzer()
-        analysis = analyzer.analyze_job(data)
+        analysis = analyzer.analyze_job(JobRecord.from_dict(data))
 
         return jsonify(analysis), 200
 
@@ -263,21 +648,22 @@ def get_stats():
     {
         "total_jobs": 1234,
         "jobs_by_source": {...},
-        "recent_searches": 50
+        "recent_searches": 50,
+        "llm_usage": {"today": {...}, "by_day": [...], "by_source": {...}, "budget": {...}}
     }
     """
     try:
-        from ..database import Job, SearchHistory
+        from ..database import ACTIVE_JOBS, Job, SearchHistory
 
         with db.get_session() as session:
-            total_jobs = session.query(Job).filter(Job.is_active == True).count()
+            total_jobs = session.query(Job).filter(ACTIVE_JOBS).count()
 
             # Jobs by source
             jobs_by_source = {}
             for source in ["indeed", "linkedin", "glassdoor", "monster"]:
                 count = (
                     session.query(Job)
-                    .filter(Job.source == source, Job.is_active == True)
+                    .filter(Job.source == source, ACTIVE_JOBS)
                     .count()
                 )
                 jobs_by_source[source] = count
@@ -289,6 +675,7 @@ def get_stats():
                 "total_jobs": total_jobs,
                 "jobs_by_source": jobs_by_source,
                 "recent_searches": recent_searches,
+                "llm_usage": agent.get_llm_usage(),
             }
 
             return jsonify(stats), 200
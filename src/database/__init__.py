@@ -1,6 +1,32 @@
 """Database package."""
 
 from .database import db, Database
-from .models import Job, SearchHistory, UserProfile
+from .models import (
+    ACTIVE_JOBS,
+    ImportRun,
+    Job,
+    JobPayload,
+    QuotaWindow,
+    SearchHistory,
+    SearchResult,
+    SearchWatermark,
+    SweepRun,
+    Task,
+    UserProfile,
+)
 
-__all__ = ["db", "Database", "Job", "SearchHistory", "UserProfile"]
+__all__ = [
+    "db",
+    "Database",
+    "ACTIVE_JOBS",
+    "ImportRun",
+    "Job",
+    "JobPayload",
+    "QuotaWindow",
+    "SearchHistory",
+    "SearchResult",
+    "SearchWatermark",
+    "SweepRun",
+    "Task",
+    "UserProfile",
+]
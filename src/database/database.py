@@ -1,41 +1,202 @@
 """Database connection and session management."""
 
+import logging
 import os
-from sqlalchemy import create_engine
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.expression import UnaryExpression
 from contextlib import contextmanager
 from dotenv import load_dotenv
 
+from ..utils import json_backend
 from .models import Base
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# JSON columns are encoded with the fast JSON backend (orjson when installed)
+JSON_COLUMN_OPTIONS = {
+    "json_serializer": json_backend.dumps,
+    "json_deserializer": json_backend.loads,
+}
+
+# Pragmas applied to every SQLite connection unless overridden in the
+# ``database.sqlite`` section of config.yaml
+DEFAULT_SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 268435456,  # 256MB
+    "cache_size": -65536,  # Negative values are KiB, i.e. 64MB
+    "busy_timeout": 5000,  # ms
+    "temp_store": "MEMORY",
+}
+
+# Times a lookup-then-insert transaction is run before a unique-key
+# conflict with a concurrent writer is raised
+WRITE_CONFLICT_ATTEMPTS = 3
+
 
 class Database:
     """Database management class."""
 
-    def __init__(self, database_url=None):
-        """Initialize database connection."""
-        self.database_url = database_url or os.getenv(
-            "DATABASE_URL", "sqlite:///jobs.db"
-        )
-        self.engine = create_engine(
-            self.database_url,
-            echo=False,
-            pool_pre_ping=True,
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize database connection.
+
+        Args:
+            database_url: SQLAlchemy URL (defaults to DATABASE_URL or sqlite:///jobs.db)
+            config: The ``database`` section of config.yaml
+        """
+        self.engine = None
+        self.writer_engine = None
+        self.configure(database_url, config)
+
+    def configure(
+        self,
+        database_url: Optional[str] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        (Re)build engines and session factories.
+
+        SQLite databases get a tuned pragma profile (WAL, synchronous=NORMAL,
+        mmap, cache and busy timeout) and two engines: a read pool sized from
+        ``pool_size``/``max_overflow`` and a single serialized writer
+        connection. Under WAL readers never block behind that writer.
+
+        Args:
+            database_url: SQLAlchemy URL (keeps the current URL if omitted)
+            config: The ``database`` section of config.yaml
+        """
+        if self.engine is not None:
+            self.close()
+
+        self.config = config or {}
+        self.database_url = (
+            database_url
+            or self.config.get("url")
+            or getattr(self, "database_url", None)
+            or os.getenv("DATABASE_URL", "sqlite:///jobs.db")
         )
+        self.is_sqlite = self.database_url.startswith("sqlite")
+
+        echo = self.config.get("echo", False)
+
+        if self.is_sqlite:
+            self.pragmas = dict(DEFAULT_SQLITE_PRAGMAS)
+            self.pragmas.update(self.config.get("sqlite") or {})
+
+            self.engine = create_engine(
+                self.database_url,
+                echo=echo,
+                connect_args=self._sqlite_connect_args(),
+                **JSON_COLUMN_OPTIONS,
+                **self._pool_options(),
+            )
+            self._install_sqlite_pragmas(self.engine)
+
+            if self._is_memory_database():
+                # Every connection to :memory: is its own database
+                self.writer_engine = self.engine
+            else:
+                self.writer_engine = create_engine(
+                    self.database_url,
+                    echo=echo,
+                    connect_args=self._sqlite_connect_args(),
+                    pool_size=1,
+                    max_overflow=0,
+                    pool_timeout=self.config.get("writer_timeout", 60),
+                    **JSON_COLUMN_OPTIONS,
+                )
+                self._install_sqlite_pragmas(self.writer_engine, immediate=True)
+        else:
+            self.pragmas = {}
+            self.engine = create_engine(
+                self.database_url,
+                echo=echo,
+                pool_pre_ping=True,
+                **JSON_COLUMN_OPTIONS,
+                **self._pool_options(),
+            )
+            self.writer_engine = self.engine
+
         self.SessionLocal = scoped_session(
             sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         )
+        self.WriterSessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, bind=self.writer_engine
+        )
+
+    def _is_memory_database(self) -> bool:
+        """Check whether the SQLite URL points to an in-memory database."""
+        return self.database_url in ("sqlite://", "sqlite:///:memory:") or (
+            "mode=memory" in self.database_url
+        )
+
+    def _sqlite_connect_args(self) -> Dict[str, Any]:
+        """Connection arguments for the pysqlite driver."""
+        return {
+            "check_same_thread": False,
+            "timeout": self.pragmas.get("busy_timeout", 5000) / 1000.0,
+        }
+
+    def _pool_options(self) -> Dict[str, Any]:
+        """Pool settings from config that apply to the read engine."""
+        if self.is_sqlite and self._is_memory_database():
+            # SingletonThreadPool/StaticPool take no sizing options
+            return {}
+
+        options = {}
+        for key in ("pool_size", "max_overflow", "pool_timeout", "pool_recycle"):
+            if self.config.get(key) is not None:
+                options[key] = self.config[key]
+        return options
+
+    def _install_sqlite_pragmas(self, engine, immediate: bool = False):
+        """
+        Apply the pragma profile to each new SQLite connection.
+
+        Args:
+            engine: Engine to attach listeners to
+            immediate: Start transactions with BEGIN IMMEDIATE so the writer
+                takes the write lock up front instead of failing on upgrade
+        """
+        pragmas = self.pragmas
+
+        @event.listens_for(engine, "connect")
+        def _set_pragmas(dbapi_connection, connection_record):
+            if immediate:
+                # Let SQLAlchemy emit BEGIN itself (see "begin" listener)
+                dbapi_connection.isolation_level = None
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+        if immediate:
+
+            @event.listens_for(engine, "begin")
+            def _begin_immediate(conn):
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
 
     def create_tables(self):
         """Create all tables."""
-        Base.metadata.create_all(bind=self.engine)
+        Base.metadata.create_all(bind=self.writer_engine)
         print("Database tables created successfully.")
 
     def drop_tables(self):
         """Drop all tables."""
-        Base.metadata.drop_all(bind=self.engine)
+        Base.metadata.drop_all(bind=self.writer_engine)
         print("Database tables dropped successfully.")
 
     @contextmanager
@@ -51,9 +212,101 @@ class Database:
         finally:
             session.close()
 
+    @contextmanager
+    def get_write_session(self):
+        """
+        Get a session bound to the serialized writer connection.
+
+        Use this for inserts and updates; concurrent writers queue on the
+        single pooled connection instead of fighting over SQLite's lock.
+        """
+        session = self.WriterSessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def retry_on_conflict(self, write: Callable[[], T], description: str) -> T:
+        """
+        Run a write transaction that inserts rows it first looked up as missing.
+
+        Looking up existing keys and inserting the rest is only atomic while
+        writers are serialized, as on SQLite. On other databases two
+        processes can both find a key missing and insert it; the loser's
+        transaction fails with an IntegrityError and is run again, when its
+        lookup finds the winner's rows.
+
+        Args:
+            write: Callable running one complete write transaction
+            description: What is being written (for logging)
+
+        Returns:
+            The callable's return value
+        """
+        for attempt in range(1, WRITE_CONFLICT_ATTEMPTS + 1):
+            try:
+                return write()
+            except IntegrityError:
+                if attempt == WRITE_CONFLICT_ATTEMPTS:
+                    raise
+                logger.info(
+                    "%s conflicted with a concurrent insert, retrying", description
+                )
+
+    def unindexed(self, column):
+        """
+        A column that the SQLite planner cannot serve from an index.
+
+        On SQLite this renders as ``+column``, the documented way to
+        disqualify a term from index use (see "Disqualifying WHERE Clause
+        Terms Using Unary-+" in the SQLite query optimizer overview). Other
+        databases get the column unchanged.
+
+        Args:
+            column: Column to order or filter by
+
+        Returns:
+            Column expression of the same type
+        """
+        if not self.is_sqlite:
+            return column
+        return UnaryExpression(
+            column, operator=operators.custom_op("+"), type_=column.type
+        )
+
+    def explain(self, session, query) -> List[str]:
+        """
+        Query plan for an ORM query or statement.
+
+        Uses ``EXPLAIN QUERY PLAN`` on SQLite and ``EXPLAIN`` elsewhere, so
+        callers can check that a filter is served by an index.
+
+        Args:
+            session: Session to run the EXPLAIN on
+            query: ORM query or SQL statement
+
+        Returns:
+            Plan lines
+        """
+        statement = getattr(query, "statement", query)
+        compiled = statement.compile(
+            dialect=session.get_bind().dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+        prefix = "EXPLAIN QUERY PLAN" if self.is_sqlite else "EXPLAIN"
+        rows = session.execute(text(f"{prefix} {compiled}")).fetchall()
+        # SQLite rows are (id, parent, notused, detail)
+        return [str(row[-1]) for row in rows]
+
     def close(self):
         """Close database connection."""
         self.SessionLocal.remove()
+        if self.writer_engine is not None and self.writer_engine is not self.engine:
+            self.writer_engine.dispose()
         self.engine.dispose()
 
 
@@ -0,0 +1,224 @@
+"""
+Streaming job export as NDJSON, CSV or Parquet.
+
+Rows are fetched with ``yield_per`` (a server-side cursor where the driver
+supports one) and encoded chunk by chunk, so exporting the whole table
+uses constant memory. Every writer is a generator of ``bytes`` that can be
+written to a file or streamed as an HTTP response body:
+
+    chunks = agent.iter_job_rows(source="indeed")
+    with open("jobs.csv", "wb") as f:
+        for part in export.encode(chunks, "csv"):
+            f.write(part)
+
+Parquet needs pyarrow (``pip install pyarrow``); each chunk becomes one
+row group.
+"""
+
+import csv
+import io
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import JSON, Boolean, DateTime, Float, Integer
+
+from .models import Job
+from ..utils import json_backend
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depends on environment
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip and encoded per chunk (Parquet row group size)
+EXPORT_CHUNK_SIZE = 1000
+
+# format -> (content type, file extension)
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+# Exported columns: everything on the jobs row except internal references
+EXPORT_COLUMNS = [
+    column for column in Job.__table__.columns if column.name != "payload_hash"
+]
+_JSON_COLUMNS = {
+    column.name for column in EXPORT_COLUMNS if isinstance(column.type, JSON)
+}
+_DATETIME_COLUMNS = {
+    column.name for column in EXPORT_COLUMNS if isinstance(column.type, DateTime)
+}
+
+Chunk = List[Dict[str, Any]]
+
+
+def format_for_path(path: str) -> Optional[str]:
+    """Export format implied by a file extension (None if unknown)."""
+    extension = path.rsplit(".", 1)[-1].lower() if "." in path else ""
+    if extension in ("json", "jsonl"):
+        return "ndjson"
+    return extension if extension in EXPORT_FORMATS else None
+
+
+def iter_row_chunks(query, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Chunk]:
+    """
+    Stream a jobs query as chunks of row dictionaries.
+
+    Args:
+        query: Query over Job (its columns are replaced by EXPORT_COLUMNS)
+        chunk_size: Rows per chunk
+
+    Yields:
+        Lists of up to chunk_size {column: value} dictionaries
+    """
+    names = [column.name for column in EXPORT_COLUMNS]
+    chunk = []
+    for row in query.with_entities(*EXPORT_COLUMNS).yield_per(chunk_size):
+        chunk.append(dict(zip(names, row)))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _text_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Row with ISO datetimes (for text formats)."""
+    for name in _DATETIME_COLUMNS:
+        value = row[name]
+        if isinstance(value, datetime):
+            row[name] = value.isoformat()
+    return row
+
+
+def iter_ndjson(chunks: Iterable[Chunk]) -> Iterator[bytes]:
+    """Encode row chunks as newline-delimited JSON."""
+    dumps_bytes = json_backend.dumps_bytes
+    for chunk in chunks:
+        yield b"".join(
+            dumps_bytes(_text_row(row), default=str) + b"\n" for row in chunk
+        )
+
+
+def iter_csv(chunks: Iterable[Chunk]) -> Iterator[bytes]:
+    """Encode row chunks as CSV with a header row; JSON columns as JSON text."""
+    names = [column.name for column in EXPORT_COLUMNS]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(names)
+
+    for chunk in chunks:
+        for row in chunk:
+            _text_row(row)
+            for name in _JSON_COLUMNS:
+                if row[name] is not None:
+                    row[name] = json_backend.dumps(row[name], default=str)
+            writer.writerow([row[name] for name in names])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+    # An empty export is just the header
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _StreamSink:
+    """Write-only file object whose contents are taken out with drain()."""
+
+    def __init__(self):
+        self.parts: List[bytes] = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.parts.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.parts)
+        self.parts = []
+        return data
+
+
+def parquet_schema():
+    """Arrow schema of the Parquet export (JSON columns are JSON text)."""
+    fields = []
+    for column in EXPORT_COLUMNS:
+        if isinstance(column.type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column.type, Float):
+            arrow_type = pa.float64()
+        elif isinstance(column.type, Boolean):
+            arrow_type = pa.bool_()
+        elif isinstance(column.type, DateTime):
+            arrow_type = pa.timestamp("us")
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type))
+    return pa.schema(fields)
+
+
+def iter_parquet(chunks: Iterable[Chunk]) -> Iterator[bytes]:
+    """Encode row chunks as a Parquet file, one row group per chunk."""
+    if pq is None:
+        raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    schema = parquet_schema()
+    sink = _StreamSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        for chunk in chunks:
+            for row in chunk:
+                for name in _JSON_COLUMNS:
+                    if row[name] is not None:
+                        row[name] = json_backend.dumps(row[name], default=str)
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def encode(chunks: Iterable[Chunk], export_format: str) -> Iterator[bytes]:
+    """
+    Encode row chunks in an export format.
+
+    Args:
+        chunks: Row chunks from iter_row_chunks
+        export_format: One of EXPORT_FORMATS
+
+    Returns:
+        Iterator of encoded byte strings
+
+    Raises:
+        ValueError: For unknown formats
+        RuntimeError: For Parquet without pyarrow
+    """
+    if export_format == "ndjson":
+        return iter_ndjson(chunks)
+    if export_format == "csv":
+        return iter_csv(chunks)
+    if export_format == "parquet":
+        if pq is None:
+            raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+        return iter_parquet(chunks)
+    raise ValueError(f"Unknown export format: {export_format}")
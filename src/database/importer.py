@@ -0,0 +1,457 @@
+"""
+Bulk import of normalized jobs from NDJSON, CSV or Parquet files.
+
+Backfills (partner dumps, old exports) bypass the per-search save path:
+
+    importer = BulkImporter(config)
+    counts = importer.import_file("jobs.ndjson")
+
+Records are read in chunks and normalized (dates, salaries, locations,
+content hashes) in a process pool. Each chunk is then deduplicated against
+stored ``external_id`` values in bulk and inserted in one transaction
+together with the file's ``ImportRun`` checkpoint. An interrupted import
+therefore resumes after the last committed chunk, and re-importing a file
+never duplicates jobs.
+
+Files in the export format (``src.database.export``) round-trip, as do
+JobRecord dictionaries (``to_dict``); unknown fields are ignored.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import JSON, Boolean, DateTime, Float, Integer, null
+
+from . import export
+from .database import db
+from .models import ImportRun, Job
+from .payload_store import store_payloads
+from ..utils import geo, json_backend
+from ..utils.dates import parse_posted_date
+from ..utils.salary import SalaryNormalizer
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depends on environment
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Records normalized per worker task and inserted per transaction
+IMPORT_CHUNK_SIZE = 5000
+
+# Keep IN (...) lists below SQLite's bound-parameter limit
+LOOKUP_CHUNK_SIZE = 500
+
+# Imported columns: everything except the generated primary key
+IMPORT_COLUMNS = [column for column in Job.__table__.columns if column.name != "id"]
+
+_TRUE_STRINGS = {"1", "true", "t", "yes", "y"}
+
+# Salary normalizer of the current (worker) process; see _init_worker
+_normalizer: Optional[SalaryNormalizer] = None
+
+
+def _init_worker(salary_config: Optional[Dict[str, Any]], gazetteer: Optional[str]):
+    """Set up the normalizers in a worker process."""
+    global _normalizer
+    _normalizer = SalaryNormalizer.from_config(salary_config)
+    geo.configure(gazetteer)
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    return parse_posted_date(value)
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUE_STRINGS
+    return bool(value)
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return json_backend.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _to_text(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _converter(column) -> Callable[[Any], Any]:
+    """Conversion of input values (CSV text, JSON or Arrow values) for a column."""
+    for column_type, convert in (
+        (DateTime, _to_datetime),
+        (Boolean, _to_bool),
+        (Integer, _to_int),
+        (Float, _to_float),
+        (JSON, _to_json),
+    ):
+        if isinstance(column.type, column_type):
+            return convert
+    return _to_text
+
+
+# (column name, converter) per imported column, resolved once
+_CONVERTERS = [(column.name, _converter(column)) for column in IMPORT_COLUMNS]
+_JSON_COLUMNS = [
+    column.name for column in IMPORT_COLUMNS if isinstance(column.type, JSON)
+]
+
+
+def prepare_row(data: Dict[str, Any], now: datetime) -> Optional[Dict[str, Any]]:
+    """
+    Normalize one input record into a jobs row.
+
+    Stored derived columns (annual salaries, coordinates, region) are
+    recomputed with the current configuration rather than trusted.
+
+    Args:
+        data: Input record
+        now: Import time (naive UTC)
+
+    Returns:
+        Row with every IMPORT_COLUMNS key, or None without an external_id
+    """
+    if not data.get("external_id"):
+        return None
+
+    row = {}
+    for name, convert in _CONVERTERS:
+        value = data.get(name)
+        row[name] = None if value is None or value == "" else convert(value)
+    # Core inserts write None into JSON columns as JSON 'null'; store SQL NULL
+    for name in _JSON_COLUMNS:
+        if row[name] is None:
+            row[name] = null()
+    row["source"] = row["source"] or "import"
+    row["title"] = row["title"] or ""
+    row["company"] = row["company"] or ""
+    row["content_hash"] = row["content_hash"] or Job.make_content_hash(
+        row["title"], row["company"], row["description"]
+    )
+    row["scraped_date"] = row["scraped_date"] or now
+    row["updated_date"] = now
+    row["is_active"] = True if row["is_active"] is None else row["is_active"]
+    # Payloads are re-stored from raw_data, never referenced by hash
+    row["payload_hash"] = None
+
+    row.update(geo.location_columns(row["location"], row["country"]))
+    row.update(
+        _normalizer.normalize(
+            row["salary_min"],
+            row["salary_max"],
+            row["salary_currency"],
+            row["salary_period"],
+        )
+    )
+    return row
+
+
+def _prepare_chunk(
+    export_format: str, records: List[Any], now: datetime
+) -> Tuple[List[Dict[str, Any]], List[Any], int, int]:
+    """
+    Normalize one chunk of records (runs in a worker process).
+
+    Args:
+        export_format: Input format; NDJSON records are undecoded lines
+        records: Raw records
+        now: Import time (naive UTC)
+
+    Returns:
+        (rows, raw payloads aligned with rows, invalid records, records read)
+    """
+    rows = []
+    payloads = []
+    invalid = 0
+
+    for record in records:
+        try:
+            data = json_backend.loads(record) if export_format == "ndjson" else record
+            row = prepare_row(data, now)
+        except Exception:
+            row = None
+        if row is None:
+            invalid += 1
+            continue
+
+        payload = data.get("raw_data")
+        if isinstance(payload, str):
+            try:
+                payload = json_backend.loads(payload)
+            except ValueError:
+                payload = None
+        rows.append(row)
+        payloads.append(payload or None)
+
+    return rows, payloads, invalid, len(records)
+
+
+def _iter_records(path: str, export_format: str) -> Iterator[Any]:
+    """Raw records of a file: NDJSON lines, or dictionaries for CSV and Parquet."""
+    if export_format == "ndjson":
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield line
+    elif export_format == "csv":
+        import csv
+
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    elif export_format == "parquet":
+        if pq is None:
+            raise RuntimeError("Parquet import requires pyarrow (pip install pyarrow)")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=IMPORT_CHUNK_SIZE):
+            yield from batch.to_pylist()
+    else:
+        raise ValueError(f"Unknown import format: {export_format}")
+
+
+def file_fingerprint(path: str) -> str:
+    """Identity of a file's current contents (absolute path, size and mtime)."""
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class BulkImporter:
+    """Load job files into the database with parallel parsing and chunked commits."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize importer.
+
+        Args:
+            config: Configuration dictionary (``import``, ``salary`` and
+                ``location`` sections)
+        """
+        self.config = config or {}
+        import_config = self.config.get("import", {})
+        self.workers = import_config.get("workers") or os.cpu_count() or 1
+        self.chunk_size = import_config.get("chunk_size", IMPORT_CHUNK_SIZE)
+        self.worker_args = (
+            self.config.get("salary"),
+            self.config.get("location", {}).get("gazetteer"),
+        )
+
+    def _prepared_chunks(
+        self, path: str, export_format: str, skip: int
+    ) -> Iterator[Tuple[List[Dict[str, Any]], List[Any], int, int]]:
+        """Normalized chunks of a file, in file order, after ``skip`` records."""
+        records = islice(_iter_records(path, export_format), skip, None)
+        chunks = iter(lambda: list(islice(records, self.chunk_size)), [])
+        now = datetime.utcnow()
+
+        if self.workers <= 1:
+            _init_worker(*self.worker_args)
+            for chunk in chunks:
+                yield _prepare_chunk(export_format, chunk, now)
+            return
+
+        # Keep a bounded number of chunks in flight so memory stays flat
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=self.worker_args,
+        ) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_prepare_chunk, export_format, chunk, now))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _start_run(self, path: str, export_format: str, resume: bool) -> ImportRun:
+        """Find or create the file's ImportRun checkpoint."""
+        fingerprint = file_fingerprint(path)
+        with db.get_write_session() as session:
+            run = (
+                session.query(ImportRun)
+                .filter(ImportRun.fingerprint == fingerprint)
+                .first()
+            )
+            if run is None:
+                run = ImportRun(
+                    path=path, fingerprint=fingerprint, format=export_format
+                )
+                session.add(run)
+            elif not resume:
+                run.status = "running"
+                run.rows_read = 0
+                run.rows_inserted = 0
+                run.rows_duplicate = 0
+                run.rows_invalid = 0
+                run.finished_date = None
+
+            session.flush()
+            session.expunge(run)
+        return run
+
+    def _load_chunk(
+        self,
+        run_id: int,
+        rows: List[Dict[str, Any]],
+        payloads: List[Any],
+        invalid: int,
+        read: int,
+    ) -> Tuple[int, int]:
+        """
+        Insert a chunk's new rows and advance the checkpoint in one transaction.
+
+        Returns:
+            (rows inserted, duplicate rows skipped)
+        """
+        with db.get_write_session() as session:
+            external_ids = list({row["external_id"] for row in rows})
+            existing = set()
+            for start in range(0, len(external_ids), LOOKUP_CHUNK_SIZE):
+                existing.update(
+                    external_id
+                    for (external_id,) in session.query(Job.external_id).filter(
+                        Job.external_id.in_(
+                            external_ids[start:start + LOOKUP_CHUNK_SIZE]
+                        )
+                    )
+                )
+
+            new_rows = {}
+            new_payloads = []
+            for row, payload in zip(rows, payloads):
+                external_id = row["external_id"]
+                if external_id not in existing and external_id not in new_rows:
+                    new_rows[external_id] = row
+                    new_payloads.append(payload)
+
+            if any(payload is not None for payload in new_payloads):
+                hashes = store_payloads(session, new_payloads)
+                session.flush()
+                for row, payload_hash in zip(new_rows.values(), hashes):
+                    row["payload_hash"] = payload_hash
+
+            if new_rows:
+                # Core executemany: one statement for the whole chunk
+                session.execute(Job.__table__.insert(), list(new_rows.values()))
+
+            duplicate = len(rows) - len(new_rows)
+            session.query(ImportRun).filter(ImportRun.id == run_id).update(
+                {
+                    ImportRun.rows_read: ImportRun.rows_read + read,
+                    ImportRun.rows_inserted: ImportRun.rows_inserted + len(new_rows),
+                    ImportRun.rows_duplicate: ImportRun.rows_duplicate + duplicate,
+                    ImportRun.rows_invalid: ImportRun.rows_invalid + invalid,
+                    ImportRun.updated_date: datetime.utcnow(),
+                },
+                synchronize_session=False,
+            )
+
+        return len(new_rows), duplicate
+
+    def import_file(
+        self, path: str, export_format: Optional[str] = None, resume: bool = True
+    ) -> Dict[str, int]:
+        """
+        Import one file.
+
+        Args:
+            path: NDJSON, CSV or Parquet file
+            export_format: File format (default: from the extension)
+            resume: Continue an interrupted import of the same file, and skip
+                one already completed (False starts over; existing jobs are
+                still never duplicated)
+
+        Returns:
+            Counts of rows read, inserted, duplicate and invalid over the
+            file's whole import (including earlier interrupted runs)
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        export_format = export_format or export.format_for_path(path)
+        if export_format not in export.EXPORT_FORMATS:
+            raise ValueError(f"Cannot tell the import format of {path}")
+
+        run = self._start_run(path, export_format, resume)
+        counts = {
+            "read": run.rows_read,
+            "inserted": run.rows_inserted,
+            "duplicate": run.rows_duplicate,
+            "invalid": run.rows_invalid,
+        }
+
+        if run.status == "completed":
+            logger.info("%s was already imported, skipping (counts: %s)", path, counts)
+            return counts
+        if run.rows_read:
+            logger.info("Resuming import of %s after %d rows", path, run.rows_read)
+
+        start = time.perf_counter()
+        read_this_run = 0
+        for rows, payloads, invalid, read in self._prepared_chunks(
+            path, export_format, run.rows_read
+        ):
+            inserted, duplicate = db.retry_on_conflict(
+                lambda: self._load_chunk(run.id, rows, payloads, invalid, read),
+                f"Importing {path}",
+            )
+            counts["read"] += read
+            counts["inserted"] += inserted
+            counts["duplicate"] += duplicate
+            counts["invalid"] += invalid
+            read_this_run += read
+
+            rate = read_this_run / max(time.perf_counter() - start, 1e-9)
+            logger.info(
+                "%s: %d rows read, %d new, %d duplicate, %d invalid (%.0f rows/s)",
+                path,
+                counts["read"],
+                counts["inserted"],
+                counts["duplicate"],
+                counts["invalid"],
+                rate,
+            )
+
+        with db.get_write_session() as session:
+            session.query(ImportRun).filter(ImportRun.id == run.id).update(
+                {
+                    ImportRun.status: "completed",
+                    ImportRun.finished_date: datetime.utcnow(),
+                },
+                synchronize_session=False,
+            )
+
+        logger.info(
+            "Imported %s: %d new jobs from %d rows in %.1fs",
+            path,
+            counts["inserted"],
+            counts["read"],
+            time.perf_counter() - start,
+        )
+        return counts
@@ -0,0 +1,309 @@
+"""Schema migrations for existing databases.
+
+``create_tables`` only creates missing tables, so columns added to existing
+tables (and data moves) are handled here. Every migration is idempotent and
+safe to re-run.
+"""
+
+import sys
+import os
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from sqlalchemy import inspect, text
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.database.database import db
+from src.database.models import Base, Job
+from src.database.payload_store import store_payloads
+from src.utils import geo
+from src.utils.salary import SalaryNormalizer
+
+logger = logging.getLogger(__name__)
+
+
+def _column_names(connection, table: str) -> set:
+    """Get the column names of a table."""
+    return {column["name"] for column in inspect(connection).get_columns(table)}
+
+
+def add_missing_columns(connection):
+    """Add model columns that are missing from existing tables."""
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        existing = _column_names(connection, table.name)
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_type = column.type.compile(dialect=connection.dialect)
+            logger.info(f"Adding column {table.name}.{column.name}")
+            connection.execute(
+                text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+            )
+
+
+def create_missing_indexes(connection):
+    """Create model indexes that are missing from existing tables."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+def move_raw_data_to_payloads(session, batch_size: int = 500) -> int:
+    """
+    Move legacy ``jobs.raw_data`` JSON into the compressed payload store.
+
+    Args:
+        session: Writer session
+        batch_size: Rows moved per batch
+
+    Returns:
+        Number of rows moved
+    """
+    connection = session.connection()
+    if "raw_data" not in _column_names(connection, "jobs"):
+        return 0
+
+    moved = 0
+    last_id = 0
+
+    while True:
+        # Each commit releases the connection, so check one out per batch
+        connection = session.connection()
+        rows = connection.execute(
+            text(
+                "SELECT id, raw_data FROM jobs "
+                "WHERE id > :last_id AND raw_data IS NOT NULL "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": batch_size},
+        ).fetchall()
+
+        if not rows:
+            break
+
+        payloads = [
+            json.loads(raw) if isinstance(raw, str) else raw for _, raw in rows
+        ]
+        hashes = store_payloads(session, payloads)
+        session.flush()
+
+        connection.execute(
+            text("UPDATE jobs SET payload_hash = :hash, raw_data = NULL WHERE id = :id"),
+            [
+                {"hash": content_hash, "id": job_id}
+                for (job_id, _), content_hash in zip(rows, hashes)
+            ],
+        )
+        session.commit()
+
+        moved += len(rows)
+        last_id = rows[-1][0]
+        logger.info(f"Moved raw_data for {moved} jobs")
+
+    try:
+        connection = session.connection()
+        connection.execute(text("ALTER TABLE jobs DROP COLUMN raw_data"))
+        session.commit()
+        logger.info("Dropped legacy jobs.raw_data column")
+    except Exception as e:
+        # SQLite < 3.35 has no DROP COLUMN; the emptied column is harmless
+        session.rollback()
+        logger.warning(f"Could not drop jobs.raw_data: {str(e)}")
+
+    return moved
+
+
+def backfill_content_hashes(session, batch_size: int = 1000) -> int:
+    """
+    Compute content hashes for jobs saved before they existed.
+
+    Args:
+        session: Writer session
+        batch_size: Rows updated per batch
+
+    Returns:
+        Number of rows updated
+    """
+    updated = 0
+
+    while True:
+        rows = (
+            session.query(Job.id, Job.title, Job.company, Job.description)
+            .filter(Job.content_hash.is_(None))
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+
+        session.bulk_update_mappings(
+            Job,
+            [
+                {
+                    "id": job_id,
+                    "content_hash": Job.make_content_hash(title, company, description),
+                }
+                for job_id, title, company, description in rows
+            ],
+        )
+        session.commit()
+        updated += len(rows)
+
+    return updated
+
+
+def backfill_annual_salaries(
+    session, normalizer: SalaryNormalizer, batch_size: int = 1000
+) -> int:
+    """
+    Annualize salaries of jobs saved before normalization existed.
+
+    Args:
+        session: Writer session
+        normalizer: Salary normalizer built from the ``salary`` config
+        batch_size: Rows updated per batch
+
+    Returns:
+        Number of rows updated
+    """
+    updated = 0
+    last_id = 0
+
+    while True:
+        # Page by id: rows in unknown currencies stay unnormalized
+        rows = (
+            session.query(
+                Job.id,
+                Job.salary_min,
+                Job.salary_max,
+                Job.salary_currency,
+                Job.salary_period,
+            )
+            .filter(
+                Job.id > last_id,
+                Job.annual_salary_min.is_(None),
+                (Job.salary_min.isnot(None)) | (Job.salary_max.isnot(None)),
+            )
+            .order_by(Job.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+
+        session.bulk_update_mappings(
+            Job,
+            [
+                dict(normalizer.normalize(low, high, currency, period), id=job_id)
+                for job_id, low, high, currency, period in rows
+            ],
+        )
+        session.commit()
+        updated += len(rows)
+        last_id = rows[-1][0]
+
+    return updated
+
+
+def backfill_locations(session, batch_size: int = 1000) -> int:
+    """
+    Resolve coordinates, region and country for jobs saved before them.
+
+    Args:
+        session: Writer session
+        batch_size: Rows updated per batch
+
+    Returns:
+        Number of rows resolved
+    """
+    updated = 0
+    last_id = 0
+
+    while True:
+        # Page by id: unresolvable locations stay empty
+        rows = (
+            session.query(Job.id, Job.location)
+            .filter(
+                Job.id > last_id,
+                Job.country.is_(None),
+                Job.location.isnot(None),
+                Job.location != "",
+            )
+            .order_by(Job.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+
+        mappings = [
+            dict(geo.location_columns(location), id=job_id)
+            for job_id, location in rows
+        ]
+        session.bulk_update_mappings(Job, mappings)
+        session.commit()
+        updated += sum(1 for mapping in mappings if mapping["country"])
+        last_id = rows[-1][0]
+
+    return updated
+
+
+def run_migrations(config: Optional[Dict[str, Any]] = None):
+    """
+    Bring an existing database up to the current schema.
+
+    Args:
+        config: Application config (``salary`` and ``location`` sections are
+            used to backfill normalized columns)
+    """
+    config = config or {}
+    db.create_tables()
+
+    with db.writer_engine.begin() as connection:
+        add_missing_columns(connection)
+        create_missing_indexes(connection)
+
+    with db.get_write_session() as session:
+        moved = move_raw_data_to_payloads(session)
+        if moved:
+            logger.info(f"Moved {moved} raw payloads into job_payloads")
+
+        hashed = backfill_content_hashes(session)
+        if hashed:
+            logger.info(f"Computed content hashes for {hashed} jobs")
+
+        annualized = backfill_annual_salaries(
+            session, SalaryNormalizer.from_config(config.get("salary"))
+        )
+        if annualized:
+            logger.info(f"Annualized salaries for {annualized} jobs")
+
+        geo.configure(config.get("location", {}).get("gazetteer"))
+        located = backfill_locations(session)
+        if located:
+            logger.info(f"Resolved locations for {located} jobs")
+
+    if moved and db.is_sqlite:
+        # Reclaim space freed by moved payloads; VACUUM rewrites the whole
+        # file, so skip it when nothing was moved
+        connection = db.writer_engine.raw_connection()
+        try:
+            connection.cursor().execute("VACUUM")
+        finally:
+            connection.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print("Migrating database...")
+    run_migrations()
+    print("Database migration complete!")
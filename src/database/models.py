@@ -1,7 +1,23 @@
 """Database models for job search agent."""
 
+import hashlib
+import re
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, JSON
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    Float,
+    Boolean,
+    JSON,
+    LargeBinary,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+    true,
+)
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -11,15 +27,23 @@ class Job(Base):
     """Job posting model."""
 
     __tablename__ = "jobs"
+    # Radius searches range-scan latitude and check longitude in the index
+    __table_args__ = (Index("ix_jobs_lat_lon", "latitude", "longitude"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     external_id = Column(String(255), unique=True, nullable=False, index=True)
     source = Column(String(50), nullable=False, index=True)  # indeed, linkedin, etc.
+    content_hash = Column(String(64), index=True)  # Same posting across sources
 
     # Basic job info
     title = Column(String(255), nullable=False, index=True)
     company = Column(String(255), nullable=False, index=True)
     location = Column(String(255))
+    # Resolved from location by utils.geo; coordinates only for known cities
+    latitude = Column(Float)
+    longitude = Column(Float)
+    region = Column(String(10))  # ISO 3166-2, e.g. US-CA
+    country = Column(String(2))  # ISO 3166-1 alpha-2
     description = Column(Text)
     url = Column(String(512))
 
@@ -29,6 +53,10 @@ class Job(Base):
     salary_min = Column(Float)
     salary_max = Column(Float)
     salary_currency = Column(String(10), default="USD")
+    salary_period = Column(String(10))  # hour, day, week, month, year
+    # Annualized in the configured base currency (see utils.salary)
+    annual_salary_min = Column(Float, index=True)
+    annual_salary_max = Column(Float, index=True)
 
     # Requirements
     required_skills = Column(JSON)  # List of skills
@@ -41,17 +69,29 @@ class Job(Base):
     match_score = Column(Float)  # If matching against user profile
 
     # Metadata
-    posted_date = Column(DateTime)
+    posted_date = Column(DateTime, index=True)
     scraped_date = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_date = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = Column(Boolean, default=True)
+    # Last liveness check of the posting URL (see agents.liveness_sweeper)
+    last_checked_date = Column(DateTime)
 
-    # Raw data
-    raw_data = Column(JSON)  # Store original API response
+    # Raw data: original API response (plus AI analysis) lives compressed
+    # in job_payloads and is only loaded on demand
+    payload_hash = Column(String(64))
 
     def __repr__(self):
         return f"<Job(id={self.id}, title='{self.title}', company='{self.company}')>"
 
+    @staticmethod
+    def make_content_hash(title, company, description) -> str:
+        """Hash of the normalized posting text, independent of source and ID."""
+        text = "\x1f".join(
+            re.sub(r"\s+", " ", (value or "").strip().lower())
+            for value in (title, company, description)
+        )
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
     def to_dict(self):
         """Convert job to dictionary."""
         return {
@@ -61,6 +101,10 @@ class Job(Base):
             "title": self.title,
             "company": self.company,
             "location": self.location,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "region": self.region,
+            "country": self.country,
             "description": self.description,
             "url": self.url,
             "job_type": self.job_type,
@@ -68,6 +112,9 @@ class Job(Base):
             "salary_min": self.salary_min,
             "salary_max": self.salary_max,
             "salary_currency": self.salary_currency,
+            "salary_period": self.salary_period,
+            "annual_salary_min": self.annual_salary_min,
+            "annual_salary_max": self.annual_salary_max,
             "required_skills": self.required_skills,
             "required_experience_years": self.required_experience_years,
             "education_level": self.education_level,
@@ -78,8 +125,59 @@ class Job(Base):
             "scraped_date": self.scraped_date.isoformat() if self.scraped_date else None,
             "updated_date": self.updated_date.isoformat() if self.updated_date else None,
             "is_active": self.is_active,
+            "last_checked_date": (
+                self.last_checked_date.isoformat() if self.last_checked_date else None
+            ),
         }
 
+    def to_summary(self):
+        """Convert job to a compact dictionary for list responses."""
+        return {
+            "id": self.id,
+            "external_id": self.external_id,
+            "source": self.source,
+            "title": self.title,
+            "company": self.company,
+            "location": self.location,
+            "url": self.url,
+            "ai_summary": self.ai_summary,
+            "posted_date": self.posted_date.isoformat() if self.posted_date else None,
+        }
+
+
+# Listings and stats only read active rows; partial indexes keep them small
+# as expired postings accumulate. Queries must filter on ``ACTIVE_JOBS``
+# (a literal, not a bound parameter) for the planner to use them.
+ACTIVE_JOBS = Job.is_active == true()
+Index(
+    "ix_jobs_active_scraped_date",
+    Job.scraped_date,
+    sqlite_where=ACTIVE_JOBS,
+    postgresql_where=ACTIVE_JOBS,
+)
+Index(
+    "ix_jobs_active_source_scraped_date",
+    Job.source,
+    Job.scraped_date,
+    sqlite_where=ACTIVE_JOBS,
+    postgresql_where=ACTIVE_JOBS,
+)
+
+
+class JobPayload(Base):
+    """Compressed, content-addressed raw job payload."""
+
+    __tablename__ = "job_payloads"
+
+    content_hash = Column(String(64), primary_key=True)  # sha256 of canonical JSON
+    codec = Column(String(10), nullable=False)  # zstd or zlib
+    size = Column(Integer)  # Uncompressed size in bytes
+    data = Column(LargeBinary, nullable=False)
+    created_date = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<JobPayload(hash='{self.content_hash[:12]}', codec='{self.codec}')>"
+
 
 class SearchHistory(Base):
     """Track search queries."""
@@ -87,17 +185,147 @@ class SearchHistory(Base):
     __tablename__ = "search_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
+    search_id = Column(String(32), index=True)  # Groups per-platform rows of one search
     keywords = Column(String(255), nullable=False)
     location = Column(String(255))
     source = Column(String(50))
     results_count = Column(Integer)
-    search_date = Column(DateTime, default=datetime.utcnow, nullable=False)
+    search_date = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     parameters = Column(JSON)  # Store all search parameters
 
+    # AI analysis usage for this source's results
+    llm_calls = Column(Integer)
+    llm_input_tokens = Column(Integer)
+    llm_output_tokens = Column(Integer)
+    llm_cost_usd = Column(Float)
+
     def __repr__(self):
         return f"<SearchHistory(keywords='{self.keywords}', location='{self.location}')>"
 
 
+class SearchWatermark(Base):
+    """Newest posting seen per (query, source) for incremental crawls."""
+
+    __tablename__ = "search_watermarks"
+    __table_args__ = (UniqueConstraint("keywords", "location", "source"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    keywords = Column(String(255), nullable=False)
+    location = Column(String(255), nullable=False, default="")
+    source = Column(String(50), nullable=False)
+    latest_posted_date = Column(DateTime)
+    seen_ids = Column(JSON)  # Most recent external_ids, newest first
+    updated_date = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<SearchWatermark(keywords='{self.keywords}', source='{self.source}')>"
+
+
+class SearchResult(Base):
+    """Jobs returned by a search, for server-side paging of results."""
+
+    __tablename__ = "search_results"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    search_id = Column(String(32), nullable=False, index=True)
+    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
+    is_new = Column(Boolean, default=False)  # First seen in this search
+
+    def __repr__(self):
+        return f"<SearchResult(search_id='{self.search_id}', job_id={self.job_id})>"
+
+
+class SweepRun(Base):
+    """One scheduled keyword x location sweep; persisted so restarts resume."""
+
+    __tablename__ = "sweep_runs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    cycle_id = Column(String(32), nullable=False, index=True)
+    keywords = Column(String(255), nullable=False)
+    location = Column(String(255))
+    status = Column(String(20), nullable=False, default="pending", index=True)
+    scheduled_for = Column(DateTime, nullable=False)
+    started_date = Column(DateTime)
+    finished_date = Column(DateTime)
+    search_id = Column(String(32))
+    results_count = Column(Integer)
+    new_jobs_count = Column(Integer)
+    error = Column(Text)
+    created_date = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<SweepRun(keywords='{self.keywords}', location='{self.location}', status='{self.status}')>"
+
+
+class ImportRun(Base):
+    """Progress of one bulk import file; persisted so interrupted imports resume."""
+
+    __tablename__ = "import_runs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    path = Column(String(1024), nullable=False)
+    # Path, size and mtime of the file; a changed file starts a new run
+    fingerprint = Column(String(64), nullable=False, unique=True)
+    format = Column(String(10), nullable=False)
+    status = Column(String(20), nullable=False, default="running")
+    rows_read = Column(Integer, nullable=False, default=0)  # Input records consumed
+    rows_inserted = Column(Integer, nullable=False, default=0)
+    rows_duplicate = Column(Integer, nullable=False, default=0)
+    rows_invalid = Column(Integer, nullable=False, default=0)
+    started_date = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_date = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_date = Column(DateTime)
+
+    def __repr__(self):
+        return f"<ImportRun(path='{self.path}', status='{self.status}')>"
+
+
+class Task(Base):
+    """One unit of work in the shared queue that ``--worker`` processes pull."""
+
+    __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_status_available", "status", "available_date"),
+        Index("ix_tasks_status_lease", "status", "lease_expires"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(20), nullable=False)  # search or analyze
+    payload = Column(JSON)
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)  # Claims so far
+    max_attempts = Column(Integer, nullable=False, default=3)
+    available_date = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Worker holding the task; the lease lapses unless it keeps heartbeating
+    lease_owner = Column(String(100))
+    lease_expires = Column(DateTime)
+    heartbeat_date = Column(DateTime)
+    result = Column(JSON)
+    error = Column(Text)
+    created_date = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_date = Column(DateTime)
+    finished_date = Column(DateTime)
+
+    def __repr__(self):
+        return f"<Task(id={self.id}, kind='{self.kind}', status='{self.status}')>"
+
+
+class QuotaWindow(Base):
+    """Calls made against one rate limit in one window, shared by all workers."""
+
+    __tablename__ = "quota_windows"
+    __table_args__ = (UniqueConstraint("name", "window_start"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(100), nullable=False)
+    window_start = Column(DateTime, nullable=False)
+    calls = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<QuotaWindow(name='{self.name}', calls={self.calls})>"
+
+
 class UserProfile(Base):
     """User profile for job matching."""
 
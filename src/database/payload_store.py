@@ -0,0 +1,128 @@
+"""Compressed, content-addressed storage for raw job payloads."""
+
+import hashlib
+import json
+import logging
+import zlib
+from typing import Any, Dict, List, Optional
+
+from ..utils import json_backend
+from .models import JobPayload
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+
+    _ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=9)
+    _ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+    DEFAULT_CODEC = "zstd"
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+    DEFAULT_CODEC = "zlib"
+
+
+def _canonical_json(data: Any) -> bytes:
+    """Serialize payload deterministically so equal payloads hash equally."""
+    return json.dumps(
+        data, sort_keys=True, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+def _compress(raw: bytes, codec: str) -> bytes:
+    """Compress bytes with the given codec."""
+    if codec == "zstd":
+        return _ZSTD_COMPRESSOR.compress(raw)
+    return zlib.compress(raw, 6)
+
+
+def _decompress(blob: bytes, codec: str) -> bytes:
+    """Decompress bytes written with the given codec."""
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError(
+                "Payload is zstd-compressed but zstandard is not installed. "
+                "Install with: pip install zstandard"
+            )
+        return _ZSTD_DECOMPRESSOR.decompress(blob)
+    return zlib.decompress(blob)
+
+
+def encode_payload(data: Any) -> JobPayload:
+    """
+    Build a JobPayload row for the given payload.
+
+    Args:
+        data: JSON-serializable payload
+
+    Returns:
+        Unsaved JobPayload instance
+    """
+    raw = _canonical_json(data)
+    return JobPayload(
+        content_hash=hashlib.sha256(raw).hexdigest(),
+        codec=DEFAULT_CODEC,
+        size=len(raw),
+        data=_compress(raw, DEFAULT_CODEC),
+    )
+
+
+def store_payloads(session, payloads: List[Any]) -> List[Optional[str]]:
+    """
+    Store payloads, skipping any whose content is already present.
+
+    Another process may store the same content between the lookup and the
+    insert; run the enclosing transaction with ``db.retry_on_conflict``.
+
+    Args:
+        session: Database session
+        payloads: List of payloads (None entries are passed through)
+
+    Returns:
+        List of content hashes aligned with ``payloads``
+    """
+    hashes = []
+    pending = {}
+
+    for data in payloads:
+        if data is None:
+            hashes.append(None)
+            continue
+        row = encode_payload(data)
+        hashes.append(row.content_hash)
+        pending.setdefault(row.content_hash, row)
+
+    if pending:
+        existing = {
+            content_hash
+            for (content_hash,) in session.query(JobPayload.content_hash).filter(
+                JobPayload.content_hash.in_(list(pending))
+            )
+        }
+        session.add_all(
+            row for content_hash, row in pending.items() if content_hash not in existing
+        )
+
+    return hashes
+
+
+def load_payload(session, content_hash: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Load and decompress a stored payload.
+
+    Args:
+        session: Database session
+        content_hash: Hash returned by store_payloads
+
+    Returns:
+        Decoded payload, or None if missing
+    """
+    if not content_hash:
+        return None
+
+    row = session.get(JobPayload, content_hash)
+    if row is None:
+        logger.warning(f"Payload {content_hash} not found")
+        return None
+
+    return json_backend.loads(_decompress(row.data, row.codec))
@@ -0,0 +1,127 @@
+"""Provider rate limits counted in the database, shared across processes."""
+
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+
+from .database import db
+from .models import QuotaWindow
+
+logger = logging.getLogger(__name__)
+
+# Finished windows are deleted once they are this old
+QUOTA_RETENTION = timedelta(days=1)
+
+# Random delay added when waiting for the next window, so workers that are
+# all waiting do not hit the database at the same instant
+QUOTA_JITTER_SECONDS = 0.5
+
+
+class SharedRateLimiter:
+    """
+    Fixed-window rate limit whose call counts live in the ``quota_windows``
+    table, so every worker process and machine draws on one budget.
+
+    Drop-in replacement for ``utils.rate_limit.RateLimiter`` (same
+    ``try_acquire`` / ``acquire`` interface). Unlike the token bucket, calls
+    are not smoothed within a window: up to ``calls`` may run back to back
+    at the start of each window.
+    """
+
+    def __init__(self, name: str, calls: float, period: float = 60.0):
+        """
+        Initialize shared rate limiter.
+
+        Args:
+            name: Limit name; processes using the same name share the budget
+            calls: Calls allowed per period (must be positive)
+            period: Window length in seconds
+        """
+        if calls <= 0 or period <= 0:
+            raise ValueError("calls and period must be positive")
+        self.name = name
+        self.calls = max(int(calls), 1)
+        self.period = period
+
+    def _window_start(self, now: float) -> datetime:
+        """Start of the window containing a UNIX timestamp (naive UTC)."""
+        return datetime.utcfromtimestamp(now - now % self.period)
+
+    def _take(self, window_start: datetime) -> bool:
+        """Count one call against a window if it has room."""
+        with db.get_write_session() as session:
+            taken = (
+                session.query(QuotaWindow)
+                .filter(
+                    QuotaWindow.name == self.name,
+                    QuotaWindow.window_start == window_start,
+                    QuotaWindow.calls < self.calls,
+                )
+                .update(
+                    {QuotaWindow.calls: QuotaWindow.calls + 1},
+                    synchronize_session=False,
+                )
+            )
+            if taken:
+                return True
+
+            exists = (
+                session.query(QuotaWindow.id)
+                .filter(
+                    QuotaWindow.name == self.name,
+                    QuotaWindow.window_start == window_start,
+                )
+                .first()
+            )
+            if exists:
+                return False
+
+            # First call of the window: open it and drop old windows
+            session.add(
+                QuotaWindow(name=self.name, window_start=window_start, calls=1)
+            )
+            session.query(QuotaWindow).filter(
+                QuotaWindow.name == self.name,
+                QuotaWindow.window_start < window_start - QUOTA_RETENTION,
+            ).delete(synchronize_session=False)
+            return True
+
+    def try_acquire(self) -> bool:
+        """Take a call slot in the current window if one is free, without waiting."""
+        window_start = self._window_start(time.time())
+        try:
+            return self._take(window_start)
+        except IntegrityError:
+            # Another process opened the window first
+            return self._take(window_start)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a call slot.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True once a slot was taken, False if the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while not self.try_acquire():
+            now = time.time()
+            wait = self.period - now % self.period + random.uniform(
+                0, QUOTA_JITTER_SECONDS
+            )
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            logger.debug("Quota '%s' used up, waiting %.1fs", self.name, wait)
+            time.sleep(wait)
+
+        return True
@@ -0,0 +1,305 @@
+"""Database-backed task queue with leases, shared by every worker process."""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import func
+
+from ..utils import metrics
+from .database import db
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+TASKS_ENQUEUED_TOTAL = metrics.counter(
+    "jobsearch_tasks_enqueued_total",
+    "Tasks added to the shared queue by kind",
+    ["kind"],
+)
+TASK_LEASES_EXPIRED_TOTAL = metrics.counter(
+    "jobsearch_task_leases_expired_total",
+    "Tasks re-claimed (or failed) after their worker stopped heartbeating",
+    ["kind"],
+)
+
+# Candidate rows read per claim; rows locked by other workers are skipped
+CLAIM_CANDIDATES = 10
+
+
+class TaskQueue:
+    """
+    Queue of search and analysis tasks stored in the ``tasks`` table.
+
+    A worker claims a task by taking a lease on it (``lease_owner`` and
+    ``lease_expires``) and extends the lease with heartbeats while it
+    works. Tasks whose lease expired (the worker crashed, hung or lost its
+    machine) are claimed again by the next worker, so every task runs at
+    least once. Each claim counts as an attempt; failed tasks are retried
+    with exponential backoff until ``max_attempts``.
+
+    Claims are safe across processes and machines: SQLite serializes them
+    on the writer connection (BEGIN IMMEDIATE), other databases lock the
+    claimed row with SELECT ... FOR UPDATE SKIP LOCKED.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize task queue.
+
+        Args:
+            config: Configuration dictionary (uses the ``worker`` section)
+        """
+        worker_config = (config or {}).get("worker", {})
+        self.lease = timedelta(seconds=worker_config.get("lease_seconds", 120))
+        self.max_attempts = worker_config.get("max_attempts", 3)
+        self.retry_delay = worker_config.get("retry_delay_seconds", 60)
+
+    def enqueue(self, kind: str, payload: Dict[str, Any]) -> int:
+        """
+        Add one task.
+
+        Args:
+            kind: Task kind ("search" or "analyze")
+            payload: JSON-serializable task arguments
+
+        Returns:
+            Task ID
+        """
+        return self.enqueue_many(kind, [payload])[0]
+
+    def enqueue_many(self, kind: str, payloads: Iterable[Dict[str, Any]]) -> List[int]:
+        """
+        Add tasks of one kind in a single transaction.
+
+        Args:
+            kind: Task kind ("search" or "analyze")
+            payloads: JSON-serializable task arguments, one per task
+
+        Returns:
+            Task IDs in payload order
+        """
+        now = datetime.utcnow()
+        tasks = [
+            Task(
+                kind=kind,
+                payload=payload,
+                status="pending",
+                attempts=0,
+                max_attempts=self.max_attempts,
+                available_date=now,
+                created_date=now,
+            )
+            for payload in payloads
+        ]
+        if not tasks:
+            return []
+
+        with db.get_write_session() as session:
+            session.add_all(tasks)
+            session.flush()
+            ids = [task.id for task in tasks]
+
+        TASKS_ENQUEUED_TOTAL.labels(kind).inc(len(ids))
+        return ids
+
+    def _candidates(self, session, kinds: Optional[List[str]], now: datetime):
+        """Claimable tasks: expired leases first, then pending tasks in order."""
+        expired = session.query(Task).filter(
+            Task.status == "running", Task.lease_expires < now
+        )
+        pending = session.query(Task).filter(
+            Task.status == "pending", Task.available_date <= now
+        )
+        if kinds:
+            expired = expired.filter(Task.kind.in_(kinds))
+            pending = pending.filter(Task.kind.in_(kinds))
+
+        expired = expired.order_by(Task.lease_expires)
+        pending = pending.order_by(Task.available_date, Task.id)
+        for query in (expired, pending):
+            query = query.limit(CLAIM_CANDIDATES)
+            if not db.is_sqlite:
+                query = query.with_for_update(skip_locked=True)
+            yield from query
+
+    def claim(
+        self,
+        worker_id: str,
+        kinds: Optional[List[str]] = None,
+        now: Optional[datetime] = None,
+    ) -> Optional[Task]:
+        """
+        Lease the next available task.
+
+        Tasks whose lease expired after their last attempt are marked
+        failed instead of being claimed again.
+
+        Args:
+            worker_id: Unique ID of the claiming worker
+            kinds: Only claim these task kinds (default: any)
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            The claimed task (detached from its session), or None if no
+            task is available
+        """
+        now = now or datetime.utcnow()
+        with db.get_write_session() as session:
+            for task in self._candidates(session, kinds, now):
+                if task.status == "running":
+                    TASK_LEASES_EXPIRED_TOTAL.labels(task.kind).inc()
+                    logger.warning(
+                        f"Lease of task {task.id} held by {task.lease_owner} expired"
+                    )
+                    if task.attempts >= task.max_attempts:
+                        task.status = "failed"
+                        task.error = (
+                            f"Lease expired on each of {task.attempts} attempt(s)"
+                        )
+                        task.lease_owner = None
+                        task.lease_expires = None
+                        task.finished_date = now
+                        continue
+
+                task.status = "running"
+                task.attempts += 1
+                task.lease_owner = worker_id
+                task.lease_expires = now + self.lease
+                task.heartbeat_date = now
+                task.started_date = now
+                session.flush()
+                session.expunge(task)
+                return task
+
+        return None
+
+    def _owned(self, session, task_id: int, worker_id: str):
+        """Query for a running task still leased by worker_id."""
+        return session.query(Task).filter(
+            Task.id == task_id,
+            Task.status == "running",
+            Task.lease_owner == worker_id,
+        )
+
+    def heartbeat(
+        self, task_id: int, worker_id: str, now: Optional[datetime] = None
+    ) -> bool:
+        """
+        Extend a lease.
+
+        Args:
+            task_id: Task ID
+            worker_id: Worker holding the lease
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            False if the lease was lost (expired and claimed elsewhere)
+        """
+        now = now or datetime.utcnow()
+        with db.get_write_session() as session:
+            updated = self._owned(session, task_id, worker_id).update(
+                {"lease_expires": now + self.lease, "heartbeat_date": now},
+                synchronize_session=False,
+            )
+        return updated == 1
+
+    def complete(
+        self, task_id: int, worker_id: str, result: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Mark a leased task completed.
+
+        Args:
+            task_id: Task ID
+            worker_id: Worker holding the lease
+            result: JSON-serializable task result
+
+        Returns:
+            False if the lease was lost, in which case the result is dropped
+            and the task's new owner records its own
+        """
+        with db.get_write_session() as session:
+            updated = self._owned(session, task_id, worker_id).update(
+                {
+                    "status": "completed",
+                    "result": result,
+                    "error": None,
+                    "lease_owner": None,
+                    "lease_expires": None,
+                    "finished_date": datetime.utcnow(),
+                },
+                synchronize_session=False,
+            )
+        return updated == 1
+
+    def fail(self, task_id: int, worker_id: str, error: str) -> Optional[str]:
+        """
+        Record a failed attempt, scheduling a retry if attempts remain.
+
+        Retries wait ``retry_delay_seconds``, doubled after each attempt.
+
+        Args:
+            task_id: Task ID
+            worker_id: Worker holding the lease
+            error: Error message
+
+        Returns:
+            The task's new status ("pending" or "failed"), or None if the
+            lease was lost
+        """
+        now = datetime.utcnow()
+        with db.get_write_session() as session:
+            task = self._owned(session, task_id, worker_id).first()
+            if task is None:
+                return None
+
+            task.error = error
+            task.lease_owner = None
+            task.lease_expires = None
+            if task.attempts >= task.max_attempts:
+                task.status = "failed"
+                task.finished_date = now
+            else:
+                task.status = "pending"
+                task.available_date = now + timedelta(
+                    seconds=self.retry_delay * 2 ** (task.attempts - 1)
+                )
+            return task.status
+
+    def release(self, task_id: int, worker_id: str) -> bool:
+        """
+        Hand a leased task back without counting the attempt (on shutdown).
+
+        Args:
+            task_id: Task ID
+            worker_id: Worker holding the lease
+
+        Returns:
+            False if the lease was already lost
+        """
+        with db.get_write_session() as session:
+            updated = self._owned(session, task_id, worker_id).update(
+                {
+                    "status": "pending",
+                    "attempts": Task.attempts - 1,
+                    "lease_owner": None,
+                    "lease_expires": None,
+                    "available_date": datetime.utcnow(),
+                },
+                synchronize_session=False,
+            )
+        return updated == 1
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Number of tasks per status.
+
+        Returns:
+            Dictionary of status to count
+        """
+        with db.get_session() as session:
+            rows = session.query(Task.status, func.count(Task.id)).group_by(
+                Task.status
+            )
+            return {status: count for status, count in rows}
@@ -0,0 +1,502 @@
+"""
+Persisted approximate nearest-neighbour index over job embeddings.
+
+The index is an inverted file (IVF): vectors are clustered with spherical
+k-means and a query only scores the jobs in the ``nprobe`` clusters whose
+centroids are closest to it. Vectors are stored as int8 (one byte per
+dimension), so a million 256-dimension jobs take about 256 MB.
+
+On disk, a directory holds one generation of files::
+
+    meta.json                 dim, generation, jobs at last training
+    vectors-<gen>.i8          int8 rows, append-only
+    ids-<gen>.i64             job id per row, append-only
+    lists-<gen>.i32           cluster per row, append-only (once trained)
+    centroids-<gen>.npy
+
+Saving jobs appends rows under an exclusive file lock, so several processes
+(API server, scheduler, CLI) can share one index; readers pick up appended
+rows and new generations on their next query. Clustering is (re)trained
+when the index first reaches ``train_size`` jobs and again each time it
+grows ``RETRAIN_GROWTH``-fold; ``--build-index`` rebuilds it from the
+database.
+
+A job saved twice (re-embedded) keeps its most recent row.
+"""
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..utils.embeddings import EMBEDDING_DIM, np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Clusters scanned per query
+DEFAULT_NPROBE = 16
+
+# Jobs in the index before it is clustered (smaller indexes are scanned fully)
+TRAIN_SIZE = 10000
+
+# Re-cluster when the index has grown this many times since the last training
+RETRAIN_GROWTH = 4
+
+# k-means: clusters per sqrt(jobs), training sample per cluster, iterations
+CLUSTERS_PER_SQRT = 2
+SAMPLE_PER_CLUSTER = 64
+KMEANS_ITERATIONS = 10
+
+# Rows scored per matrix product while training or rebuilding
+ASSIGN_CHUNK_SIZE = 8192
+
+_INITIAL_CAPACITY = 1024
+
+
+def default_index_path(database_url: Optional[str]) -> str:
+    """Index directory next to a SQLite database file, else ./vector_index."""
+    prefix = "sqlite:///"
+    if database_url and database_url.startswith(prefix):
+        path = database_url[len(prefix):]
+        if path and path != ":memory:":
+            return f"{path}.vectors"
+    return "vector_index"
+
+
+def quantize(vectors):
+    """Scale float rows to int8 (per-row scale; cosine is scale-invariant)."""
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    peak = np.abs(vectors).max(axis=1, keepdims=True)
+    peak[peak == 0] = 1.0
+    return np.rint(vectors * (127.0 / peak)).astype(np.int8)
+
+
+def _norms(rows):
+    """L2 norms of int8 rows (1 for empty rows, to avoid dividing by zero)."""
+    norms = np.linalg.norm(rows.astype(np.float32), axis=1)
+    norms[norms == 0] = 1.0
+    return norms
+
+
+def _normalize(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class VectorIndex:
+    """IVF index of int8 job vectors, persisted in a directory."""
+
+    def __init__(
+        self,
+        path: str,
+        dim: int = EMBEDDING_DIM,
+        nprobe: int = DEFAULT_NPROBE,
+        train_size: int = TRAIN_SIZE,
+    ):
+        """
+        Open (or create) an index.
+
+        Args:
+            path: Index directory
+            dim: Vector dimension
+            nprobe: Clusters scanned per query
+            train_size: Jobs in the index before it is clustered
+
+        Raises:
+            RuntimeError: If numpy is not installed
+        """
+        if np is None:
+            raise RuntimeError("Semantic search requires numpy (pip install numpy)")
+
+        self.path = path
+        self.dim = dim
+        self.nprobe = nprobe
+        self.train_size = train_size
+
+        self._lock = threading.RLock()
+        self._meta_mtime = None
+        self._reset({"dim": dim, "generation": 0, "trained_count": 0})
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[Dict[str, Any]], database_url: Optional[str] = None
+    ) -> Optional["VectorIndex"]:
+        """
+        Build the index from the ``semantic`` config section.
+
+        Args:
+            config: ``semantic`` section
+            database_url: Database URL, for the default index location
+
+        Returns:
+            The index, or None if semantic search is disabled or numpy is
+            not installed
+        """
+        config = config or {}
+        if not config.get("enabled", True):
+            return None
+        if np is None:
+            logger.warning("numpy is not installed; semantic search is disabled")
+            return None
+        return cls(
+            config.get("index_path") or default_index_path(database_url),
+            nprobe=config.get("nprobe", DEFAULT_NPROBE),
+            train_size=config.get("train_size", TRAIN_SIZE),
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return self._count
+
+    def _file(self, name: str, generation: Optional[int] = None) -> str:
+        if generation is None:
+            generation = self._meta["generation"]
+        stem, extension = name.split(".")
+        return os.path.join(self.path, f"{stem}-{generation}.{extension}")
+
+    def _read_meta(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.path, "meta.json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write_meta(self, meta: Dict[str, Any]):
+        """Replace meta.json atomically (readers see the old or new generation)."""
+        target = os.path.join(self.path, "meta.json")
+        with open(f"{target}.tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(f"{target}.tmp", target)
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock across processes for appends and new generations."""
+        os.makedirs(self.path, exist_ok=True)
+        with self._lock, open(os.path.join(self.path, "lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _stored_count(self) -> int:
+        """Rows fully written to every file of the current generation."""
+        counts = [
+            os.path.getsize(self._file("ids.i64")) // 8,
+            os.path.getsize(self._file("vectors.i8")) // self.dim,
+        ]
+        if self._centroids is not None:
+            counts.append(os.path.getsize(self._file("lists.i32")) // 4)
+        return min(counts)
+
+    def _reset(self, meta: Dict[str, Any]):
+        self._meta = meta
+        self._count = 0
+        self._vectors = np.zeros((_INITIAL_CAPACITY, self.dim), dtype=np.int8)
+        self._ids = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._lists = np.zeros(_INITIAL_CAPACITY, dtype=np.int32)
+        self._norms = np.ones(_INITIAL_CAPACITY, dtype=np.float32)
+        self._centroids = None
+        # Row positions per cluster, built on first query
+        self._members: Optional[List[Any]] = None
+        self._pending: List[List[int]] = []
+
+    def _reserve(self, count: int):
+        """Grow the row arrays to hold ``count`` rows (capacity doubling)."""
+        capacity = len(self._ids)
+        if count <= capacity:
+            return
+        while capacity < count:
+            capacity *= 2
+
+        def grow(array):
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[: self._count] = array[: self._count]
+            return grown
+
+        self._vectors = grow(self._vectors)
+        self._ids = grow(self._ids)
+        self._lists = grow(self._lists)
+        self._norms = grow(self._norms)
+
+    def _append_rows(self, ids, rows, lists=None):
+        """Append rows in memory."""
+        start, end = self._count, self._count + len(ids)
+        self._reserve(end)
+        self._vectors[start:end] = rows
+        self._ids[start:end] = ids
+        self._norms[start:end] = _norms(rows)
+        if lists is not None:
+            self._lists[start:end] = lists
+            if self._members is not None:
+                for position, cluster in zip(range(start, end), lists):
+                    self._pending[cluster].append(position)
+        self._count = end
+
+    def _read_rows(self, start: int, end: int):
+        """Read rows [start, end) of the current generation from disk."""
+        count = end - start
+        ids = np.fromfile(
+            self._file("ids.i64"), dtype=np.int64, count=count, offset=start * 8
+        )
+        rows = np.fromfile(
+            self._file("vectors.i8"),
+            dtype=np.int8,
+            count=count * self.dim,
+            offset=start * self.dim,
+        ).reshape(count, self.dim)
+        lists = None
+        if self._centroids is not None:
+            lists = np.fromfile(
+                self._file("lists.i32"), dtype=np.int32, count=count, offset=start * 4
+            )
+        return ids, rows, lists
+
+    def _refresh(self):
+        """Pick up a new generation or rows appended by other processes."""
+        try:
+            self._load_changes()
+        except FileNotFoundError:
+            # A new generation replaced the files between reads; load it
+            self._meta_mtime = None
+            self._load_changes()
+
+    def _load_changes(self):
+        meta_path = os.path.join(self.path, "meta.json")
+        try:
+            mtime = os.stat(meta_path).st_mtime_ns
+        except FileNotFoundError:
+            return
+
+        if mtime != self._meta_mtime:
+            meta = self._read_meta()
+            if meta["dim"] != self.dim:
+                raise ValueError(
+                    f"Index at {self.path} has dimension {meta['dim']}, "
+                    f"expected {self.dim}; rebuild it with --build-index"
+                )
+            if meta["generation"] != self._meta["generation"] or not self._meta_mtime:
+                self._reset(meta)
+                if meta["trained_count"]:
+                    self._centroids = np.load(self._file("centroids.npy"))
+            self._meta = meta
+            self._meta_mtime = mtime
+
+        stored = self._stored_count()
+        if stored > self._count:
+            self._append_rows(*self._read_rows(self._count, stored))
+
+    def _assign(self, rows) -> Any:
+        """Nearest centroid of each int8 row."""
+        clusters = np.empty(len(rows), dtype=np.int32)
+        for start in range(0, len(rows), ASSIGN_CHUNK_SIZE):
+            chunk = rows[start:start + ASSIGN_CHUNK_SIZE].astype(np.float32)
+            clusters[start:start + len(chunk)] = np.argmax(
+                chunk @ self._centroids.T, axis=1
+            )
+        return clusters
+
+    def _train(self):
+        """Cluster the current rows and write them as a new generation."""
+        count = self._count
+        clusters = max(1, int(CLUSTERS_PER_SQRT * count ** 0.5))
+        rng = np.random.default_rng(count)
+        sample_size = min(count, clusters * SAMPLE_PER_CLUSTER)
+        sample = _normalize(
+            self._vectors[rng.choice(count, sample_size, replace=False)].astype(
+                np.float32
+            )
+        )
+
+        # Spherical k-means: assign by dot product, centroids renormalized
+        centroids = sample[rng.choice(sample_size, clusters, replace=False)]
+        for _ in range(KMEANS_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(assignment, kind="stable")
+            filled, starts = np.unique(assignment[order], return_index=True)
+            centroids[filled] = _normalize(np.add.reduceat(sample[order], starts))
+
+        self._centroids = centroids.astype(np.float32)
+        lists = self._assign(self._vectors[:count])
+        self._lists[:count] = lists
+        self._members = None
+        self._write_generation(trained_count=count)
+        logger.info(f"Clustered vector index: {count:,} jobs in {clusters:,} clusters")
+
+    def _write_generation(self, trained_count: int):
+        """Write all rows as the next generation and switch meta.json to it."""
+        old_generation = self._meta["generation"]
+        meta = {
+            "dim": self.dim,
+            "generation": old_generation + 1,
+            "trained_count": trained_count,
+        }
+        count = self._count
+        self._vectors[:count].tofile(self._file("vectors.i8", meta["generation"]))
+        self._ids[:count].tofile(self._file("ids.i64", meta["generation"]))
+        if self._centroids is not None:
+            self._lists[:count].tofile(self._file("lists.i32", meta["generation"]))
+            np.save(self._file("centroids.npy", meta["generation"]), self._centroids)
+        self._write_meta(meta)
+        self._meta = meta
+        self._meta_mtime = os.stat(os.path.join(self.path, "meta.json")).st_mtime_ns
+
+        for name in ("vectors.i8", "ids.i64", "lists.i32", "centroids.npy"):
+            try:
+                os.remove(self._file(name, old_generation))
+            except FileNotFoundError:
+                pass
+
+    def add(self, ids: Sequence[int], vectors):
+        """
+        Append job vectors and persist them.
+
+        Args:
+            ids: Job IDs
+            vectors: Float vectors aligned with ``ids`` (see embeddings.embed)
+        """
+        if not len(ids):
+            return
+
+        rows = quantize(vectors)
+        ids = np.asarray(ids, dtype=np.int64)
+
+        with self._file_lock():
+            self._refresh()
+            if self._read_meta() is None:
+                self._write_generation(trained_count=0)
+            else:
+                # Drop rows left half-written by an interrupted writer
+                stored = self._stored_count()
+                for name, size in (("ids.i64", 8), ("vectors.i8", self.dim)):
+                    with open(self._file(name), "ab") as f:
+                        f.truncate(stored * size)
+                if self._centroids is not None:
+                    with open(self._file("lists.i32"), "ab") as f:
+                        f.truncate(stored * 4)
+
+            lists = self._assign(rows) if self._centroids is not None else None
+            if lists is not None:
+                with open(self._file("lists.i32"), "ab") as f:
+                    lists.tofile(f)
+            with open(self._file("vectors.i8"), "ab") as f:
+                rows.tofile(f)
+            with open(self._file("ids.i64"), "ab") as f:
+                ids.tofile(f)
+            self._append_rows(ids, rows, lists)
+
+            trained_count = self._meta["trained_count"]
+            if (not trained_count and self._count >= self.train_size) or (
+                trained_count and self._count >= RETRAIN_GROWTH * trained_count
+            ):
+                self._train()
+
+    def rebuild(self, batches: Iterable[Tuple[Sequence[int], Any]]) -> int:
+        """
+        Replace the index contents.
+
+        Other processes keep appending while the batches are read; rows they
+        add for jobs newer than the rebuilt ones are carried over.
+
+        Args:
+            batches: (job ids, vectors) pairs covering every job
+
+        Returns:
+            Number of jobs indexed
+        """
+        rebuilt_ids = []
+        rebuilt_rows = []
+        for ids, vectors in batches:
+            if len(ids):
+                rebuilt_ids.append(np.asarray(ids, dtype=np.int64))
+                rebuilt_rows.append(quantize(vectors))
+
+        with self._file_lock():
+            self._refresh()
+            newest = max((int(ids.max()) for ids in rebuilt_ids), default=0)
+            newer = np.flatnonzero(self._ids[: self._count] > newest)
+            rebuilt_ids.append(self._ids[newer])
+            rebuilt_rows.append(self._vectors[newer])
+
+            self._reset(self._meta)
+            for ids, rows in zip(rebuilt_ids, rebuilt_rows):
+                if len(ids):
+                    self._append_rows(ids, rows)
+
+            if self._count >= self.train_size:
+                self._train()
+            else:
+                self._write_generation(trained_count=0)
+            return self._count
+
+    def _members_of(self, clusters) -> Any:
+        """Row positions in the given clusters."""
+        if self._members is None:
+            lists = self._lists[: self._count]
+            order = np.argsort(lists, kind="stable")
+            bounds = np.cumsum(np.bincount(lists, minlength=len(self._centroids)))
+            self._members = np.split(order, bounds[:-1])
+            self._pending = [[] for _ in self._members]
+
+        parts = []
+        for cluster in clusters:
+            parts.append(self._members[cluster])
+            if self._pending[cluster]:
+                parts.append(np.asarray(self._pending[cluster], dtype=np.int64))
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+    def search(
+        self, vector, k: int = 10, exclude: Iterable[int] = ()
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the jobs most similar to a vector.
+
+        Args:
+            vector: Query vector (see embeddings.embed_query)
+            k: Number of results
+            exclude: Job IDs to leave out
+
+        Returns:
+            Up to k (job id, cosine similarity) pairs, most similar first
+        """
+        query = np.asarray(vector, dtype=np.float32)
+
+        with self._lock:
+            self._refresh()
+            count = self._count
+            if not count or not query.any():
+                return []
+            if self._centroids is None:
+                positions = np.arange(count)
+            else:
+                probes = np.argsort(-(self._centroids @ query))[: self.nprobe]
+                positions = self._members_of(probes)
+            vectors = self._vectors[positions]
+            ids = self._ids[positions]
+            norms = self._norms[positions]
+
+        scores = (vectors.astype(np.float32) @ query) / norms
+
+        # Latest row per job, then drop excluded jobs
+        order = np.argsort(-positions, kind="stable")
+        _, first = np.unique(ids[order], return_index=True)
+        keep = order[first]
+        exclude = np.fromiter(exclude, dtype=np.int64)
+        if len(exclude):
+            keep = keep[~np.isin(ids[keep], exclude)]
+
+        if len(keep) > k:
+            keep = keep[np.argpartition(-scores[keep], k - 1)[:k]]
+        keep = keep[np.argsort(-scores[keep], kind="stable")]
+        return [(int(ids[i]), float(scores[i])) for i in keep]
@@ -2,11 +2,12 @@
 
 import argparse
 import json
+import sys
 from dotenv import load_dotenv
 
 from .agents import JobSearchAgent
-from .database import db
-from .utils import load_config, setup_logger
+from .database import db, export
+from .utils import configure_logging, load_config, metrics, profiling
 
 load_dotenv()
 
@@ -61,8 +62,7 @@ def main():
     parser.add_argument(
         "--limit",
         type=int,
-        default=50,
-        help="Limit number of results (default: 50)",
+        help="Limit number of results (default: 50, or all with --export)",
     )
 
     parser.add_argument(
@@ -79,22 +79,127 @@ def main():
         help="Output results to JSON file",
     )
 
+    parser.add_argument(
+        "--export",
+        type=str,
+        metavar="PATH",
+        help="Stream stored jobs to a file (use - for stdout)",
+    )
+
+    parser.add_argument(
+        "--import",
+        dest="import_paths",
+        nargs="+",
+        metavar="PATH",
+        help="Bulk load NDJSON, CSV or Parquet files of jobs into the database",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=sorted(export.EXPORT_FORMATS),
+        help="With --export or --import: ndjson, csv or parquet "
+        "(default: from the file extension)",
+    )
+
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="With --import: start over instead of resuming an earlier import",
+    )
+
+    parser.add_argument(
+        "--build-index",
+        action="store_true",
+        help="Rebuild the semantic search index from all stored jobs",
+    )
+
     parser.add_argument(
         "--init-db",
         action="store_true",
         help="Initialize database",
     )
 
+    parser.add_argument(
+        "--migrate",
+        action="store_true",
+        help="Migrate an existing database to the current schema",
+    )
+
+    parser.add_argument(
+        "--schedule",
+        action="store_true",
+        help="Run the recurring sweep scheduler for default keywords x locations",
+    )
+
+    parser.add_argument(
+        "--check-liveness",
+        action="store_true",
+        help="Run the liveness sweeper that flags dead and expired jobs inactive",
+    )
+
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Run search and analysis tasks from the shared database queue",
+    )
+
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help="With --worker: number of local worker processes "
+        "(default: worker.processes)",
+    )
+
+    parser.add_argument(
+        "--enqueue",
+        action="store_true",
+        help="With --search: queue the search for --worker processes",
+    )
+
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="With --schedule or --check-liveness: run one pass and exit; "
+        "with --worker: exit once the queue is empty",
+    )
+
     parser.add_argument(
         "--server",
         action="store_true",
         help="Run Flask API server",
     )
 
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="sample",
+        choices=profiling.PROFILE_MODES,
+        help="With --search: profile the search (sample or cprofile, default: sample)",
+    )
+
+    parser.add_argument(
+        "--load-test",
+        nargs=argparse.REMAINDER,
+        help="Load test the API; options follow (see --load-test --help)",
+    )
+
     args = parser.parse_args()
 
+    # Load configuration
+    config = load_config()
+
     # Setup logger
-    logger = setup_logger(log_file="logs/jobsearch.log")
+    logger = configure_logging(config.get("logging"))
+
+    # Run load test if requested (handles its own options)
+    if args.load_test is not None:
+        from .utils.load_test import main as load_test_main
+
+        load_test_main(args.load_test)
+        return
+
+    db.configure(config=config.get("database"))
+    metrics.configure(config.get("metrics"))
 
     # Initialize database if requested
     if args.init_db:
@@ -103,6 +208,15 @@ def main():
         logger.info("Database initialized successfully!")
         return
 
+    # Migrate existing database if requested
+    if args.migrate:
+        from .database.migrations import run_migrations
+
+        logger.info("Migrating database...")
+        run_migrations(config)
+        logger.info("Database migrated successfully!")
+        return
+
     # Run server if requested
     if args.server:
         from .api import run_server
@@ -110,16 +224,107 @@ def main():
         run_server()
         return
 
-    # Load configuration
-    config = load_config()
+    # Check posting liveness if requested
+    if args.check_liveness:
+        from .agents import LivenessSweeper
+
+        sweeper = LivenessSweeper(config=config)
+        if args.once:
+            sweeper.run_once()
+        else:
+            sweeper.run_forever(config.get("liveness", {}).get("poll_seconds", 300))
+        return
+
+    # Bulk load job files if requested
+    if args.import_paths:
+        from .database.importer import BulkImporter
+
+        importer = BulkImporter(config=config)
+        for path in args.import_paths:
+            if not args.format and export.format_for_path(path) is None:
+                parser.error(f"--import: pass --format to import {path}")
+            counts = importer.import_file(
+                path, export_format=args.format, resume=not args.no_resume
+            )
+            print(
+                f"{path}: {counts['inserted']} new, {counts['duplicate']} duplicate, "
+                f"{counts['invalid']} invalid of {counts['read']} rows"
+            )
+        return
+
+    # Run queue workers if requested
+    if args.worker:
+        processes = args.processes or config.get("worker", {}).get("processes", 1)
+        if processes > 1:
+            from .agents.task_worker import run_worker_processes
+
+            run_worker_processes(config, processes, drain=args.once)
+        else:
+            from .agents import TaskWorker
+
+            worker = TaskWorker(JobSearchAgent(config=config), config=config)
+            worker.run_forever(drain=args.once)
+        return
+
+    # Queue a search for the workers
+    if args.search and args.enqueue:
+        from .database.task_queue import TaskQueue
+
+        task_id = TaskQueue(config).enqueue(
+            "search",
+            {
+                "keywords": args.search,
+                "location": args.location,
+                "analyze": args.analyze and not args.no_analyze,
+            },
+        )
+        print(f"Queued search task {task_id}")
+        return
 
     # Initialize agent
     agent = JobSearchAgent(config=config)
 
+    # Rebuild the semantic search index
+    if args.build_index:
+        count = agent.build_vector_index()
+        print(f"Indexed {count} jobs in {agent.vector_index.path}")
+        return
+
+    # Run scheduled sweeps
+    if args.schedule:
+        from .agents import SweepScheduler
+
+        scheduler = SweepScheduler(agent, config=config)
+        if args.once:
+            scheduler.resume()
+            count = scheduler.tick()
+            logger.info(f"Ran or queued {count} scheduled sweep(s)")
+        else:
+            scheduler.run_forever()
+        return
+
+    # Stream jobs from database to a file
+    if args.export:
+        export_format = args.format or export.format_for_path(args.export)
+        if export_format is None:
+            parser.error("--export: pass --format or use a .ndjson/.csv/.parquet path")
+
+        logger.info(f"Exporting jobs as {export_format} to {args.export}")
+        rows = agent.iter_job_rows(limit=args.limit, source=args.source)
+        output = sys.stdout.buffer if args.export == "-" else open(args.export, "wb")
+        try:
+            for part in export.encode(rows, export_format):
+                output.write(part)
+        finally:
+            if output is not sys.stdout.buffer:
+                output.close()
+        logger.info(f"Export written to {args.export}")
+        return
+
     # List jobs from database
     if args.list:
         logger.info("Retrieving jobs from database...")
-        jobs = agent.get_jobs_from_db(limit=args.limit, source=args.source)
+        jobs = agent.get_jobs_from_db(limit=args.limit or 50, source=args.source)
 
         print(f"\n{'='*80}")
         print(f"Found {len(jobs)} jobs in database")
@@ -146,12 +351,28 @@ def main():
 
         logger.info(f"Searching for jobs: {args.search}")
 
-        results = agent.execute_search(
-            keywords=args.search,
-            location=args.location,
-            analyze=analyze,
-            save_to_db=save,
-        )
+        if args.profile:
+            options = profiling.profiling_options(config.get("profiling"))
+            with profiling.Profiler(
+                f"search-{args.search}",
+                mode=args.profile,
+                output_dir=options["output_dir"],
+                interval_ms=options["interval_ms"],
+            ) as profiler:
+                results = agent.execute_search(
+                    keywords=args.search,
+                    location=args.location,
+                    analyze=analyze,
+                    save_to_db=save,
+                )
+            print(f"Profile written to {profiler.output_path}")
+        else:
+            results = agent.execute_search(
+                keywords=args.search,
+                location=args.location,
+                analyze=analyze,
+                save_to_db=save,
+            )
 
         # Print results
         print(f"\n{'='*80}")
@@ -170,7 +391,7 @@ def main():
         print("Job Listings:")
         print(f"{'='*80}\n")
 
-        for i, job in enumerate(results["jobs"][:args.limit], 1):
+        for i, job in enumerate(results["jobs"][:args.limit or 50], 1):
             print(f"{i}. {job['title']} at {job['company']}")
             print(f"   Source: {job['source']} | Location: {job['location']}")
             print(f"   URL: {job['url']}")
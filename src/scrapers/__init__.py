@@ -1,6 +1,7 @@
 """Scrapers package for job search agent."""
 
 from .base_scraper import BaseScraper
+from .job_record import JobRecord
 from .indeed_scraper import IndeedScraper
 from .linkedin_scraper import LinkedinScraper
 from .glassdoor_scraper import GlassdoorScraper
@@ -10,6 +11,7 @@ from .adzuna_scraper import AdzunaScraper
 
 __all__ = [
     "BaseScraper",
+    "JobRecord",
     "IndeedScraper",
     "LinkedinScraper",
     "GlassdoorScraper",
@@ -1,11 +1,51 @@
 """Adzuna API job scraper - Free alternative."""
 
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Sequence
+
 import requests
-from typing import List, Dict, Any, Optional
-from datetime import datetime
 
 from .base_scraper import BaseScraper
+from .job_record import JobRecord
+from ..utils import geo, json_backend
+from ..utils.rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+API_ENDPOINT = "https://api.adzuna.com/v1/api/jobs/{country}/search"
+
+DEFAULT_COUNTRIES = ("us",)
+
+# Country endpoints queried at once
+MAX_PARALLEL_COUNTRIES = 4
+
+# Adzuna's per-minute hit limit, shared by all country requests
+CALLS_PER_MINUTE = 25
+
+# Salary currency of each Adzuna country endpoint
+COUNTRY_CURRENCIES = {
+    "at": "EUR",
+    "au": "AUD",
+    "be": "EUR",
+    "br": "BRL",
+    "ca": "CAD",
+    "ch": "CHF",
+    "de": "EUR",
+    "es": "EUR",
+    "fr": "EUR",
+    "gb": "GBP",
+    "in": "INR",
+    "it": "EUR",
+    "mx": "MXN",
+    "nl": "EUR",
+    "nz": "NZD",
+    "pl": "PLN",
+    "sg": "SGD",
+    "us": "USD",
+    "za": "ZAR",
+}
 
 
 class AdzunaScraper(BaseScraper):
@@ -16,29 +56,148 @@ class AdzunaScraper(BaseScraper):
     Sign up at: https://developer.adzuna.com/
 
     Coverage: US, UK, AU, CA, and many more countries
+
+    Each country has its own endpoint. A search whose location resolves to
+    one supported country only queries that country; other searches
+    (empty, remote or unknown locations) query every configured country
+    concurrently, sharing one rate limiter, and merge the results. Jobs
+    are tagged with the country they were found in.
     """
 
-    def __init__(self, app_id: Optional[str] = None, app_key: Optional[str] = None):
-        """Initialize Adzuna scraper."""
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        app_key: Optional[str] = None,
+        countries: Optional[Sequence[str]] = None,
+        max_parallel: int = MAX_PARALLEL_COUNTRIES,
+        calls_per_minute: float = CALLS_PER_MINUTE,
+    ):
+        """
+        Initialize Adzuna scraper.
+
+        Args:
+            app_id: Adzuna app ID (default: ADZUNA_APP_ID)
+            app_key: Adzuna app key (default: ADZUNA_APP_KEY)
+            countries: Country codes to search (default: DEFAULT_COUNTRIES)
+            max_parallel: Country endpoints queried at once
+            calls_per_minute: Request budget shared by all countries
+        """
         super().__init__(app_key)
         self.app_id = app_id or os.getenv("ADZUNA_APP_ID")
         self.app_key = app_key or os.getenv("ADZUNA_APP_KEY")
-        self.api_endpoint = "https://api.adzuna.com/v1/api/jobs/us/search/1"
+
+        self.countries = [code.lower() for code in countries or DEFAULT_COUNTRIES]
+        unsupported = [
+            code for code in self.countries if code not in COUNTRY_CURRENCIES
+        ]
+        if unsupported:
+            raise ValueError(
+                f"Unsupported Adzuna countries: {', '.join(unsupported)}"
+            )
+
+        self.max_parallel = max(max_parallel, 1)
+        self.rate_limiter = RateLimiter(calls_per_minute, 60.0)
+
+    @property
+    def calls_per_search(self) -> int:
+        """Provider calls one search makes at most (one per country)."""
+        return len(self.countries)
+
+    def countries_for(self, location: str) -> List[str]:
+        """
+        Country endpoints to query for a location.
+
+        Args:
+            location: Job location
+
+        Returns:
+            The location's country if it is one of the configured countries,
+            no countries if the location is in another country, else (no
+            location, or one that does not resolve) the configured countries
+        """
+        place = geo.resolve_location(location) if location else None
+        if place is None:
+            return list(self.countries)
+
+        country = place.country.lower()
+        if country in self.countries:
+            return [country]
+        logger.debug(
+            "adzuna: %s is in %s, which is not configured", location, country
+        )
+        return []
+
+    def _fan_out(
+        self, countries: List[str], search: Callable[[str], List[JobRecord]]
+    ) -> List[JobRecord]:
+        """Run a per-country search for each country and merge the results."""
+        if not countries:
+            return []
+        if len(countries) == 1:
+            return search(countries[0])
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_parallel, len(countries)),
+            thread_name_prefix="adzuna",
+        ) as executor:
+            per_country = list(executor.map(search, countries))
+
+        merged = {}
+        for country, jobs in zip(countries, per_country):
+            logger.debug("adzuna: %d jobs from %s", len(jobs), country)
+            for job in jobs:
+                merged.setdefault(job.external_id, job)
+        return list(merged.values())
 
     def search_jobs(
         self, keywords: str, location: str = "", **kwargs
-    ) -> List[Dict[str, Any]]:
+    ) -> List[JobRecord]:
         """
         Search Adzuna for jobs.
 
         Args:
             keywords: Job search keywords
             location: Job location
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (page, since, max_days_old,
+                countries, etc.)
 
         Returns:
-            List of normalized job dictionaries
+            List of normalized jobs
         """
+        countries = kwargs.pop("countries", None) or self.countries_for(location)
+        return self._fan_out(
+            countries,
+            lambda country: self._search_country(country, keywords, location, **kwargs),
+        )
+
+    def search_new_jobs(
+        self, keywords: str, location: str = "", **kwargs
+    ) -> List[JobRecord]:
+        """
+        Fetch only new postings, paginating each country separately.
+
+        Each country stops at its own first known posting (see
+        BaseScraper.search_new_jobs); countries are crawled concurrently.
+
+        Args:
+            keywords: Job search keywords
+            location: Job location
+            **kwargs: Parameters of BaseScraper.search_new_jobs
+
+        Returns:
+            List of normalized jobs
+        """
+        countries = kwargs.pop("countries", None) or self.countries_for(location)
+        crawl = super().search_new_jobs
+        return self._fan_out(
+            countries,
+            lambda country: crawl(keywords, location, countries=[country], **kwargs),
+        )
+
+    def _search_country(
+        self, country: str, keywords: str, location: str = "", **kwargs
+    ) -> List[JobRecord]:
+        """Fetch one result page from one country's endpoint."""
         try:
             params = {
                 "app_id": self.app_id,
@@ -55,19 +214,29 @@ class AdzunaScraper(BaseScraper):
             if "salary_min" in kwargs:
                 params["salary_min"] = kwargs["salary_min"]
 
-            response = requests.get(
-                self.api_endpoint, params=params, timeout=30
+            # Incremental crawl: newest first, nothing older than the watermark
+            if kwargs.get("since"):
+                params["sort_by"] = "date"
+                if "max_days_old" not in kwargs:
+                    params["max_days_old"] = self._days_since(kwargs["since"])
+
+            self.rate_limiter.acquire()
+            endpoint = API_ENDPOINT.format(country=country)
+            response = self.transport.get(
+                f"{endpoint}/{kwargs.get('page', 1)}", params=params, timeout=30
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = json_backend.loads(response.content)
             raw_jobs = data.get("results", [])
 
-            # Normalize jobs
+            # Normalize jobs; salaries are in the endpoint country's currency
             normalized_jobs = []
             for raw_job in raw_jobs:
                 try:
                     normalized_job = self.normalize_job(raw_job)
+                    normalized_job.country = country.upper()
+                    normalized_job.salary_currency = COUNTRY_CURRENCIES[country]
                     normalized_jobs.append(normalized_job)
                 except Exception as e:
                     self.handle_error(e, f"normalizing job {raw_job.get('id', 'unknown')}")
@@ -75,9 +244,9 @@ class AdzunaScraper(BaseScraper):
             return normalized_jobs
 
         except requests.exceptions.RequestException as e:
-            return self.handle_error(e, "API request")
+            return self.handle_error(e, f"API request ({country})")
         except Exception as e:
-            return self.handle_error(e, "search_jobs")
+            return self.handle_error(e, f"search_jobs ({country})")
 
     def _extract_external_id(self, raw_job: Dict[str, Any]) -> str:
         """Extract unique job ID."""
@@ -125,6 +294,10 @@ class AdzunaScraper(BaseScraper):
         """Extract maximum salary."""
         return raw_job.get("salary_max")
 
+    def _extract_salary_period(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Extract salary pay period (Adzuna salaries are annual)."""
+        return "year"
+
     def _extract_posted_date(self, raw_job: Dict[str, Any]) -> Optional[str]:
         """Extract job posted date."""
         created = raw_job.get("created")
@@ -1,11 +1,24 @@
 """Base scraper class for all job scrapers."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterable
 import logging
+import math
+
+from .job_record import JobRecord
+from .transport import build_transport
+from ..utils import metrics
+from ..utils.dates import parse_posted_date
 
 logger = logging.getLogger(__name__)
 
+NORMALIZE_SECONDS = metrics.histogram(
+    "jobsearch_normalize_seconds",
+    "Time to normalize one raw posting in seconds",
+    ["source"],
+)
+
 
 class BaseScraper(ABC):
     """Abstract base class for job scrapers."""
@@ -14,11 +27,20 @@ class BaseScraper(ABC):
         """Initialize scraper with API key."""
         self.api_key = api_key
         self.source_name = self.__class__.__name__.replace("Scraper", "").lower()
+        # Keep each posting's raw API payload on its JobRecord (for the payload store)
+        self.keep_raw = True
+        # HTTP transport (live, record, replay or stub); see transport.py
+        self.transport = build_transport()
+
+    @property
+    def calls_per_search(self) -> int:
+        """Provider calls one search_jobs call makes at most."""
+        return 1
 
     @abstractmethod
     def search_jobs(
         self, keywords: str, location: str = "", **kwargs
-    ) -> List[Dict[str, Any]]:
+    ) -> List[JobRecord]:
         """
         Search for jobs with given parameters.
 
@@ -28,11 +50,74 @@ class BaseScraper(ABC):
             **kwargs: Additional search parameters
 
         Returns:
-            List of job dictionaries
+            List of normalized jobs
         """
         pass
 
-    def normalize_job(self, raw_job: Dict[str, Any]) -> Dict[str, Any]:
+    def search_new_jobs(
+        self,
+        keywords: str,
+        location: str = "",
+        since: Optional[datetime] = None,
+        known_ids: Optional[Iterable[str]] = None,
+        max_pages: int = 1,
+        **kwargs,
+    ) -> List[JobRecord]:
+        """
+        Fetch only postings not seen by a previous crawl.
+
+        ``since`` is passed to ``search_jobs`` so each scraper can apply its
+        provider's date filter. Pagination stops at the first already-known
+        posting, and postings dated before ``since`` are dropped.
+
+        Args:
+            keywords: Job search keywords
+            location: Job location
+            since: Only fetch postings newer than this (UTC)
+            known_ids: External IDs already stored for this query
+            max_pages: Maximum number of result pages to fetch
+            **kwargs: Additional search parameters (``page`` is the first
+                page to fetch)
+
+        Returns:
+            List of normalized jobs
+        """
+        known_ids = set(known_ids or ())
+        new_jobs = []
+        first_page = int(kwargs.pop("page", None) or 1)
+
+        for page in range(first_page, first_page + max_pages):
+            jobs = self.search_jobs(keywords, location, page=page, since=since, **kwargs)
+            if not jobs:
+                break
+
+            for job in jobs:
+                if job.external_id in known_ids:
+                    logger.info(
+                        f"{self.source_name}: reached known posting on page {page}, stopping"
+                    )
+                    return new_jobs
+
+                posted = self.posted_datetime(job)
+                if since and posted and posted < since:
+                    continue
+
+                new_jobs.append(job)
+
+        return new_jobs
+
+    @staticmethod
+    def posted_datetime(job: JobRecord) -> Optional[datetime]:
+        """A job's posted_date as naive UTC (already parsed by normalize_job)."""
+        return parse_posted_date(job.posted_date)
+
+    @staticmethod
+    def _days_since(since: datetime) -> int:
+        """Whole days (rounded up, at least 1) between ``since`` and now."""
+        seconds = (datetime.utcnow() - since).total_seconds()
+        return max(math.ceil(seconds / 86400), 1)
+
+    def normalize_job(self, raw_job: Dict[str, Any]) -> JobRecord:
         """
         Normalize job data to standard format.
 
@@ -40,23 +125,30 @@ class BaseScraper(ABC):
             raw_job: Raw job data from API
 
         Returns:
-            Normalized job dictionary
+            Normalized job
         """
-        return {
-            "external_id": self._extract_external_id(raw_job),
-            "source": self.source_name,
-            "title": self._extract_title(raw_job),
-            "company": self._extract_company(raw_job),
-            "location": self._extract_location(raw_job),
-            "description": self._extract_description(raw_job),
-            "url": self._extract_url(raw_job),
-            "job_type": self._extract_job_type(raw_job),
-            "remote_type": self._extract_remote_type(raw_job),
-            "salary_min": self._extract_salary_min(raw_job),
-            "salary_max": self._extract_salary_max(raw_job),
-            "posted_date": self._extract_posted_date(raw_job),
-            "raw_data": raw_job,
-        }
+        with NORMALIZE_SECONDS.labels(self.source_name).time():
+            return self._normalize(raw_job)
+
+    def _normalize(self, raw_job: Dict[str, Any]) -> JobRecord:
+        """Build the normalized job record (see normalize_job)."""
+        return JobRecord(
+            external_id=self._extract_external_id(raw_job),
+            source=self.source_name,
+            title=self._extract_title(raw_job),
+            company=self._extract_company(raw_job),
+            location=self._extract_location(raw_job),
+            description=self._extract_description(raw_job),
+            url=self._extract_url(raw_job),
+            job_type=self._extract_job_type(raw_job),
+            remote_type=self._extract_remote_type(raw_job),
+            salary_min=self._extract_salary_min(raw_job),
+            salary_max=self._extract_salary_max(raw_job),
+            salary_currency=self._extract_salary_currency(raw_job),
+            salary_period=self._extract_salary_period(raw_job),
+            posted_date=parse_posted_date(self._extract_posted_date(raw_job)),
+            raw_data=raw_job if self.keep_raw else None,
+        )
 
     @abstractmethod
     def _extract_external_id(self, raw_job: Dict[str, Any]) -> str:
@@ -104,8 +196,22 @@ class BaseScraper(ABC):
         """Extract maximum salary."""
         return None
 
-    def _extract_posted_date(self, raw_job: Dict[str, Any]) -> Optional[str]:
-        """Extract job posted date."""
+    def _extract_salary_currency(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Extract salary currency code (None if not reported)."""
+        return None
+
+    def _extract_salary_period(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Extract salary pay period, e.g. "hourly" or "yearly" (None if not reported)."""
+        return None
+
+    def _extract_posted_date(self, raw_job: Dict[str, Any]) -> Any:
+        """
+        Extract job posted date as the provider reports it.
+
+        Any format parse_posted_date understands (ISO or free-form string,
+        epoch seconds or milliseconds, "3 days ago") is fine; normalize_job
+        converts it to naive UTC.
+        """
         return None
 
     def handle_error(self, error: Exception, context: str = ""):
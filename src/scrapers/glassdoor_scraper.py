@@ -3,9 +3,10 @@
 import os
 import requests
 from typing import List, Dict, Any, Optional
-from datetime import datetime
 
 from .base_scraper import BaseScraper
+from .job_record import JobRecord
+from ..utils import json_backend
 
 
 class GlassdoorScraper(BaseScraper):
@@ -20,7 +21,7 @@ class GlassdoorScraper(BaseScraper):
 
     def search_jobs(
         self, keywords: str, location: str = "", **kwargs
-    ) -> List[Dict[str, Any]]:
+    ) -> List[JobRecord]:
         """
         Search Glassdoor for jobs.
 
@@ -30,7 +31,7 @@ class GlassdoorScraper(BaseScraper):
             **kwargs: Additional parameters
 
         Returns:
-            List of normalized job dictionaries
+            List of normalized jobs
         """
         try:
             headers = {
@@ -47,15 +48,17 @@ class GlassdoorScraper(BaseScraper):
             # Add optional filters
             if "date_posted" in kwargs:
                 params["fromAge"] = kwargs["date_posted"]
+            elif kwargs.get("since"):
+                params["fromAge"] = self._days_since(kwargs["since"])
             if "job_type" in kwargs:
                 params["employmentType"] = kwargs["job_type"]
 
-            response = requests.get(
+            response = self.transport.get(
                 self.api_endpoint, headers=headers, params=params, timeout=30
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = json_backend.loads(response.content)
             raw_jobs = data.get("jobs", [])
 
             # Normalize jobs
@@ -130,12 +133,20 @@ class GlassdoorScraper(BaseScraper):
             return salary.get("max")
         return None
 
-    def _extract_posted_date(self, raw_job: Dict[str, Any]) -> Optional[str]:
-        """Extract job posted date."""
-        date_str = raw_job.get("postedDate", raw_job.get("listingDate"))
-        if date_str:
-            try:
-                return datetime.fromisoformat(date_str.replace("Z", "+00:00")).isoformat()
-            except:
-                pass
+    def _extract_salary_currency(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Extract salary currency."""
+        salary = raw_job.get("salary", {})
+        if isinstance(salary, dict):
+            return salary.get("currency")
         return None
+
+    def _extract_salary_period(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Extract salary pay period."""
+        salary = raw_job.get("salary", {})
+        if isinstance(salary, dict):
+            return salary.get("payPeriod")
+        return None
+
+    def _extract_posted_date(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Extract job posted date (ISO string)."""
+        return raw_job.get("postedDate", raw_job.get("listingDate"))
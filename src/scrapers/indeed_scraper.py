@@ -3,9 +3,10 @@
 import os
 import requests
 from typing import List, Dict, Any, Optional
-from datetime import datetime
 
 from .base_scraper import BaseScraper
+from .job_record import JobRecord
+from ..utils import json_backend
 
 
 class IndeedScraper(BaseScraper):
@@ -20,17 +21,17 @@ class IndeedScraper(BaseScraper):
 
     def search_jobs(
         self, keywords: str, location: str = "", **kwargs
-    ) -> List[Dict[str, Any]]:
+    ) -> List[JobRecord]:
         """
         Search Indeed for jobs.
 
         Args:
             keywords: Job search keywords
             location: Job location
-            **kwargs: Additional parameters (page, job_type, remote, etc.)
+            **kwargs: Additional parameters (page, since, job_type, remote, etc.)
 
         Returns:
-            List of normalized job dictionaries
+            List of normalized jobs
         """
         try:
             headers = {
@@ -48,17 +49,19 @@ class IndeedScraper(BaseScraper):
             # Add optional filters
             if "date_posted" in kwargs:
                 params["date_posted"] = kwargs["date_posted"]
+            elif kwargs.get("since"):
+                params["date_posted"] = self._days_since(kwargs["since"])
             if "job_type" in kwargs:
                 params["job_type"] = kwargs["job_type"]
             if "remote" in kwargs:
                 params["remote"] = kwargs["remote"]
 
-            response = requests.get(
+            response = self.transport.get(
                 self.api_endpoint, headers=headers, params=params, timeout=30
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = json_backend.loads(response.content)
             raw_jobs = data.get("hits", [])
 
             # Normalize jobs
@@ -131,14 +134,20 @@ class IndeedScraper(BaseScraper):
             return salary.get("max")
         return None
 
-    def _extract_posted_date(self, raw_job: Dict[str, Any]) -> Optional[str]:
-        """Extract job posted date."""
-        date_str = raw_job.get("pub_date_ts_milli", raw_job.get("date_posted"))
-        if date_str:
-            try:
-                if isinstance(date_str, int):
-                    return datetime.fromtimestamp(date_str / 1000).isoformat()
-                return date_str
-            except:
-                pass
+    def _extract_salary_currency(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Extract salary currency."""
+        salary = raw_job.get("salary", {})
+        if isinstance(salary, dict):
+            return salary.get("currency")
         return None
+
+    def _extract_salary_period(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Extract salary pay period."""
+        salary = raw_job.get("salary", {})
+        if isinstance(salary, dict):
+            return salary.get("type")
+        return None
+
+    def _extract_posted_date(self, raw_job: Dict[str, Any]) -> Any:
+        """Extract job posted date (epoch millis or date string)."""
+        return raw_job.get("pub_date_ts_milli", raw_job.get("date_posted"))
@@ -0,0 +1,154 @@
+"""Compact record for one normalized job posting."""
+
+import sys
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+# Normalized fields every scraper fills in
+CORE_FIELDS = (
+    "external_id",
+    "source",
+    "title",
+    "company",
+    "location",
+    "country",
+    "description",
+    "url",
+    "job_type",
+    "remote_type",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "salary_period",
+    "posted_date",
+)
+
+# Fields added while a job moves through the pipeline (dedup and analysis)
+PIPELINE_FIELDS = (
+    "content_hash",
+    "ai_summary",
+    "ai_extracted_skills",
+    "ai_analysis",
+)
+
+# Low-cardinality strings repeated across thousands of jobs; interned so
+# equal values share one object
+INTERNED_FIELDS = (
+    "source",
+    "company",
+    "location",
+    "country",
+    "job_type",
+    "remote_type",
+    "salary_currency",
+    "salary_period",
+)
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string value (other values are returned unchanged)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _isoformat(value: Any) -> Any:
+    """ISO 8601 string for datetimes (other values are returned unchanged)."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class JobRecord:
+    """
+    One job posting from scraping to storage.
+
+    Uses ``__slots__`` instead of a per-job dict, interns repeated strings
+    and only keeps the provider's raw payload when asked to, so tens of
+    thousands of in-flight jobs stay small. Convert with ``to_dict`` where
+    jobs leave the process (API responses, JSON output).
+    """
+
+    __slots__ = CORE_FIELDS + PIPELINE_FIELDS + ("raw_data",)
+
+    def __init__(
+        self,
+        external_id: Optional[str] = None,
+        source: Optional[str] = None,
+        title: Optional[str] = None,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        country: Optional[str] = None,
+        description: Optional[str] = None,
+        url: Optional[str] = None,
+        job_type: Optional[str] = None,
+        remote_type: Optional[str] = None,
+        salary_min: Optional[float] = None,
+        salary_max: Optional[float] = None,
+        salary_currency: Optional[str] = None,
+        salary_period: Optional[str] = None,
+        posted_date: Optional[datetime] = None,
+        raw_data: Optional[Dict[str, Any]] = None,
+        content_hash: Optional[str] = None,
+        ai_summary: Optional[str] = None,
+        ai_extracted_skills: Any = None,
+        ai_analysis: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize record (see CORE_FIELDS and PIPELINE_FIELDS)."""
+        self.external_id = external_id
+        self.source = _intern(source)
+        self.title = title
+        self.company = _intern(company)
+        self.location = _intern(location)
+        self.country = _intern(country)
+        self.description = description
+        self.url = url
+        self.job_type = _intern(job_type)
+        self.remote_type = _intern(remote_type)
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.salary_currency = _intern(salary_currency)
+        self.salary_period = _intern(salary_period)
+        self.posted_date = posted_date
+        self.raw_data = raw_data
+        self.content_hash = content_hash
+        self.ai_summary = ai_summary
+        self.ai_extracted_skills = ai_extracted_skills
+        self.ai_analysis = ai_analysis
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobRecord":
+        """
+        Build a record from a job dictionary (e.g. an API request body).
+
+        Args:
+            data: Job dictionary; unknown keys are ignored
+
+        Returns:
+            JobRecord
+        """
+        return cls(**{key: data[key] for key in cls.__slots__ if key in data})
+
+    def payload(self) -> Optional[Dict[str, Any]]:
+        """Raw payload to archive, including the AI analysis if any."""
+        if self.ai_analysis is None:
+            return self.raw_data
+        return dict(self.raw_data or {}, ai_analysis=self.ai_analysis)
+
+    def to_dict(self, include_raw: bool = False) -> Dict[str, Any]:
+        """
+        Convert record to dictionary.
+
+        Args:
+            include_raw: Also include raw_data (with the AI analysis)
+
+        Returns:
+            Job dictionary
+        """
+        job_dict = {field: getattr(self, field) for field in CORE_FIELDS}
+        job_dict["posted_date"] = _isoformat(self.posted_date)
+        job_dict["content_hash"] = self.content_hash
+        job_dict["ai_summary"] = self.ai_summary
+        job_dict["ai_extracted_skills"] = self.ai_extracted_skills
+        if include_raw:
+            job_dict["raw_data"] = self.payload()
+        return job_dict
+
+    def __repr__(self) -> str:
+        return f"<JobRecord(external_id='{self.external_id}', title='{self.title}')>"
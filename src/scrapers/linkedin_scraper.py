@@ -1,11 +1,23 @@
 """LinkedIn job scraper using RapidAPI."""
 
 import os
+import logging
 import requests
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from .base_scraper import BaseScraper
+from .job_record import JobRecord
+from ..utils import geo, json_backend
+
+# Results per page returned by the search-jobs endpoint
+PAGE_SIZE = 25
+
+# LinkedIn geo IDs for searches without a resolvable place
+DEFAULT_GEO_ID = "103644278"  # United States
+WORLDWIDE_GEO_ID = "92000000"
+
+logger = logging.getLogger(__name__)
 
 
 class LinkedinScraper(BaseScraper):
@@ -20,7 +32,7 @@ class LinkedinScraper(BaseScraper):
 
     def search_jobs(
         self, keywords: str, location: str = "", **kwargs
-    ) -> List[Dict[str, Any]]:
+    ) -> List[JobRecord]:
         """
         Search LinkedIn for jobs.
 
@@ -30,7 +42,7 @@ class LinkedinScraper(BaseScraper):
             **kwargs: Additional parameters
 
         Returns:
-            List of normalized job dictionaries
+            List of normalized jobs
         """
         try:
             headers = {
@@ -45,18 +57,29 @@ class LinkedinScraper(BaseScraper):
                 "sort": kwargs.get("sort", "mostRelevant"),
             }
 
+            page = int(kwargs.get("page", 1))
+            if page > 1:
+                params["start"] = (page - 1) * PAGE_SIZE
+
+            # Incremental crawl: newest first within the smallest window
+            if kwargs.get("since"):
+                if "date_posted" not in kwargs:
+                    params["datePosted"] = self._date_posted_bucket(kwargs["since"])
+                if "sort" not in kwargs:
+                    params["sort"] = "mostRecent"
+
             # Add optional filters
             if "job_type" in kwargs:
                 params["jobType"] = kwargs["job_type"]
             if "experience_level" in kwargs:
                 params["experienceLevel"] = kwargs["experience_level"]
 
-            response = requests.get(
+            response = self.transport.get(
                 self.api_endpoint, headers=headers, params=params, timeout=30
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = json_backend.loads(response.content)
             raw_jobs = data.get("data", [])
 
             # Normalize jobs
@@ -75,17 +98,44 @@ class LinkedinScraper(BaseScraper):
         except Exception as e:
             return self.handle_error(e, "search_jobs")
 
+    def _date_posted_bucket(self, since: datetime) -> str:
+        """Smallest datePosted window that covers ``since``."""
+        days = self._days_since(since)
+        if days <= 1:
+            return "past24Hours"
+        if days <= 7:
+            return "pastWeek"
+        if days <= 30:
+            return "pastMonth"
+        return "anyTime"
+
     def _get_location_id(self, location: str) -> str:
-        """Convert location string to LinkedIn location ID."""
-        # Common location IDs - expand as needed
-        location_map = {
-            "united states": "103644278",
-            "remote": "103644278",  # Default to US for remote
-            "new york": "102571732",
-            "san francisco": "102277331",
-            "london": "102299470",
-        }
-        return location_map.get(location.lower(), "103644278")
+        """
+        Convert location string to LinkedIn location ID.
+
+        Resolves the location against the gazetteer and uses the most
+        specific LinkedIn geo ID known for it (city, else its country).
+        Empty and remote-only locations search the US; unknown locations
+        search worldwide instead of silently becoming the US.
+        """
+        if not location.strip():
+            return DEFAULT_GEO_ID
+
+        place = geo.resolve_location(location)
+        if place is None:
+            if geo.is_remote(location):
+                return DEFAULT_GEO_ID
+            logger.warning(
+                f"Unknown LinkedIn location '{location}', searching worldwide"
+            )
+            return WORLDWIDE_GEO_ID
+
+        if place.linkedin_geo_id:
+            return place.linkedin_geo_id
+        country = geo.get_gazetteer().country(place.country)
+        if country and country.linkedin_geo_id:
+            return country.linkedin_geo_id
+        return WORLDWIDE_GEO_ID
 
     def _extract_external_id(self, raw_job: Dict[str, Any]) -> str:
         """Extract unique job ID."""
@@ -142,14 +192,20 @@ class LinkedinScraper(BaseScraper):
             return salary.get("max")
         return None
 
-    def _extract_posted_date(self, raw_job: Dict[str, Any]) -> Optional[str]:
-        """Extract job posted date."""
-        posted_at = raw_job.get("postedAt", raw_job.get("listedAt"))
-        if posted_at:
-            try:
-                if isinstance(posted_at, int):
-                    return datetime.fromtimestamp(posted_at / 1000).isoformat()
-                return posted_at
-            except:
-                pass
+    def _extract_salary_currency(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Extract salary currency."""
+        salary = raw_job.get("salary", {})
+        if isinstance(salary, dict):
+            return salary.get("currency")
         return None
+
+    def _extract_salary_period(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Extract salary pay period."""
+        salary = raw_job.get("salary", {})
+        if isinstance(salary, dict):
+            return salary.get("period")
+        return None
+
+    def _extract_posted_date(self, raw_job: Dict[str, Any]) -> Any:
+        """Extract job posted date (epoch millis or date string)."""
+        return raw_job.get("postedAt", raw_job.get("listedAt"))
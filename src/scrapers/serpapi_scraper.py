@@ -6,6 +6,12 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from .base_scraper import BaseScraper
+from .job_record import JobRecord
+from ..utils import json_backend
+from ..utils.salary import parse_salary_text
+
+# Results per page returned by the google_jobs engine
+PAGE_SIZE = 10
 
 
 class SerpApiScraper(BaseScraper):
@@ -32,7 +38,7 @@ class SerpApiScraper(BaseScraper):
 
     def search_jobs(
         self, keywords: str, location: str = "", **kwargs
-    ) -> List[Dict[str, Any]]:
+    ) -> List[JobRecord]:
         """
         Search Google Jobs via SerpAPI.
 
@@ -42,7 +48,7 @@ class SerpApiScraper(BaseScraper):
             **kwargs: Additional parameters
 
         Returns:
-            List of normalized job dictionaries
+            List of normalized jobs
         """
         try:
             params = {
@@ -57,13 +63,19 @@ class SerpApiScraper(BaseScraper):
             # Add optional filters
             if "chips" in kwargs:
                 params["chips"] = kwargs["chips"]  # date_posted, employment_type, etc.
+            elif kwargs.get("since"):
+                params["chips"] = f"date_posted:{self._date_posted_chip(kwargs['since'])}"
+
+            page = int(kwargs.get("page", 1))
+            if page > 1:
+                params["start"] = (page - 1) * PAGE_SIZE
 
-            response = requests.get(
+            response = self.transport.get(
                 self.api_endpoint, params=params, timeout=30
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = json_backend.loads(response.content)
             raw_jobs = data.get("jobs_results", [])
 
             # Normalize jobs
@@ -82,6 +94,17 @@ class SerpApiScraper(BaseScraper):
         except Exception as e:
             return self.handle_error(e, "search_jobs")
 
+    def _date_posted_chip(self, since: datetime) -> str:
+        """Smallest date_posted chip that covers ``since``."""
+        days = self._days_since(since)
+        if days <= 1:
+            return "today"
+        if days <= 3:
+            return "3days"
+        if days <= 7:
+            return "week"
+        return "month"
+
     def _extract_external_id(self, raw_job: Dict[str, Any]) -> str:
         """Extract unique job ID."""
         return f"serpapi_{raw_job.get('job_id', '')}"
@@ -138,8 +161,36 @@ class SerpApiScraper(BaseScraper):
             return "remote"
         return "onsite"
 
+    def _parse_salary(self, raw_job: Dict[str, Any]) -> Optional[tuple]:
+        """Parse the free-text salary, e.g. "$50–$80 an hour" (cached)."""
+        detected_extensions = raw_job.get("detected_extensions", {})
+        salary = detected_extensions.get("salary")
+        if isinstance(salary, str):
+            return parse_salary_text(salary)
+        return None
+
+    def _extract_salary_min(self, raw_job: Dict[str, Any]) -> Optional[float]:
+        """Extract minimum salary."""
+        salary = self._parse_salary(raw_job)
+        return salary[0] if salary else None
+
+    def _extract_salary_max(self, raw_job: Dict[str, Any]) -> Optional[float]:
+        """Extract maximum salary."""
+        salary = self._parse_salary(raw_job)
+        return salary[1] if salary else None
+
+    def _extract_salary_currency(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Extract salary currency."""
+        salary = self._parse_salary(raw_job)
+        return salary[2] if salary else None
+
+    def _extract_salary_period(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Extract salary pay period."""
+        salary = self._parse_salary(raw_job)
+        return salary[3] if salary else None
+
     def _extract_posted_date(self, raw_job: Dict[str, Any]) -> Optional[str]:
-        """Extract job posted date."""
+        """Extract job posted date (relative, e.g. "3 days ago")."""
         detected_extensions = raw_job.get("detected_extensions", {})
         posted_at = detected_extensions.get("posted_at")
         if posted_at:
@@ -0,0 +1,455 @@
+"""Local stub HTTP server that imitates the job provider APIs.
+
+Serves recorded fixtures or deterministic synthetic responses in each
+provider's shape so the fetch path can be benchmarked and load-tested
+offline. Point scrapers at it with the "stub" transport:
+
+    python -m src.scrapers.stub_server --port 8765 --latency-ms 80
+    SCRAPER_TRANSPORT=stub python -m src.main --search "Python Developer"
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from .transport import fixture_path, redact_params
+
+logger = logging.getLogger(__name__)
+
+TITLES = [
+    "Software Engineer",
+    "Senior Python Developer",
+    "Data Scientist",
+    "Machine Learning Engineer",
+    "Backend Engineer",
+    "Frontend Developer",
+    "DevOps Engineer",
+    "Product Manager",
+    "Data Engineer",
+    "Site Reliability Engineer",
+]
+COMPANIES = [
+    "Acme Corp",
+    "Globex",
+    "Initech",
+    "Umbrella",
+    "Hooli",
+    "Stark Industries",
+    "Wayne Enterprises",
+    "Soylent",
+]
+CITIES = [
+    ("New York", "NY"),
+    ("San Francisco", "CA"),
+    ("Austin", "TX"),
+    ("Seattle", "WA"),
+    ("Chicago", "IL"),
+    ("Boston", "MA"),
+    ("Denver", "CO"),
+    ("Remote", ""),
+]
+SKILLS = [
+    "Python",
+    "SQL",
+    "AWS",
+    "Docker",
+    "Kubernetes",
+    "React",
+    "Go",
+    "Spark",
+    "Terraform",
+    "PostgreSQL",
+]
+
+
+def synthetic_posting(index: int, seed: str = "") -> Dict[str, Any]:
+    """
+    Generate a provider-neutral synthetic posting.
+
+    The same index and seed always produce the same posting.
+
+    Args:
+        index: Posting number
+        seed: Extra seed (e.g. the query) so different queries differ
+
+    Returns:
+        Dictionary of posting attributes
+    """
+    rng = random.Random(zlib.crc32(f"{seed}:{index}".encode("utf-8")))
+    city, state = rng.choice(CITIES)
+    skills = rng.sample(SKILLS, 4)
+    salary_min = rng.randrange(60, 180) * 1000
+    title = rng.choice(TITLES)
+
+    return {
+        "id": f"{zlib.crc32(seed.encode('utf-8')):08x}{index:08d}",
+        "title": title,
+        "company": rng.choice(COMPANIES),
+        "city": city,
+        "state": state,
+        "remote": city == "Remote",
+        "description": (
+            f"We are hiring a {title} to build and operate our platform. "
+            f"You will work with {', '.join(skills)}. "
+            f"{rng.randint(1, 8)}+ years of experience required. "
+            + "Collaborate with product, design and data teams. " * rng.randint(3, 12)
+        ),
+        "salary_min": salary_min,
+        "salary_max": salary_min + rng.randrange(10, 60) * 1000,
+        "posted": datetime.utcnow().replace(microsecond=0)
+        - timedelta(hours=index * 3 + rng.randint(0, 2)),
+    }
+
+
+def _indeed(p: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": p["id"],
+        "title": p["title"],
+        "company_name": p["company"],
+        "location": f"{p['city']}, {p['state']}".strip(", "),
+        "description": p["description"],
+        "pub_date_ts_milli": int(p["posted"].timestamp() * 1000),
+        "salary": {"min": p["salary_min"], "max": p["salary_max"], "type": "YEARLY"},
+        "remote": p["remote"],
+    }
+
+
+def _linkedin(p: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": p["id"],
+        "title": p["title"],
+        "company": {"name": p["company"]},
+        "location": f"{p['city']}, {p['state']}".strip(", "),
+        "description": p["description"],
+        "postedAt": int(p["posted"].timestamp() * 1000),
+        "workplaceType": "Remote" if p["remote"] else "On-site",
+    }
+
+
+def _glassdoor(p: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "jobId": p["id"],
+        "jobTitle": p["title"],
+        "employer": {"name": p["company"]},
+        "location": {"name": p["city"], "isRemote": p["remote"]},
+        "description": p["description"],
+        "jobUrl": f"https://www.glassdoor.com/job-listing/{p['id']}",
+        "postedDate": p["posted"].isoformat() + "Z",
+        "salary": {"min": p["salary_min"], "max": p["salary_max"]},
+    }
+
+
+def _monster(p: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": p["id"],
+        "title": p["title"],
+        "company": {"name": p["company"]},
+        "location": {"city": p["city"], "state": p["state"]},
+        "description": p["description"],
+        "url": f"https://www.monster.com/job-openings/{p['id']}",
+        "postedDate": p["posted"].isoformat() + "Z",
+        "isRemote": p["remote"],
+    }
+
+
+def _serpapi(p: Dict[str, Any]) -> Dict[str, Any]:
+    hours = max(int((datetime.utcnow() - p["posted"]).total_seconds() // 3600), 1)
+    posted_at = f"{hours} hours ago" if hours < 24 else f"{hours // 24} days ago"
+    # Google Jobs reports salary as text, hourly for some postings
+    if p["salary_min"] // 1000 % 3 == 0:
+        salary = f"${p['salary_min'] // 2080}–${p['salary_max'] // 2080} an hour"
+    else:
+        salary = f"{p['salary_min'] // 1000}K–{p['salary_max'] // 1000}K a year"
+    return {
+        "job_id": p["id"],
+        "title": p["title"],
+        "company_name": p["company"],
+        "location": f"{p['city']}, {p['state']}".strip(", "),
+        "description": p["description"],
+        "share_url": f"https://www.google.com/search?ibp=htl;jobs#htidocid={p['id']}",
+        "detected_extensions": {
+            "posted_at": posted_at,
+            "salary": salary,
+            "schedule_type": "Full-time",
+            "work_from_home": p["remote"],
+        },
+    }
+
+
+def _adzuna(p: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": p["id"],
+        "title": p["title"],
+        "company": {"display_name": p["company"]},
+        "location": {"display_name": f"{p['city']}, {p['state']}".strip(", ")},
+        "description": p["description"],
+        "redirect_url": f"https://www.adzuna.com/details/{p['id']}",
+        "contract_type": "permanent",
+        "salary_min": p["salary_min"],
+        "salary_max": p["salary_max"],
+        "created": p["posted"].isoformat() + "Z",
+    }
+
+
+def _page_param(name: str) -> Callable[[str, Dict[str, str]], int]:
+    """Page number taken from a 1-based query parameter."""
+    return lambda path, params: int(params.get(name, 1))
+
+
+def _offset_param(name: str, page_size: int) -> Callable[[str, Dict[str, str]], int]:
+    """Page number derived from a result offset parameter."""
+    return lambda path, params: int(params.get(name, 0)) // page_size + 1
+
+
+def _path_page(path: str, params: Dict[str, str]) -> int:
+    """Page number taken from the last path segment (Adzuna)."""
+    last = path.rstrip("/").rsplit("/", 1)[-1]
+    return int(last) if last.isdigit() else 1
+
+
+# host: (results key, page size, page parser, raw job builder, extra body)
+PROVIDERS: Dict[str, Tuple[str, int, Callable, Callable, Dict[str, Any]]] = {
+    "indeed12.p.rapidapi.com": ("hits", 15, _page_param("page_id"), _indeed, {}),
+    "linkedin-data-api.p.rapidapi.com": (
+        "data",
+        25,
+        _offset_param("start", 25),
+        _linkedin,
+        {"success": True},
+    ),
+    "glassdoor-job-search.p.rapidapi.com": (
+        "jobs",
+        30,
+        _page_param("page"),
+        _glassdoor,
+        {},
+    ),
+    "monster-job-search.p.rapidapi.com": (
+        "results",
+        25,
+        _page_param("page"),
+        _monster,
+        {},
+    ),
+    "serpapi.com": ("jobs_results", 10, _offset_param("start", 10), _serpapi, {}),
+    "api.adzuna.com": ("results", 50, _path_page, _adzuna, {}),
+}
+
+QUERY_PARAMS = ("query", "keywords", "q", "what")
+
+# Fraction of posting URLs that answer 404 (expired) to HEAD requests
+DEAD_POSTING_RATE = 0.1
+
+
+class StubProviderServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the stub configuration."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        total_results: int = 100,
+        fixtures_dir: Optional[str] = None,
+        seed: int = 0,
+    ):
+        """
+        Initialize stub server.
+
+        Args:
+            address: (host, port) to bind
+            latency_ms: Mean added latency per request
+            jitter_ms: Uniform +/- jitter around the latency
+            error_rate: Fraction of requests answered with 500/429
+            total_results: Results available per query (across pages)
+            fixtures_dir: Serve recorded fixtures from here when present
+            seed: Random seed for latency and error injection
+        """
+        super().__init__(address, StubRequestHandler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.total_results = total_results
+        self.fixtures_dir = fixtures_dir
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Answer provider requests with fixtures or synthetic data."""
+
+    server: StubProviderServer
+
+    def _inject_faults(self) -> bool:
+        """Apply configured latency; answer with an error if one is drawn."""
+        with self.server.rng_lock:
+            delay = self.server.latency_ms + self.server.rng.uniform(
+                -self.server.jitter_ms, self.server.jitter_ms
+            )
+            fail = self.server.rng.random() < self.server.error_rate
+            status = self.server.rng.choice([429, 500]) if fail else 200
+
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+        if fail:
+            self._send(status, {"error": "injected failure"})
+        return fail
+
+    def do_HEAD(self):
+        """
+        Handle a HEAD request for a posting URL (liveness checks).
+
+        A deterministic DEAD_POSTING_RATE share of URLs answers 404.
+        """
+        if self._inject_faults():
+            return
+
+        dead = zlib.crc32(self.path.encode("utf-8")) % 1000 < DEAD_POSTING_RATE * 1000
+        self.send_response(404 if dead else 200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        """Handle a GET request."""
+        parts = urlsplit(self.path)
+        host, _, path = parts.path.lstrip("/").partition("/")
+        path = "/" + path
+        params = dict(parse_qsl(parts.query))
+
+        if self._inject_faults():
+            return
+
+        fixture = self._load_fixture(host, path, params)
+        if fixture is not None:
+            self._send(fixture["status_code"], fixture["body"].encode("utf-8"))
+            return
+
+        if host not in PROVIDERS:
+            self._send(404, {"error": f"Unknown provider host: {host}"})
+            return
+
+        results_key, page_size, page_of, build, extra = PROVIDERS[host]
+        page = max(page_of(path, params), 1)
+        query = next((params[name] for name in QUERY_PARAMS if name in params), "")
+        seed = f"{query}|{params.get('location', params.get('where', ''))}"
+        if host == "api.adzuna.com":
+            # Each country endpoint has its own postings
+            segments = path.strip("/").split("/")
+            seed += "|" + (segments[3] if len(segments) > 3 else "")
+
+        start = (page - 1) * page_size
+        end = min(start + page_size, self.server.total_results)
+        results = [build(synthetic_posting(i, seed)) for i in range(start, end)]
+
+        body = dict(extra)
+        body[results_key] = results
+        if host == "api.adzuna.com":
+            body["count"] = self.server.total_results
+        self._send(200, body)
+
+    def _load_fixture(self, host: str, path: str, params: Dict[str, str]):
+        """Load a recorded fixture for the original provider URL, if any."""
+        if not self.server.fixtures_dir:
+            return None
+
+        public_params = redact_params(params)
+        fixture_file = fixture_path(
+            self.server.fixtures_dir, f"https://{host}{path}", public_params
+        )
+        if not os.path.exists(fixture_file):
+            return None
+
+        with open(fixture_file, "r") as f:
+            return json.load(f)
+
+    def _send(self, status: int, body):
+        """Write a JSON response."""
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Route access logs through logging at debug level."""
+        logger.debug(format, *args)
+
+
+def start_stub_server(
+    host: str = "127.0.0.1", port: int = 0, **options
+) -> StubProviderServer:
+    """
+    Start a stub server on a background thread.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        **options: StubProviderServer options
+
+    Returns:
+        Running server (call ``shutdown()`` to stop it)
+    """
+    server = StubProviderServer((host, port), **options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    logger.info(f"Stub provider server listening on {server.url}")
+    return server
+
+
+def main():
+    """Run the stub server from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Local stub server for job provider APIs"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--total-results", type=int, default=100)
+    parser.add_argument(
+        "--fixtures", help="Serve recorded fixtures from this directory"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = StubProviderServer(
+        (args.host, args.port),
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        total_results=args.total_results,
+        fixtures_dir=args.fixtures,
+        seed=args.seed,
+    )
+    logger.info(f"Stub provider server listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
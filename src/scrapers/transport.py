@@ -0,0 +1,340 @@
+"""HTTP transports for scrapers: live, record, replay and local stub."""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from ..utils import metrics
+
+logger = logging.getLogger(__name__)
+
+REQUESTS_TOTAL = metrics.counter(
+    "jobsearch_scraper_requests_total",
+    "Provider HTTP requests by host and status code",
+    ["host", "status"],
+)
+REQUEST_SECONDS = metrics.histogram(
+    "jobsearch_scraper_request_seconds",
+    "Provider HTTP request latency in seconds",
+    ["host"],
+)
+
+# Query parameters and headers that carry credentials; never recorded or
+# used in fixture keys
+SECRET_PARAMS = {"api_key", "app_key", "app_id"}
+SECRET_HEADERS = {"x-rapidapi-key", "authorization"}
+
+
+def redact_url(url: str) -> str:
+    """URL with credential query parameters removed."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in SECRET_PARAMS
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def redact_params(params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Query parameters without credentials."""
+    return {
+        k: v for k, v in (params or {}).items() if str(k).lower() not in SECRET_PARAMS
+    }
+
+
+def redact_headers(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Request headers without credentials."""
+    return {
+        k: v for k, v in (headers or {}).items() if k.lower() not in SECRET_HEADERS
+    }
+
+
+def fixture_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Stable key for a request, ignoring credentials.
+
+    Args:
+        url: Request URL
+        params: Query parameters
+
+    Returns:
+        Hex digest identifying the request
+    """
+    public_params = sorted(
+        (str(k), str(v)) for k, v in redact_params(params).items() if v is not None
+    )
+    raw = json.dumps([redact_url(url), public_params], separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def fixture_path(
+    fixtures_dir: str, url: str, params: Optional[Dict[str, Any]] = None
+) -> str:
+    """Path of the fixture file for a request."""
+    host = urlsplit(url).netloc or "local"
+    return os.path.join(fixtures_dir, host, f"{fixture_key(url, params)}.json")
+
+
+def build_response(
+    url: str, status_code: int, body: bytes, content_type: str = "application/json"
+) -> requests.Response:
+    """Build a requests.Response without touching the network."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response._content = body
+    response.headers["Content-Type"] = content_type
+    response.encoding = "utf-8"
+    return response
+
+
+class HttpTransport:
+    """Live transport with a pooled, keep-alive session."""
+
+    def __init__(self):
+        """Initialize HTTP transport."""
+        self.session = requests.Session()
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30,
+    ) -> requests.Response:
+        """
+        Send a GET request.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Request headers
+            timeout: Timeout in seconds
+
+        Returns:
+            HTTP response
+        """
+        return self.session.get(url, params=params, headers=headers, timeout=timeout)
+
+    def head(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30,
+    ) -> requests.Response:
+        """
+        Send a HEAD request, following redirects.
+
+        Args:
+            url: Request URL
+            headers: Request headers
+            timeout: Timeout in seconds
+
+        Returns:
+            HTTP response
+        """
+        return self.session.head(
+            url, headers=headers, timeout=timeout, allow_redirects=True
+        )
+
+
+class RecordingTransport(HttpTransport):
+    """
+    Live transport that also writes every response to a fixture file.
+
+    Credentials are stripped from the recorded URL, query parameters and
+    headers, so fixtures can be committed.
+    """
+
+    def __init__(self, fixtures_dir: str):
+        """
+        Initialize recording transport.
+
+        Args:
+            fixtures_dir: Directory fixtures are written to
+        """
+        super().__init__()
+        self.fixtures_dir = fixtures_dir
+
+    def get(self, url, params=None, headers=None, timeout=30):
+        """Send a GET request and record the response."""
+        response = super().get(url, params=params, headers=headers, timeout=timeout)
+
+        path = fixture_path(self.fixtures_dir, url, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "request": {
+                        "url": redact_url(url),
+                        "params": redact_params(params),
+                        "headers": redact_headers(headers),
+                    },
+                    "status_code": response.status_code,
+                    "content_type": response.headers.get(
+                        "Content-Type", "application/json"
+                    ),
+                    "body": response.text,
+                },
+                f,
+                indent=2,
+            )
+
+        logger.debug("Recorded %s to %s", url, path)
+        return response
+
+
+class ReplayTransport:
+    """Offline transport that serves previously recorded fixtures."""
+
+    def __init__(self, fixtures_dir: str):
+        """
+        Initialize replay transport.
+
+        Args:
+            fixtures_dir: Directory fixtures are read from
+        """
+        self.fixtures_dir = fixtures_dir
+
+    def get(self, url, params=None, headers=None, timeout=30):
+        """Return the recorded response, or a 404 if none was recorded."""
+        path = fixture_path(self.fixtures_dir, url, params)
+
+        if not os.path.exists(path):
+            logger.warning(f"No fixture recorded for {url} ({path})")
+            return build_response(
+                url, 404, json.dumps({"error": "fixture not found"}).encode("utf-8")
+            )
+
+        with open(path, "r") as f:
+            fixture = json.load(f)
+
+        return build_response(
+            url,
+            fixture["status_code"],
+            fixture["body"].encode("utf-8"),
+            fixture.get("content_type", "application/json"),
+        )
+
+    def head(self, url, headers=None, timeout=30):
+        """HEAD requests are never recorded, so they cannot be replayed."""
+        raise requests.ConnectionError(f"No live requests in replay mode: {url}")
+
+
+class StubTransport(HttpTransport):
+    """
+    Transport that redirects provider requests to a local stub server.
+
+    ``https://indeed12.p.rapidapi.com/jobs/search`` becomes
+    ``<stub_url>/indeed12.p.rapidapi.com/jobs/search``.
+    """
+
+    def __init__(self, stub_url: str):
+        """
+        Initialize stub transport.
+
+        Args:
+            stub_url: Base URL of the stub server
+        """
+        super().__init__()
+        self.stub_url = stub_url.rstrip("/")
+
+    def _stub_url(self, url: str) -> str:
+        """Stub server URL for a provider URL."""
+        parts = urlsplit(url)
+        return f"{self.stub_url}/{parts.netloc}{parts.path}"
+
+    def get(self, url, params=None, headers=None, timeout=30):
+        """Send the request to the stub server."""
+        return super().get(
+            self._stub_url(url), params=params, headers=headers, timeout=timeout
+        )
+
+    def head(self, url, headers=None, timeout=30):
+        """Send the HEAD request to the stub server."""
+        return super().head(self._stub_url(url), headers=headers, timeout=timeout)
+
+
+class MeteredTransport:
+    """Wrap a transport to record request latency and status per provider host."""
+
+    def __init__(self, transport):
+        """
+        Initialize metered transport.
+
+        Args:
+            transport: Transport to delegate to
+        """
+        self.transport = transport
+
+    def _send(self, send, url: str, **kwargs) -> requests.Response:
+        """Call a wrapped transport method, recording latency and status."""
+        if not metrics.is_enabled():
+            return send(url, **kwargs)
+
+        host = urlsplit(url).netloc or "local"
+        status = "error"
+        start = time.perf_counter()
+        try:
+            response = send(url, **kwargs)
+            status = str(response.status_code)
+            return response
+        finally:
+            REQUEST_SECONDS.labels(host).observe(time.perf_counter() - start)
+            REQUESTS_TOTAL.labels(host, status).inc()
+
+    def get(self, url, params=None, headers=None, timeout=30):
+        """Send a GET request through the wrapped transport."""
+        return self._send(
+            self.transport.get, url, params=params, headers=headers, timeout=timeout
+        )
+
+    def head(self, url, headers=None, timeout=30):
+        """Send a HEAD request through the wrapped transport."""
+        return self._send(self.transport.head, url, headers=headers, timeout=timeout)
+
+
+def build_transport(config: Optional[Dict[str, Any]] = None):
+    """
+    Create a transport from config, falling back to environment variables.
+
+    Config keys (``scrapers.transport`` in config.yaml) / environment:
+        mode / SCRAPER_TRANSPORT: live, record, replay or stub
+        fixtures_dir / SCRAPER_FIXTURES_DIR: fixture directory
+        stub_url / SCRAPER_STUB_URL: stub server base URL
+
+    Args:
+        config: Transport configuration (optional)
+
+    Returns:
+        Transport instance (wrapped in MeteredTransport)
+    """
+    config = config or {}
+    mode = config.get("mode") or os.getenv("SCRAPER_TRANSPORT", "live")
+    fixtures_dir = config.get("fixtures_dir") or os.getenv(
+        "SCRAPER_FIXTURES_DIR", "fixtures/scrapers"
+    )
+    stub_url = config.get("stub_url") or os.getenv(
+        "SCRAPER_STUB_URL", "http://127.0.0.1:8765"
+    )
+
+    if mode == "record":
+        transport = RecordingTransport(fixtures_dir)
+    elif mode == "replay":
+        transport = ReplayTransport(fixtures_dir)
+    elif mode == "stub":
+        transport = StubTransport(stub_url)
+    elif mode == "live":
+        transport = HttpTransport()
+    else:
+        raise ValueError(f"Unknown scraper transport mode: {mode}")
+    return MeteredTransport(transport)
@@ -1,6 +1,12 @@
 """Utilities package."""
 
-from .config_loader import load_config
-from .logger import setup_logger
+from .config_loader import load_config, offline_config, write_config
+from .logger import configure_logging, setup_logger
 
-__all__ = ["load_config", "setup_logger"]
+__all__ = [
+    "load_config",
+    "offline_config",
+    "write_config",
+    "configure_logging",
+    "setup_logger",
+]
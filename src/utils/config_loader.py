@@ -1,8 +1,9 @@
 """Configuration loader utility."""
 
+import copy
 import os
 import yaml
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 def load_config(config_path: str = None) -> Dict[str, Any]:
@@ -10,11 +11,13 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
     Load configuration from YAML file.
 
     Args:
-        config_path: Path to config file (optional)
+        config_path: Path to config file (optional, defaults to the
+            CONFIG_PATH environment variable, then config/config.yaml)
 
     Returns:
         Configuration dictionary
     """
+    config_path = config_path or os.getenv("CONFIG_PATH")
     if not config_path:
         config_path = os.path.join(
             os.path.dirname(__file__), "../../config/config.yaml"
@@ -27,3 +30,57 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
         config = yaml.safe_load(f)
 
     return config
+
+
+def offline_config(
+    config: Dict[str, Any],
+    stub_url: str,
+    database_url: Optional[str] = None,
+    llm_options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Derive a config that needs no network access or API keys.
+
+    Every scraper is enabled and pointed at the local stub provider server,
+    and analysis uses the fake LLM provider. Used by the benchmarks and the
+    load tester.
+
+    Args:
+        config: Base configuration (not modified)
+        stub_url: Base URL of a running stub provider server
+        database_url: Database URL to use instead of the configured one
+        llm_options: Fake provider options (latency_ms, jitter_ms, ...)
+
+    Returns:
+        New configuration dictionary
+    """
+    config = copy.deepcopy(config)
+
+    if database_url:
+        config.setdefault("database", {})["url"] = database_url
+
+    config["ai"] = {"provider": "fake", "model": "fake", "fake": llm_options or {}}
+
+    scrapers = config.setdefault("scrapers", {})
+    scrapers["transport"] = {"mode": "stub", "stub_url": stub_url}
+    for name in ("serpapi", "adzuna", "indeed", "linkedin", "glassdoor", "monster"):
+        scrapers.setdefault(name, {})["enabled"] = True
+
+    config.setdefault("search", {})["incremental"] = False
+    return config
+
+
+def write_config(config: Dict[str, Any], config_path: str) -> str:
+    """
+    Write a configuration to a YAML file.
+
+    Args:
+        config: Configuration dictionary
+        config_path: Destination file
+
+    Returns:
+        The destination path
+    """
+    with open(config_path, "w") as f:
+        yaml.safe_dump(config, f, sort_keys=False)
+    return config_path
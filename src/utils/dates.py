@@ -0,0 +1,192 @@
+"""
+Parsing of provider posted dates into naive UTC datetimes.
+
+Providers report posting dates as ISO strings, epoch seconds or
+milliseconds, free-form dates ("Jan 5, 2026") or relative phrases
+("3 days ago", "30+ days ago", "Just posted"). ``parse_posted_date`` turns
+all of these into a naive UTC datetime (the convention for every DateTime
+column) or None.
+
+The same few thousand strings repeat across searches, so the text parser
+is memoized. Relative phrases are cached as offsets and applied to the
+reference time on every call, so cached results never go stale.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Union
+
+try:
+    from dateutil import parser as dateutil_parser
+except ImportError:  # pragma: no cover - depends on environment
+    dateutil_parser = None
+
+# Distinct date strings remembered by the parser
+PARSE_CACHE_SIZE = 65536
+
+# Epoch values above this are milliseconds (1e11 s is the year 5138)
+EPOCH_MILLIS_THRESHOLD = 1e11
+
+_UNIT_SECONDS = {
+    "second": 1,
+    "sec": 1,
+    "minute": 60,
+    "min": 60,
+    "hour": 3600,
+    "hr": 3600,
+    "h": 3600,
+    "day": 86400,
+    "d": 86400,
+    "week": 7 * 86400,
+    "wk": 7 * 86400,
+    "w": 7 * 86400,
+    "month": 30 * 86400,
+    "mo": 30 * 86400,
+    "year": 365 * 86400,
+    "yr": 365 * 86400,
+    "y": 365 * 86400,
+}
+
+_RELATIVE_PATTERN = re.compile(
+    r"^(?:posted\s+)?(an?|\d+)\+?\s*([a-z]+?)s?\s+ago$"
+)
+
+_RELATIVE_WORDS = {
+    "just posted": 0,
+    "just now": 0,
+    "today": 0,
+    "new": 0,
+    "yesterday": 86400,
+}
+
+_ABSOLUTE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%d.%m.%Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%d %b %Y",
+    "%d %B %Y",
+)
+
+# Parsed text: ("absolute", datetime) or ("relative", timedelta)
+_Parsed = Optional[Tuple[str, Union[datetime, timedelta]]]
+
+
+def to_utc_naive(value: datetime) -> datetime:
+    """Convert an aware datetime to naive UTC (naive values are returned as-is)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _from_epoch(value: float) -> Optional[datetime]:
+    """Epoch seconds or milliseconds to naive UTC."""
+    if value >= EPOCH_MILLIS_THRESHOLD:
+        value /= 1000.0
+    try:
+        return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def _parse_relative(text: str) -> Optional[timedelta]:
+    """Offset for phrases like "3 days ago", "an hour ago" or "yesterday"."""
+    if text in _RELATIVE_WORDS:
+        return timedelta(seconds=_RELATIVE_WORDS[text])
+
+    match = _RELATIVE_PATTERN.match(text)
+    if not match:
+        return None
+
+    amount, unit = match.groups()
+    seconds = _UNIT_SECONDS.get(unit)
+    if seconds is None:
+        return None
+    count = 1 if amount in ("a", "an") else int(amount)
+    return timedelta(seconds=count * seconds)
+
+
+def _parse_absolute(text: str) -> Optional[datetime]:
+    """Absolute date or datetime in one of the common provider formats."""
+    try:
+        return to_utc_naive(datetime.fromisoformat(text.replace("Z", "+00:00")))
+    except ValueError:
+        pass
+
+    for fmt in _ABSOLUTE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+
+    try:
+        return to_utc_naive(parsedate_to_datetime(text))
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    if dateutil_parser is not None:
+        try:
+            return to_utc_naive(dateutil_parser.parse(text))
+        except (ValueError, OverflowError):
+            pass
+
+    return None
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_text(text: str) -> _Parsed:
+    """Parse (and cache) one date string."""
+    cleaned = text.strip()
+    if not cleaned:
+        return None
+
+    if re.fullmatch(r"\d{9,}(\.\d+)?", cleaned):
+        posted = _from_epoch(float(cleaned))
+        return ("absolute", posted) if posted else None
+
+    offset = _parse_relative(re.sub(r"\s+", " ", cleaned.lower()))
+    if offset is not None:
+        return ("relative", offset)
+
+    posted = _parse_absolute(cleaned)
+    return ("absolute", posted) if posted else None
+
+
+def parse_posted_date(value: Any, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Convert a provider posted date to naive UTC.
+
+    Args:
+        value: datetime, epoch seconds/milliseconds, or date string
+            (absolute or relative)
+        now: Reference time (naive UTC) for relative phrases (default: utcnow)
+
+    Returns:
+        Naive UTC datetime, or None if the value cannot be parsed
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, datetime):
+        return to_utc_naive(value)
+    if isinstance(value, (int, float)):
+        return _from_epoch(float(value))
+    if not isinstance(value, str):
+        return None
+
+    parsed = _parse_text(value)
+    if parsed is None:
+        return None
+
+    kind, result = parsed
+    if kind == "relative":
+        return (now or datetime.utcnow()) - result
+    return result
+
+
+def parse_cache_info():
+    """Hit/miss statistics of the memoized text parser."""
+    return _parse_text.cache_info()
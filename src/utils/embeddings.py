@@ -0,0 +1,176 @@
+"""
+Offline text embeddings for semantic job search.
+
+Jobs and queries are embedded with the hashing trick: word unigrams and
+bigrams, character n-grams of title words (so "developer" and "development"
+overlap) and whole skill names are hashed into a fixed number of signed
+buckets. Term counts are dampened (1 + log tf), weighted by field (title and
+skills outweigh the description) and the vector is L2-normalized, so a dot
+product is the cosine similarity.
+
+No vocabulary, model file or network access is needed, and a job's vector
+never changes as the corpus grows, which lets the vector index be updated
+one job at a time.
+
+Requires numpy (``pip install numpy``).
+"""
+
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+
+# Buckets per vector (int8-quantized in the index: bytes per job)
+EMBEDDING_DIM = 256
+
+# Field weights: the title says most about the role
+TITLE_WEIGHT = 3.0
+SKILL_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+CHAR_NGRAM_WEIGHT = 0.5
+
+# Character n-gram length for title words
+CHAR_NGRAM = 4
+
+# Description words embedded; the opening of a posting describes the role
+MAX_DESCRIPTION_TOKENS = 400
+
+# Keeps "c++", "c#", "node.js" and "ci/cd" as single tokens
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./]*[a-z0-9+#]|[a-z0-9]")
+
+STOP_WORDS = frozenset(
+    """
+    a about above after all also an and any are as at be been being but by can
+    could do does for from had has have he her his how i if in into is it its
+    job just may me more most must no not of on one or our out over per role
+    she should so some such than that the their them then there these they
+    this those through to under up us very was we were what when where which
+    while who will with within without work would you your
+    """.split()
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercased word tokens of a text, without stop words."""
+    if not text:
+        return []
+    return [
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in STOP_WORDS
+    ]
+
+
+def skill_names(value: Any) -> List[str]:
+    """
+    Skill names from a skills column value.
+
+    Args:
+        value: List of skills, or an analysis dictionary with
+            ``required_skills`` / ``technologies`` lists
+
+    Returns:
+        Lowercased skill names
+    """
+    if isinstance(value, dict):
+        value = (value.get("required_skills") or []) + (
+            value.get("technologies") or []
+        )
+    if not isinstance(value, (list, tuple)):
+        return []
+    return [str(skill).strip().lower() for skill in value if skill]
+
+
+def _char_ngrams(tokens: Iterable[str]) -> List[str]:
+    """Character n-grams of words, with word boundaries marked."""
+    grams = []
+    for token in tokens:
+        word = f"<{token}>"
+        if len(word) <= CHAR_NGRAM:
+            continue
+        grams.extend(
+            "#" + word[i:i + CHAR_NGRAM] for i in range(len(word) - CHAR_NGRAM + 1)
+        )
+    return grams
+
+
+def _bigrams(tokens: List[str]) -> List[str]:
+    return [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def _add(weights: Dict[int, float], features: List[str], weight: float):
+    """Add dampened term counts of features to bucket weights."""
+    for feature, count in Counter(features).items():
+        bucket = zlib.crc32(feature.encode("utf-8"))
+        value = weight * (1.0 + math.log(count))
+        index = bucket % EMBEDDING_DIM
+        # The top bit picks the sign, so collisions cancel out on average
+        weights[index] = weights.get(index, 0.0) + (
+            value if bucket & 0x80000000 else -value
+        )
+
+
+def embed(
+    title: Optional[str],
+    description: Optional[str] = None,
+    skills: Any = None,
+):
+    """
+    Embed a job.
+
+    Args:
+        title: Job title (or a free-text query)
+        description: Job description
+        skills: Skills list or analysis dictionary (see skill_names)
+
+    Returns:
+        L2-normalized float32 vector of EMBEDDING_DIM values (all zeros if
+        there is no text)
+
+    Raises:
+        RuntimeError: If numpy is not installed
+    """
+    if np is None:
+        raise RuntimeError("Semantic search requires numpy (pip install numpy)")
+
+    weights: Dict[int, float] = {}
+    title_tokens = tokenize(title)
+    _add(weights, title_tokens + _bigrams(title_tokens), TITLE_WEIGHT)
+    _add(weights, _char_ngrams(title_tokens), CHAR_NGRAM_WEIGHT)
+    _add(weights, skill_names(skills), SKILL_WEIGHT)
+
+    description_tokens = tokenize(description)[:MAX_DESCRIPTION_TOKENS]
+    _add(
+        weights,
+        description_tokens + _bigrams(description_tokens),
+        DESCRIPTION_WEIGHT,
+    )
+
+    vector = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    if weights:
+        vector[list(weights)] = list(weights.values())
+        norm = float(np.linalg.norm(vector))
+        if norm:
+            vector /= norm
+    return vector
+
+
+def embed_query(text: str):
+    """
+    Embed a free-text search query ("backend python developer").
+
+    Queries are short, so every word counts as a title word.
+
+    Args:
+        text: Query text
+
+    Returns:
+        L2-normalized float32 vector (see embed)
+    """
+    return embed(text)
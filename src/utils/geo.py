@@ -0,0 +1,373 @@
+"""
+Offline location normalization and radius search helpers.
+
+Job locations are free text ("Austin, TX 78701", "Greater Seattle Area",
+"Remote in Denver, CO", "London"). ``resolve_location`` maps them to a
+``Place`` from the bundled gazetteer (``data/gazetteer.csv``: countries,
+US states, Canadian provinces and major cities) without any network call.
+Results are memoized, since the same few thousand strings repeat across
+searches.
+
+A different gazetteer in the same CSV format (e.g. a GeoNames export) can be
+configured with ``location.gazetteer``.
+"""
+
+import csv
+import logging
+import math
+import os
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(__file__), "data", "gazetteer.csv")
+
+# Distinct location strings remembered by the resolver
+RESOLVE_CACHE_SIZE = 65536
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180.0
+DEFAULT_RADIUS_KM = 50.0
+
+_REMOTE_PATTERN = re.compile(
+    r"^(?:100%\s+)?(?:remote|anywhere|work from home|wfh|virtual|telecommute)"
+    r"(?:\s+(?:in|from|within|-|–)\s*|\s*$)"
+)
+_AREA_PATTERN = re.compile(
+    r"^(?:greater\s+)?(.+?)(?:\s+(?:metropolitan|metro))?\s+area$"
+)
+_POSTCODE_PATTERN = re.compile(r"\b\d{5}(?:-\d{4})?\b")
+_COORDINATES_PATTERN = re.compile(
+    r"^\s*(-?\d{1,2}(?:\.\d+)?)\s*,\s*(-?\d{1,3}(?:\.\d+)?)\s*$"
+)
+
+
+class Place(NamedTuple):
+    """One gazetteer entry."""
+
+    kind: str  # city, region or country
+    name: str
+    region: Optional[str]  # ISO 3166-2 code ("US-CA"), None if not known
+    country: str  # ISO 3166-1 alpha-2 code
+    latitude: float
+    longitude: float
+    population: int
+    linkedin_geo_id: Optional[str]
+
+
+def _key(text: str) -> str:
+    """Lookup key: lowercase with collapsed whitespace and no trailing dots."""
+    return re.sub(r"\s+", " ", text.strip().lower()).strip(" .")
+
+
+class Gazetteer:
+    """In-memory place index built from a gazetteer CSV."""
+
+    def __init__(self, entries: List[Tuple[Place, Set[str]]]):
+        """
+        Initialize gazetteer.
+
+        Args:
+            entries: (place, lookup keys) pairs; keys are lowercase names,
+                aliases and codes
+        """
+        self.places = [place for place, _ in entries]
+        self.cities: Dict[str, List[Place]] = {}
+        self.regions: Dict[str, List[Place]] = {}
+        self.countries: Dict[str, Place] = {}
+
+        for place, keys in entries:
+            if place.kind == "city":
+                for key in keys:
+                    self.cities.setdefault(key, []).append(place)
+            elif place.kind == "region":
+                for key in keys:
+                    self.regions.setdefault(key, []).append(place)
+            elif place.kind == "country":
+                for key in keys:
+                    self.countries.setdefault(key, place)
+
+        # Most populous first, so "Cambridge" is Cambridge, UK
+        for index in (self.cities, self.regions):
+            for candidates in index.values():
+                candidates.sort(key=lambda place: -place.population)
+
+    @classmethod
+    def load(cls, path: str = GAZETTEER_PATH) -> "Gazetteer":
+        """
+        Load a gazetteer CSV.
+
+        Columns: kind, name, region, country, latitude, longitude,
+        population, aliases (``|``-separated) and linkedin_geo_id.
+
+        Args:
+            path: CSV file path
+
+        Returns:
+            Gazetteer
+        """
+        entries = []
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                country = row["country"].upper()
+                region = row["region"].upper()
+                place = Place(
+                    kind=row["kind"],
+                    name=row["name"],
+                    region=f"{country}-{region}" if region else None,
+                    country=country,
+                    latitude=float(row["latitude"]),
+                    longitude=float(row["longitude"]),
+                    population=int(row["population"] or 0),
+                    linkedin_geo_id=row["linkedin_geo_id"] or None,
+                )
+                keys = {_key(row["name"])}
+                keys.update(
+                    _key(alias) for alias in row["aliases"].split("|") if alias
+                )
+                if place.kind == "region":
+                    keys.add(region.lower())
+                elif place.kind == "country":
+                    keys.add(country.lower())
+                entries.append((place, keys))
+
+        logger.debug("Loaded %d gazetteer entries from %s", len(entries), path)
+        return cls(entries)
+
+    def country(self, code: str) -> Optional[Place]:
+        """Country entry for an ISO 3166-1 alpha-2 code."""
+        return self.countries.get(code.lower())
+
+    def _lookup(self, key: str) -> List[Place]:
+        """Cities, then regions, then the country matching a key."""
+        places = self.cities.get(key, []) + self.regions.get(key, [])
+        if key in self.countries:
+            places.append(self.countries[key])
+        return places
+
+    def resolve(self, text: str) -> Optional[Place]:
+        """
+        Resolve free-text location to the most specific matching place.
+
+        "City, State", "City, Country", bare city, state or country names
+        and codes are understood; postcodes, "Greater ... Area" and remote
+        markers ("Remote in Denver, CO") are stripped. Ambiguous names pick
+        the entry consistent with the qualifiers, then the most populous.
+
+        Args:
+            text: Location text
+
+        Returns:
+            Place, or None for remote-only or unknown locations
+        """
+        cleaned = _POSTCODE_PATTERN.sub("", re.sub(r"\(.*?\)", "", text.lower()))
+        cleaned = _REMOTE_PATTERN.sub("", _key(cleaned))
+        parts = [_key(part) for part in re.split(r",|\s[-–|/]\s", cleaned)]
+        parts = [part for part in parts if part and not _REMOTE_PATTERN.match(part)]
+        if not parts:
+            return None
+
+        name, qualifiers = parts[0], parts[1:]
+        area = _AREA_PATTERN.match(name)
+
+        # Each qualifier (state, country) narrows the acceptable places
+        constraints = []
+        for qualifier in qualifiers:
+            options = [
+                (place.region, place.country)
+                for place in self.regions.get(qualifier, [])
+            ]
+            if qualifier in self.countries:
+                options.append((None, self.countries[qualifier].country))
+            if options:
+                constraints.append(options)
+
+        def matches(place: Place) -> bool:
+            return all(
+                any(
+                    place.country == country
+                    and (region is None or place.region == region)
+                    for region, country in options
+                )
+                for options in constraints
+            )
+
+        candidates = self._lookup(name)
+        if not candidates and area:
+            candidates = self._lookup(area.group(1))
+        if not candidates and name.startswith("greater "):
+            candidates = self._lookup(name[len("greater "):])
+
+        for place in candidates:
+            if matches(place):
+                return place
+
+        # Unknown town: fall back to its state or country
+        for qualifier in qualifiers:
+            for place in self.regions.get(qualifier, []) + (
+                [self.countries[qualifier]] if qualifier in self.countries else []
+            ):
+                if matches(place):
+                    return place
+
+        return None
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_path = GAZETTEER_PATH
+
+
+def configure(gazetteer_path: Optional[str] = None):
+    """
+    Use a different gazetteer CSV (None for the bundled one).
+
+    Args:
+        gazetteer_path: Path of a CSV in the bundled gazetteer's format
+    """
+    global _gazetteer, _gazetteer_path
+    path = gazetteer_path or GAZETTEER_PATH
+    if path != _gazetteer_path:
+        _gazetteer_path = path
+        _gazetteer = None
+        resolve_location.cache_clear()
+
+
+def get_gazetteer() -> Gazetteer:
+    """The configured gazetteer (loaded on first use)."""
+    global _gazetteer
+    if _gazetteer is None:
+        _gazetteer = Gazetteer.load(_gazetteer_path)
+    return _gazetteer
+
+
+@lru_cache(maxsize=RESOLVE_CACHE_SIZE)
+def resolve_location(text: str) -> Optional[Place]:
+    """
+    Resolve (and cache) a free-text location.
+
+    Args:
+        text: Location text, e.g. "Austin, TX" or "Greater London"
+
+    Returns:
+        Place, or None for remote-only or unknown locations
+    """
+    if not text:
+        return None
+    return get_gazetteer().resolve(text)
+
+
+def is_remote(text: str) -> bool:
+    """Whether a location is only a remote marker ("Remote", "Anywhere")."""
+    return bool(_REMOTE_PATTERN.match(_key(text))) and resolve_location(text) is None
+
+
+def location_columns(
+    text: Optional[str], country: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Normalized location column values for a job row.
+
+    Only city-level matches get coordinates: a state or country centroid
+    would put jobs at a misleading point for radius searches.
+
+    Args:
+        text: Job location text
+        country: Country the provider reported the job in (ISO 3166-1
+            alpha-2); wins over the text, e.g. "Cambridge" in a US feed
+
+    Returns:
+        Dictionary with latitude, longitude, region and country
+    """
+    place = resolve_location(text) if text else None
+    if country:
+        country = country.upper()
+        if place is not None and place.country != country:
+            place = resolve_location(f"{text}, {country}")
+        if place is None or place.country != country:
+            return {
+                "latitude": None,
+                "longitude": None,
+                "region": None,
+                "country": country,
+            }
+
+    if place is None:
+        return {"latitude": None, "longitude": None, "region": None, "country": None}
+
+    is_city = place.kind == "city"
+    return {
+        "latitude": place.latitude if is_city else None,
+        "longitude": place.longitude if is_city else None,
+        "region": place.region,
+        "country": place.country,
+    }
+
+
+def parse_point(text: str) -> Optional[Tuple[float, float]]:
+    """
+    Coordinates for a radius search center.
+
+    Args:
+        text: "lat,lon" or a place name ("Austin, TX")
+
+    Returns:
+        (latitude, longitude), or None if the text cannot be resolved
+    """
+    match = _COORDINATES_PATTERN.match(text)
+    if match:
+        latitude, longitude = float(match.group(1)), float(match.group(2))
+        if -90 <= latitude <= 90 and -180 <= longitude <= 180:
+            return latitude, longitude
+        return None
+
+    place = resolve_location(text)
+    if place is None:
+        return None
+    return place.latitude, place.longitude
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometers."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(dphi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def bounding_box(
+    latitude: float, longitude: float, radius_km: float
+) -> Tuple[float, float, float, float]:
+    """
+    Latitude/longitude box containing a circle.
+
+    Boxes are clamped at the poles and the antimeridian rather than
+    wrapped, so searches across ±180° longitude are cut off there.
+
+    Args:
+        latitude: Center latitude
+        longitude: Center longitude
+        radius_km: Circle radius
+
+    Returns:
+        (min_lat, max_lat, min_lon, max_lon)
+    """
+    dlat = radius_km / KM_PER_DEGREE
+    cos_lat = math.cos(math.radians(latitude))
+    dlon = 180.0 if cos_lat < 1e-6 else min(dlat / cos_lat, 180.0)
+    return (
+        max(latitude - dlat, -90.0),
+        min(latitude + dlat, 90.0),
+        max(longitude - dlon, -180.0),
+        min(longitude + dlon, 180.0),
+    )
+
+
+def cache_info():
+    """Hit/miss statistics of the memoized resolver."""
+    return resolve_location.cache_info()
@@ -0,0 +1,62 @@
+"""
+Fast JSON encoding and decoding with a standard library fallback.
+
+Uses orjson when it is installed (``pip install orjson``) and the stdlib
+``json`` module otherwise. Set ``JSON_BACKEND=json`` to force the fallback.
+
+Usage:
+    from ..utils import json_backend
+
+    data = json_backend.loads(response.content)
+    body = json_backend.dumps_bytes(payload)
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def _stdlib_dumps_bytes(obj: Any, default: Optional[Callable] = None) -> bytes:
+    """Encode with the json module (compact, UTF-8)."""
+    return json.dumps(
+        obj, default=default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _orjson_dumps_bytes(obj: Any, default: Optional[Callable] = None) -> bytes:
+    """Encode with orjson (non-string dict keys allowed, like json)."""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+# name -> (dumps_bytes, loads)
+BACKENDS: Dict[str, Tuple[Callable[..., bytes], Callable[[Any], Any]]] = {
+    "json": (_stdlib_dumps_bytes, json.loads),
+}
+if orjson is not None:
+    BACKENDS["orjson"] = (_orjson_dumps_bytes, orjson.loads)
+
+BACKEND = os.getenv("JSON_BACKEND") or ("orjson" if orjson is not None else "json")
+if BACKEND not in BACKENDS:
+    BACKEND = "json"
+
+dumps_bytes, loads = BACKENDS[BACKEND]
+
+
+def dumps(obj: Any, default: Optional[Callable] = None) -> str:
+    """
+    Encode an object as a compact JSON string.
+
+    Args:
+        obj: Object to encode
+        default: Called for objects the backend cannot encode
+
+    Returns:
+        JSON text
+    """
+    return dumps_bytes(obj, default).decode("utf-8")
+
@@ -0,0 +1,625 @@
+"""
+HTTP load generator for the Flask API.
+
+Closed-loop mode keeps a fixed number of virtual users, each sending its
+next request as soon as the previous one returns. Open-loop mode sends
+requests at a target arrival rate regardless of how fast the server
+answers, and measures latency from the scheduled send time so queueing
+delay is not hidden (no coordinated omission).
+
+The load level (users or requests/second) is stepped through a ramp
+profile; each stage reports throughput and latency per endpoint, which
+together form the saturation curve. By default the API runs in-process
+on a temporary database, with scrapers pointed at the local stub provider
+server and analysis using the fake LLM provider.
+
+Usage:
+    python -m src.main --load-test --mode closed --start 1 --end 32 --steps 6
+    python -m src.main --load-test --mode open --start 10 --end 200 --ramp linear
+    python -m src.main --load-test --target http://localhost:5000 --mix jobs=1,stats=1
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from .config_loader import load_config, offline_config, write_config
+
+logger = logging.getLogger(__name__)
+
+# Endpoint name -> (method, path template)
+ENDPOINTS: Dict[str, Tuple[str, str]] = {
+    "health": ("GET", "/health"),
+    "jobs": ("GET", "/api/jobs?limit=50"),
+    "jobs_by_source": ("GET", "/api/jobs?limit=50&source=indeed"),
+    "jobs_by_keywords": ("GET", "/api/jobs?limit=50&keywords=engineer"),
+    "job": ("GET", "/api/jobs/{job_id}"),
+    "stats": ("GET", "/api/stats"),
+    "search": ("POST", "/api/search"),
+}
+
+DEFAULT_MIX = "jobs=50,job=20,stats=20,search=10"
+
+RAMP_PROFILES = ("constant", "step", "linear")
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is +Inf
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Search queries cycled by the "search" endpoint; repeats hit known jobs
+SEARCH_KEYWORDS = [
+    "Python Developer",
+    "Data Engineer",
+    "Backend Engineer",
+    "Site Reliability Engineer",
+    "Machine Learning Engineer",
+    "Frontend Developer",
+    "Product Manager",
+    "Data Scientist",
+]
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """
+    Parse a request mix such as ``jobs=60,stats=30,search=10``.
+
+    Args:
+        spec: Comma-separated endpoint=weight pairs
+
+    Returns:
+        Endpoint name -> normalized weight
+    """
+    weights = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(
+                f"Unknown endpoint '{name}' (choose from {', '.join(ENDPOINTS)})"
+            )
+        weights[name] = float(weight or 1)
+
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError("Request mix needs at least one positive weight")
+    return {name: weight / total for name, weight in weights.items()}
+
+
+def ramp_levels(profile: str, start: float, end: float, steps: int) -> List[float]:
+    """
+    Load level for each stage of a ramp.
+
+    Args:
+        profile: constant (``start`` throughout), step or linear (levels
+            evenly spaced from ``start`` to ``end``; LoadTest gives linear
+            ramps one stage per second)
+        start: First level
+        end: Last level
+        steps: Number of stages
+
+    Returns:
+        List of levels
+    """
+    if profile not in RAMP_PROFILES:
+        raise ValueError(f"Unknown ramp profile: {profile}")
+    if profile == "constant" or steps <= 1:
+        return [start] * max(steps, 1)
+    return [start + (end - start) * i / (steps - 1) for i in range(steps)]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0.0 for no samples)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(pct / 100.0 * len(ordered)), 1) - 1]
+
+
+class EndpointStats:
+    """Latency samples and outcomes for one endpoint (thread-safe)."""
+
+    def __init__(self):
+        """Initialize empty stats."""
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.status_codes: Dict[int, int] = {}
+        self.lock = threading.Lock()
+
+    def record(self, latency: float, status: Optional[int]):
+        """Record one request (status None means the request failed)."""
+        with self.lock:
+            self.latencies.append(latency)
+            if status is None or status >= 400:
+                self.errors += 1
+            key = status or 0
+            self.status_codes[key] = self.status_codes.get(key, 0) + 1
+
+    def merge(self, other: "EndpointStats"):
+        """Add another endpoint's samples to this one."""
+        with self.lock:
+            self.latencies.extend(other.latencies)
+            self.errors += other.errors
+            for status, count in other.status_codes.items():
+                self.status_codes[status] = self.status_codes.get(status, 0) + count
+
+    def histogram(self) -> Dict[str, int]:
+        """Non-cumulative bucket counts keyed by upper bound in ms."""
+        counts = {str(bound): 0 for bound in HISTOGRAM_BUCKETS_MS}
+        counts["+Inf"] = 0
+        for latency in self.latencies:
+            ms = latency * 1000.0
+            for bound in HISTOGRAM_BUCKETS_MS:
+                if ms <= bound:
+                    counts[str(bound)] += 1
+                    break
+            else:
+                counts["+Inf"] += 1
+        return counts
+
+    def summary(self, seconds: float) -> Dict[str, Any]:
+        """
+        Summarize recorded requests.
+
+        Args:
+            seconds: Wall-clock duration the requests were spread over
+
+        Returns:
+            Dictionary with count, errors, throughput and latency percentiles
+        """
+        count = len(self.latencies)
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "throughput": round(count / seconds, 2) if seconds else 0.0,
+            "latency_ms": {
+                "p50": round(percentile(self.latencies, 50) * 1000, 3),
+                "p95": round(percentile(self.latencies, 95) * 1000, 3),
+                "p99": round(percentile(self.latencies, 99) * 1000, 3),
+                "max": round(max(self.latencies) * 1000, 3) if count else 0.0,
+            },
+            "status_codes": {str(k): v for k, v in sorted(self.status_codes.items())},
+        }
+
+
+class LoadTest:
+    """Drive a running API with a weighted request mix."""
+
+    def __init__(
+        self,
+        base_url: str,
+        mix: Dict[str, float],
+        mode: str = "closed",
+        ramp: str = "step",
+        start: float = 1,
+        end: float = 16,
+        steps: int = 5,
+        duration: float = 60,
+        think_ms: float = 0.0,
+        timeout: float = 30,
+        max_workers: int = 256,
+        seed: int = 0,
+    ):
+        """
+        Initialize load test.
+
+        Args:
+            base_url: API base URL
+            mix: Endpoint name -> weight (see parse_mix)
+            mode: closed (level = concurrent users) or open (level = req/s)
+            ramp: Ramp profile (constant, step or linear)
+            start: Load level of the first stage
+            end: Load level of the last stage
+            steps: Number of stages (linear ramps use one per second)
+            duration: Total duration in seconds
+            think_ms: Closed loop: pause between a user's requests
+            timeout: Per-request timeout in seconds
+            max_workers: Open loop: maximum requests in flight
+            seed: Random seed for the request mix
+        """
+        if mode not in ("open", "closed"):
+            raise ValueError(f"Unknown load test mode: {mode}")
+
+        self.base_url = base_url.rstrip("/")
+        self.mix = mix
+        self.mode = mode
+        self.ramp = ramp
+        self.duration = duration
+        self.think_ms = think_ms
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+        if ramp == "linear":
+            steps = max(int(duration), 1)
+        self.levels = ramp_levels(ramp, start, end, steps)
+        self.stage_seconds = duration / len(self.levels)
+
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.local = threading.local()
+        self.job_ids: List[int] = []
+
+    def _session(self) -> requests.Session:
+        """Keep-alive session for the current thread."""
+        session = getattr(self.local, "session", None)
+        if session is None:
+            session = self.local.session = requests.Session()
+        return session
+
+    def _pick(self) -> Tuple[str, Dict[str, Any]]:
+        """Choose the next endpoint and its parameters."""
+        with self.rng_lock:
+            name = self.rng.choices(list(self.mix), weights=list(self.mix.values()))[0]
+            params = {
+                "job_id": self.rng.choice(self.job_ids) if self.job_ids else 1,
+                "keywords": self.rng.choice(SEARCH_KEYWORDS),
+            }
+        return name, params
+
+    def request(self, name: str, params: Dict[str, Any]) -> Optional[int]:
+        """
+        Send one request.
+
+        Args:
+            name: Endpoint name
+            params: job_id and keywords used to fill in the request
+
+        Returns:
+            HTTP status, or None if the request failed
+        """
+        method, path = ENDPOINTS[name]
+        url = self.base_url + path.format(job_id=params["job_id"])
+        try:
+            if method == "POST":
+                response = self._session().post(
+                    url,
+                    json={
+                        "keywords": params["keywords"],
+                        "location": "Remote",
+                        "response_mode": "ids",
+                    },
+                    timeout=self.timeout,
+                )
+            else:
+                response = self._session().get(url, timeout=self.timeout)
+            return response.status_code
+        except requests.RequestException as e:
+            logger.debug(f"{name} request failed: {str(e)}")
+            return None
+
+    def discover_job_ids(self, limit: int = 500):
+        """Collect existing job IDs for the single-job endpoint."""
+        try:
+            response = self._session().get(
+                f"{self.base_url}/api/jobs?limit={limit}", timeout=self.timeout
+            )
+            self.job_ids = [job["id"] for job in response.json().get("jobs", [])]
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Could not list job IDs: {str(e)}")
+        logger.info(f"Using {len(self.job_ids)} job IDs for single-job requests")
+
+    def _run_closed_stage(self, users: int, stats: Dict[str, EndpointStats]):
+        """Run ``users`` concurrent request loops for one stage."""
+        deadline = time.perf_counter() + self.stage_seconds
+
+        def user_loop():
+            while time.perf_counter() < deadline:
+                name, params = self._pick()
+                sent = time.perf_counter()
+                status = self.request(name, params)
+                stats[name].record(time.perf_counter() - sent, status)
+                if self.think_ms:
+                    time.sleep(self.think_ms / 1000.0)
+
+        threads = [
+            threading.Thread(target=user_loop, daemon=True)
+            for _ in range(max(int(round(users)), 1))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _run_open_stage(
+        self,
+        rate: float,
+        stats: Dict[str, EndpointStats],
+        executor: ThreadPoolExecutor,
+    ) -> List[Any]:
+        """Issue Poisson arrivals at ``rate`` req/s for one stage."""
+        futures = []
+        stage_start = time.perf_counter()
+        next_send = stage_start
+
+        def send(name, params, scheduled):
+            status = self.request(name, params)
+            stats[name].record(time.perf_counter() - scheduled, status)
+
+        while rate > 0:
+            with self.rng_lock:
+                next_send += self.rng.expovariate(rate)
+            if next_send - stage_start >= self.stage_seconds:
+                break
+
+            delay = next_send - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            name, params = self._pick()
+            futures.append(executor.submit(send, name, params, next_send))
+
+        remaining = stage_start + self.stage_seconds - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+        return futures
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run every stage of the ramp.
+
+        Returns:
+            Report with per-stage (saturation curve) and overall results
+        """
+        unit = "users" if self.mode == "closed" else "req/s"
+        stages = []
+        totals = {name: EndpointStats() for name in self.mix}
+        started = time.perf_counter()
+        executor = (
+            ThreadPoolExecutor(max_workers=self.max_workers)
+            if self.mode == "open"
+            else None
+        )
+
+        try:
+            for index, level in enumerate(self.levels):
+                logger.info(
+                    f"Stage {index + 1}/{len(self.levels)}: {level:g} {unit} "
+                    f"for {self.stage_seconds:g}s"
+                )
+                stats = {name: EndpointStats() for name in self.mix}
+                stage_start = time.perf_counter()
+
+                if self.mode == "closed":
+                    self._run_closed_stage(level, stats)
+                else:
+                    # Let this stage's in-flight requests finish before
+                    # summarizing, so late answers count against it
+                    for future in self._run_open_stage(level, stats, executor):
+                        future.result()
+
+                elapsed = time.perf_counter() - stage_start
+                overall = EndpointStats()
+                for name, endpoint_stats in stats.items():
+                    overall.merge(endpoint_stats)
+                    totals[name].merge(endpoint_stats)
+
+                stages.append(
+                    {
+                        "stage": index + 1,
+                        "level": level,
+                        "seconds": round(elapsed, 3),
+                        "overall": overall.summary(elapsed),
+                        "endpoints": {
+                            name: s.summary(elapsed) for name, s in stats.items()
+                        },
+                    }
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        elapsed = time.perf_counter() - started
+        return {
+            "mode": self.mode,
+            "level_unit": unit,
+            "ramp": self.ramp,
+            "duration": round(elapsed, 3),
+            "mix": self.mix,
+            "stages": stages,
+            "endpoints": {
+                name: dict(s.summary(elapsed), histogram_ms=s.histogram())
+                for name, s in totals.items()
+            },
+        }
+
+
+def start_local_target(
+    database_url: Optional[str] = None,
+    stub_latency_ms: float = 0.0,
+    llm_latency_ms: float = 0.0,
+    warmup_searches: int = 4,
+) -> Tuple[str, Callable[[], None]]:
+    """
+    Serve ``src.api.server.app`` in-process against local stubs.
+
+    Args:
+        database_url: Database to use (default: a temporary SQLite file)
+        stub_latency_ms: Simulated provider latency
+        llm_latency_ms: Simulated fake LLM latency
+        warmup_searches: Searches run first so the database has jobs
+
+    Returns:
+        (base URL, shutdown function)
+    """
+    from werkzeug.serving import make_server
+
+    from ..scrapers.stub_server import start_stub_server
+
+    work_dir = tempfile.mkdtemp(prefix="jobsearch-loadtest-")
+    database_url = database_url or f"sqlite:///{os.path.join(work_dir, 'jobs.db')}"
+
+    stub = start_stub_server(latency_ms=stub_latency_ms, total_results=500)
+    config = offline_config(
+        load_config(),
+        stub.url,
+        database_url=database_url,
+        llm_options={"latency_ms": llm_latency_ms},
+    )
+    # The server module builds its agent from CONFIG_PATH at import time
+    os.environ["CONFIG_PATH"] = write_config(
+        config, os.path.join(work_dir, "config.yaml")
+    )
+
+    from ..api.server import app, agent
+    from ..database import db
+
+    db.create_tables()
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    logger.info(f"API serving on {base_url} (database: {database_url})")
+
+    for keywords in SEARCH_KEYWORDS[:warmup_searches]:
+        agent.execute_search(keywords=keywords, location="Remote", response_mode="ids")
+
+    def shutdown():
+        server.shutdown()
+        stub.shutdown()
+
+    return base_url, shutdown
+
+
+def print_report(report: Dict[str, Any]):
+    """Print the saturation curve and per-endpoint results."""
+    level_label = "users" if report["mode"] == "closed" else "offered/s"
+    print(f"\n{'='*80}")
+    print(f"Saturation curve ({report['mode']} loop, {report['ramp']} ramp)")
+    print(f"{'='*80}")
+    print(
+        f"{level_label:>10} {'req/s':>10} {'errors':>8} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}"
+    )
+    for stage in report["stages"]:
+        overall = stage["overall"]
+        latency = overall["latency_ms"]
+        print(
+            f"{stage['level']:>10.1f} {overall['throughput']:>10.1f} "
+            f"{overall['errors']:>8} {latency['p50']:>10.2f} "
+            f"{latency['p95']:>10.2f} {latency['p99']:>10.2f}"
+        )
+
+    print(f"\n{'='*80}")
+    print("Endpoints")
+    print(f"{'='*80}")
+    for name, summary in report["endpoints"].items():
+        latency = summary["latency_ms"]
+        print(
+            f"{name}: {summary['requests']} requests, {summary['errors']} errors, "
+            f"{summary['throughput']:.1f} req/s, p50 {latency['p50']:.2f}ms, "
+            f"p95 {latency['p95']:.2f}ms, p99 {latency['p99']:.2f}ms"
+        )
+        peak = max(summary["histogram_ms"].values()) or 1
+        for bound, count in summary["histogram_ms"].items():
+            if count:
+                bar = "#" * max(int(40 * count / peak), 1)
+                print(f"  <= {bound:>6} ms {count:>8} {bar}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Run a load test from the command line.
+
+    Args:
+        argv: Arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.main --load-test",
+        description="HTTP load test for the job search API",
+    )
+    parser.add_argument(
+        "--target",
+        help="Base URL of a running API (default: serve the app in-process with stubs)",
+    )
+    parser.add_argument("--mode", choices=["closed", "open"], default="closed")
+    parser.add_argument("--ramp", choices=RAMP_PROFILES, default="step")
+    parser.add_argument(
+        "--start", type=float, default=1, help="First load level (users or req/s)"
+    )
+    parser.add_argument(
+        "--end", type=float, default=16, help="Last load level (users or req/s)"
+    )
+    parser.add_argument("--steps", type=int, default=5, help="Number of stages")
+    parser.add_argument(
+        "--duration", type=float, default=60, help="Total duration in seconds"
+    )
+    parser.add_argument(
+        "--mix",
+        default=DEFAULT_MIX,
+        help=f"Request mix as endpoint=weight pairs ({', '.join(ENDPOINTS)})",
+    )
+    parser.add_argument("--think-ms", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--max-workers", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database-url", help="In-process mode: database URL")
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0)
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0)
+    parser.add_argument("--warmup-searches", type=int, default=4)
+    parser.add_argument("--output", "-o", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    shutdown = None
+    if args.target:
+        base_url = args.target
+    else:
+        base_url, shutdown = start_local_target(
+            database_url=args.database_url,
+            stub_latency_ms=args.stub_latency_ms,
+            llm_latency_ms=args.llm_latency_ms,
+            warmup_searches=args.warmup_searches,
+        )
+        # Request logging from the in-process app would dominate the output
+        logging.getLogger().setLevel(logging.WARNING)
+        logger.setLevel(logging.INFO)
+
+    try:
+        load_test = LoadTest(
+            base_url,
+            mix,
+            mode=args.mode,
+            ramp=args.ramp,
+            start=args.start,
+            end=args.end,
+            steps=args.steps,
+            duration=args.duration,
+            think_ms=args.think_ms,
+            timeout=args.timeout,
+            max_workers=args.max_workers,
+            seed=args.seed,
+        )
+        load_test.discover_job_ids()
+        report = load_test.run()
+    finally:
+        if shutdown:
+            shutdown()
+
+    report["target"] = base_url
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -1,18 +1,150 @@
 """Logging configuration utility."""
 
+import atexit
+import itertools
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Optional
 
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DEFAULT_QUEUE_SIZE = 10000
 
-def setup_logger(name: str = "jobsearch", log_file: str = None, level: str = "INFO"):
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RECORD_ATTRIBUTES = set(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime"}
+
+# Listeners started by setup_logger, keyed by logger name
+_listeners: Dict[str, QueueListener] = {}
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record as JSON.
+
+        Args:
+            record: Log record
+
+        Returns:
+            JSON line with timestamp, level, logger, message and any extra fields
+        """
+        created = datetime.fromtimestamp(record.created, timezone.utc)
+        entry = {
+            "timestamp": created.isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a fraction of DEBUG records from chosen loggers.
+
+    Rates are matched by logger name prefix (``src.agents`` covers
+    ``src.agents.job_analyzer``). Every ``1/rate``-th record is kept, so the
+    output stays evenly spread; INFO and above are never dropped.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        """
+        Initialize filter.
+
+        Args:
+            rates: Fraction of records to keep per logger name prefix
+        """
+        super().__init__()
+        self.rates = {name: float(rate) for name, rate in rates.items()}
+        self._strides: Dict[str, int] = {}
+        self._counters: Dict[str, Any] = {}
+
+    def _stride(self, name: str) -> int:
+        """Keep one record in ``stride`` for a logger (1 keeps everything)."""
+        stride = self._strides.get(name)
+        if stride is None:
+            matches = [
+                prefix
+                for prefix in self.rates
+                if name == prefix or name.startswith(f"{prefix}.")
+            ]
+            stride = 1
+            if matches:
+                rate = self.rates[max(matches, key=len)]
+                stride = max(int(round(1 / rate)), 1) if rate > 0 else 0
+            self._strides[name] = stride
+            self._counters[name] = itertools.count()
+        return stride
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether to keep a record."""
+        if record.levelno > logging.DEBUG:
+            return True
+        stride = self._stride(record.name)
+        if stride == 1:
+            return True
+        if stride == 0:
+            return False
+        return next(self._counters[record.name]) % stride == 0
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """Queue handler that defers formatting to the listener and never blocks."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Enqueue the record as-is.
+
+        The stock handler merges ``args`` into the message on the calling
+        thread; here that happens on the listener thread instead, so callers
+        should pass immutable values as log arguments.
+        """
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        """Enqueue a record, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def setup_logger(
+    name: str = "jobsearch",
+    log_file: str = None,
+    level: str = "INFO",
+    fmt: str = DEFAULT_FORMAT,
+    json_format: bool = False,
+    use_queue: bool = False,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    sampling: Optional[Dict[str, float]] = None,
+):
     """
     Set up logger with console and file handlers.
 
     Args:
-        name: Logger name
+        name: Logger name ("" for the root logger)
         log_file: Path to log file (optional)
         level: Logging level
+        fmt: Text format (ignored with json_format)
+        json_format: Write one JSON object per line
+        use_queue: Hand records to a background listener thread so handler
+            I/O stays off the calling thread
+        queue_size: Records buffered before new ones are dropped (use_queue)
+        sampling: Fraction of DEBUG records to keep per logger prefix
 
     Returns:
         Configured logger
@@ -21,16 +153,18 @@ def setup_logger(name: str = "jobsearch", log_file: str = None, level: str = "IN
     logger.setLevel(getattr(logging, level.upper()))
 
     # Remove existing handlers
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
     logger.handlers = []
 
+    formatter = JSONFormatter() if json_format else logging.Formatter(fmt)
+
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(getattr(logging, level.upper()))
-    console_format = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(formatter)
+    handlers = [console_handler]
 
     # File handler
     if log_file:
@@ -43,10 +177,56 @@ def setup_logger(name: str = "jobsearch", log_file: str = None, level: str = "IN
             log_file, maxBytes=10 * 1024 * 1024, backupCount=5  # 10MB
         )
         file_handler.setLevel(getattr(logging, level.upper()))
-        file_format = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    if use_queue:
+        queue_handler = _NonBlockingQueueHandler(queue.Queue(maxsize=queue_size))
+        listener = QueueListener(
+            queue_handler.queue, *handlers, respect_handler_level=True
         )
-        file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+        listener.start()
+        _listeners[name] = listener
+        handlers = [queue_handler]
+
+    for handler in handlers:
+        if sampling:
+            handler.addFilter(SamplingFilter(sampling))
+        logger.addHandler(handler)
 
     return logger
+
+
+def configure_logging(config: Optional[Dict[str, Any]] = None) -> logging.Logger:
+    """
+    Configure the root logger from the ``logging`` section of config.yaml.
+
+    Args:
+        config: ``logging`` section (level, format, file, json, queue,
+            queue_size, sampling)
+
+    Returns:
+        The application's "jobsearch" logger
+    """
+    config = config or {}
+    setup_logger(
+        name="",
+        log_file=config.get("file"),
+        level=config.get("level", "INFO"),
+        fmt=config.get("format", DEFAULT_FORMAT),
+        json_format=bool(config.get("json", False)),
+        use_queue=bool(config.get("queue", False)),
+        queue_size=int(config.get("queue_size", DEFAULT_QUEUE_SIZE)),
+        sampling=config.get("sampling"),
+    )
+    return logging.getLogger("jobsearch")
+
+
+def stop_logging():
+    """Flush queued records and stop all background listeners."""
+    while _listeners:
+        _, listener = _listeners.popitem()
+        listener.stop()
+
+
+atexit.register(stop_logging)
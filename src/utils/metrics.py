@@ -0,0 +1,355 @@
+"""
+Lightweight counters and histograms with Prometheus text exposition.
+
+Metrics are declared once at module level and updated from hot paths::
+
+    FETCH_SECONDS = metrics.histogram(
+        "jobsearch_scraper_search_seconds", "Scraper search latency", ["source"]
+    )
+
+    with FETCH_SECONDS.labels(source="indeed").time():
+        ...
+
+When metrics are disabled (``metrics.enabled: false`` in config.yaml) every
+update is a no-op: ``labels()`` returns a shared null child after a single
+flag check, so instrumentation costs almost nothing.
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds (sub-millisecond normalization up to slow LLM calls)
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class _Registry:
+    """All declared metrics and the global enabled flag."""
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self.enabled = True
+        self.metrics: Dict[str, "_Metric"] = {}
+        self.lock = threading.Lock()
+
+    def register(self, metric: "_Metric") -> "_Metric":
+        """Register a metric, returning the existing one on re-declaration."""
+        with self.lock:
+            return self.metrics.setdefault(metric.name, metric)
+
+
+REGISTRY = _Registry()
+
+
+class _Timer:
+    """Context manager observing elapsed seconds into a histogram child."""
+
+    __slots__ = ("child", "start")
+
+    def __init__(self, child: "_HistogramChild"):
+        """Initialize timer for a histogram child."""
+        self.child = child
+        self.start = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.child.observe(time.perf_counter() - self.start)
+
+
+class _NullChild:
+    """Stand-in for every metric child while metrics are disabled."""
+
+    def inc(self, amount: float = 1):
+        pass
+
+    def observe(self, value: float):
+        pass
+
+    def time(self) -> "_NullChild":
+        return self
+
+    def __enter__(self) -> "_NullChild":
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_CHILD = _NullChild()
+
+
+class _CounterChild:
+    """Value of a counter for one label combination."""
+
+    __slots__ = ("value", "lock")
+
+    def __init__(self, metric: "Counter"):
+        """Initialize counter child at zero."""
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        """Increase the counter."""
+        with self.lock:
+            self.value += amount
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        """Exposition lines for this child."""
+        return [f"{name}{labels} {_format_value(self.value)}"]
+
+
+class _HistogramChild:
+    """Bucket counts of a histogram for one label combination."""
+
+    __slots__ = ("buckets", "counts", "sum", "count", "lock")
+
+    def __init__(self, metric: "Histogram"):
+        """Initialize empty buckets for the histogram's bounds."""
+        self.buckets = metric.buckets
+        self.counts = [0] * len(metric.buckets)
+        self.sum = 0.0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float):
+        """Record one observation."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            if index < len(self.counts):
+                self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def time(self) -> _Timer:
+        """Time a block of code."""
+        return _Timer(self)
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        """Exposition lines (cumulative buckets, sum and count) for this child."""
+        with self.lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            lines.append(
+                f"{name}_bucket{_with_label(labels, 'le', _format_value(bound))} {cumulative}"
+            )
+        lines.append(f"{name}_bucket{_with_label(labels, 'le', '+Inf')} {count}")
+        lines.append(f"{name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{name}_count{labels} {count}")
+        return lines
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    kind = ""
+    child_class: Any = None
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Initialize metric.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.children: Dict[Tuple[str, ...], Any] = {}
+        self.lock = threading.Lock()
+
+    def labels(self, *values: Any, **labels: Any):
+        """
+        Get the child for one label combination.
+
+        Args:
+            *values: Label values in declaration order
+            **labels: Label values by name
+
+        Returns:
+            Metric child (a no-op child when metrics are disabled)
+        """
+        if not REGISTRY.enabled:
+            return _NULL_CHILD
+
+        if labels:
+            values = tuple(labels[name] for name in self.labelnames)
+        key = tuple(str(value) for value in values)
+
+        child = self.children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {key}"
+                )
+            with self.lock:
+                child = self.children.setdefault(key, self.child_class(self))
+        return child
+
+    def render(self) -> List[str]:
+        """Prometheus text lines for this metric."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        with self.lock:
+            children = sorted(self.children.items())
+        for key, child in children:
+            labels = ",".join(
+                f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, key)
+            )
+            lines.extend(child.samples(self.name, f"{{{labels}}}" if labels else ""))
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+    child_class = _CounterChild
+
+    def inc(self, amount: float = 1):
+        """Increase an unlabelled counter."""
+        self.labels().inc(amount)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values (latencies, sizes) in buckets."""
+
+    kind = "histogram"
+    child_class = _HistogramChild
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """Initialize histogram with bucket upper bounds (see _Metric)."""
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float):
+        """Observe a value on an unlabelled histogram."""
+        self.labels().observe(value)
+
+    def time(self):
+        """Time a block of code on an unlabelled histogram."""
+        return self.labels().time()
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    """
+    Declare a counter.
+
+    Args:
+        name: Metric name
+        documentation: Help text
+        labelnames: Label names
+
+    Returns:
+        Counter (the existing one if already declared)
+    """
+    return REGISTRY.register(Counter(name, documentation, labelnames))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    """
+    Declare a histogram.
+
+    Args:
+        name: Metric name
+        documentation: Help text
+        labelnames: Label names
+        buckets: Bucket upper bounds
+
+    Returns:
+        Histogram (the existing one if already declared)
+    """
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))
+
+
+def configure(config: Optional[Dict[str, Any]] = None):
+    """
+    Enable or disable metric collection.
+
+    Args:
+        config: ``metrics`` section of config.yaml (enabled defaults to true)
+    """
+    REGISTRY.enabled = bool((config or {}).get("enabled", True))
+
+
+def is_enabled() -> bool:
+    """Whether metrics are being collected."""
+    return REGISTRY.enabled
+
+
+def render() -> str:
+    """
+    Render every metric in the Prometheus text exposition format.
+
+    Returns:
+        Exposition text
+    """
+    lines = []
+    with REGISTRY.lock:
+        metrics = sorted(REGISTRY.metrics.values(), key=lambda metric: metric.name)
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus expects."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(float(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _with_label(labels: str, name: str, value: str) -> str:
+    """Append one label to a rendered label set."""
+    extra = f'{name}="{value}"'
+    if not labels:
+        return f"{{{extra}}}"
+    return f"{labels[:-1]},{extra}}}"
@@ -0,0 +1,228 @@
+"""
+Opt-in profiling of single searches and API requests.
+
+Two modes:
+
+- ``sample`` (default): a background thread snapshots the profiled
+  thread's stack every ``interval_ms`` and writes folded stacks
+  (``frame;frame;frame count`` per line), the input format of
+  flamegraph.pl, speedscope and inferno. Overhead is proportional to the
+  sampling rate, not to how many Python calls the code makes, so it is
+  cheap enough to leave on for a fraction of production requests.
+- ``cprofile``: deterministic cProfile, written as a ``.prof`` pstats file
+  (open with snakeviz, or convert with flameprof). Exact call counts,
+  but it slows the profiled code noticeably.
+
+Usage:
+    with Profiler("search-python-developer") as profiler:
+        agent.execute_search("Python Developer")
+    print(profiler.output_path)
+"""
+
+import cProfile
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ("sample", "cprofile")
+
+DEFAULT_OUTPUT_DIR = "profiles"
+DEFAULT_INTERVAL_MS = 5.0
+
+
+def _frame_label(frame) -> str:
+    """Folded-stack label for a frame (no ';', which separates frames)."""
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+class SamplingProfiler:
+    """Periodically sample one thread's stack into folded-stack counts."""
+
+    def __init__(
+        self,
+        thread_id: Optional[int] = None,
+        interval_ms: float = DEFAULT_INTERVAL_MS,
+    ):
+        """
+        Initialize sampling profiler.
+
+        Args:
+            thread_id: Thread to sample (defaults to the calling thread)
+            interval_ms: Milliseconds between samples
+        """
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval_ms / 1000.0
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self):
+        """Record the target thread's current stack."""
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+
+        labels = []
+        while frame is not None:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        self.stacks[";".join(reversed(labels))] += 1
+        self.samples += 1
+
+    def _run(self):
+        """Sampling loop."""
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        """Start sampling in the background."""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def folded(self) -> List[str]:
+        """Folded stacks, most frequent first."""
+        return [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+
+    def write(self, path: str):
+        """Write folded stacks to a file."""
+        with open(path, "w") as f:
+            f.write("\n".join(self.folded()))
+            f.write("\n")
+
+
+class Profiler:
+    """Context manager profiling the enclosed block and writing the result."""
+
+    def __init__(
+        self,
+        label: str,
+        mode: str = "sample",
+        output_dir: str = DEFAULT_OUTPUT_DIR,
+        interval_ms: float = DEFAULT_INTERVAL_MS,
+    ):
+        """
+        Initialize profiler.
+
+        Args:
+            label: Name used in the output file name
+            mode: "sample" (folded stacks) or "cprofile" (pstats)
+            output_dir: Directory profiles are written to
+            interval_ms: Sampling interval for "sample" mode
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(
+                f"Unknown profile mode '{mode}', expected one of: {', '.join(PROFILE_MODES)}"
+            )
+
+        self.label = re.sub(r"[^A-Za-z0-9_.-]+", "-", label).strip("-")[:80] or "profile"
+        self.mode = mode
+        self.output_dir = output_dir
+        self.interval_ms = interval_ms
+        self.output_path: Optional[str] = None
+        self.duration = 0.0
+        self._profiler: Any = None
+        self._start = 0.0
+
+    def start(self):
+        """Start profiling the calling thread."""
+        if self.mode == "cprofile":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            self._profiler = SamplingProfiler(interval_ms=self.interval_ms)
+            self._profiler.start()
+        self._start = time.perf_counter()
+
+    def stop(self) -> str:
+        """
+        Stop profiling and write the output file.
+
+        Returns:
+            Path of the written profile
+        """
+        self.duration = time.perf_counter() - self._start
+        if self.mode == "cprofile":
+            self._profiler.disable()
+        else:
+            self._profiler.stop()
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        extension = "prof" if self.mode == "cprofile" else "folded"
+        self.output_path = os.path.join(
+            self.output_dir, f"{timestamp}-{self.label}.{extension}"
+        )
+
+        if self.mode == "cprofile":
+            self._profiler.dump_stats(self.output_path)
+        else:
+            self._profiler.write(self.output_path)
+
+        logger.info(
+            f"Profile of '{self.label}' ({self.duration:.3f}s, {self.mode}) "
+            f"written to {self.output_path}"
+        )
+        return self.output_path
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def should_sample(sample_rate: float) -> bool:
+    """
+    Decide whether to profile an unflagged request.
+
+    Args:
+        sample_rate: Fraction of requests to profile (0 disables)
+
+    Returns:
+        True if this request should be profiled
+    """
+    return sample_rate > 0 and random.random() < sample_rate
+
+
+def profiling_options(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Read the ``profiling`` config section with defaults.
+
+    Args:
+        config: ``profiling`` section of config.yaml
+
+    Returns:
+        Dictionary with mode, output_dir, interval_ms, sample_rate and
+        allow_header
+    """
+    config = config or {}
+    return {
+        "mode": config.get("mode", "sample"),
+        "output_dir": config.get("output_dir", DEFAULT_OUTPUT_DIR),
+        "interval_ms": float(config.get("interval_ms", DEFAULT_INTERVAL_MS)),
+        "sample_rate": float(config.get("sample_rate", 0.0)),
+        "allow_header": bool(config.get("allow_header", False)),
+    }
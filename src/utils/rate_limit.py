@@ -0,0 +1,75 @@
+"""Thread-safe rate limiting for outbound provider calls."""
+
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every thread calling one provider.
+
+    Allows ``calls`` calls per ``period`` seconds on average, with bursts
+    of up to ``burst`` calls (default: ``calls``). ``acquire`` blocks until
+    a call is allowed, so concurrent workers share the budget instead of
+    each assuming they own it.
+    """
+
+    def __init__(self, calls: float, period: float = 1.0, burst: Optional[int] = None):
+        """
+        Initialize rate limiter.
+
+        Args:
+            calls: Calls allowed per period (must be positive)
+            period: Period length in seconds
+            burst: Maximum calls allowed back to back
+        """
+        if calls <= 0 or period <= 0:
+            raise ValueError("calls and period must be positive")
+        self.rate = calls / period
+        self.capacity = float(burst if burst is not None else max(calls, 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add the tokens earned since the last update (lock held)."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self) -> bool:
+        """Take a call slot if one is free, without waiting."""
+        with self.lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a call slot.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True once a slot was taken, False if the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+
+            if deadline is not None:
+                remaining = deadline - now
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
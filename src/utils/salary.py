@@ -0,0 +1,355 @@
+"""
+Normalization of provider salaries to annual amounts in one currency.
+
+Providers report salaries per hour, day, week, month or year, in their own
+currency and often without saying which. ``SalaryNormalizer`` converts a
+job's range to annual amounts in the configured base currency so stored
+jobs can be compared and filtered in SQL:
+
+    normalizer = SalaryNormalizer.from_config(config.get("salary"))
+    annual_min, annual_max = normalizer.annualize(
+        salary_min, salary_max, currency="GBP", period="hour"
+    )
+
+Missing periods are inferred from the amount (e.g. 45 is hourly, 85000
+yearly) and missing currencies default to ``default_currency``. Exchange
+rates are static (configurable) values, not live quotes.
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BASE_CURRENCY = "USD"
+
+# Pay periods per year
+PERIODS_PER_YEAR = {
+    "hour": 2080,  # 40 hours x 52 weeks
+    "day": 260,
+    "week": 52,
+    "month": 12,
+    "year": 1,
+}
+
+_PERIOD_ALIASES = {
+    "hour": "hour",
+    "hourly": "hour",
+    "hr": "hour",
+    "an hour": "hour",
+    "per hour": "hour",
+    "day": "day",
+    "daily": "day",
+    "a day": "day",
+    "per day": "day",
+    "week": "week",
+    "weekly": "week",
+    "a week": "week",
+    "per week": "week",
+    "month": "month",
+    "monthly": "month",
+    "a month": "month",
+    "per month": "month",
+    "year": "year",
+    "yearly": "year",
+    "annual": "year",
+    "annually": "year",
+    "yr": "year",
+    "a year": "year",
+    "per year": "year",
+    "per annum": "year",
+}
+
+# Largest amount still read as a rate for the period, when none is given
+_PERIOD_CEILINGS = (
+    (300.0, "hour"),
+    (2000.0, "day"),
+    (25000.0, "month"),
+)
+
+# Value of one unit of each currency in USD
+DEFAULT_EXCHANGE_RATES = {
+    "USD": 1.0,
+    "EUR": 1.08,
+    "GBP": 1.27,
+    "CAD": 0.73,
+    "AUD": 0.66,
+    "NZD": 0.61,
+    "CHF": 1.13,
+    "SGD": 0.74,
+    "INR": 0.012,
+    "JPY": 0.0067,
+    "PLN": 0.25,
+    "BRL": 0.18,
+    "MXN": 0.058,
+    "ZAR": 0.054,
+}
+
+_CURRENCY_SYMBOLS = {
+    "$": "USD",
+    "US$": "USD",
+    "C$": "CAD",
+    "CA$": "CAD",
+    "A$": "AUD",
+    "AU$": "AUD",
+    "€": "EUR",
+    "£": "GBP",
+    "₹": "INR",
+    "¥": "JPY",
+}
+
+_AMOUNT_PATTERN = re.compile(
+    r"(?P<currency>[A-Z]{0,3}\$|[€£₹¥]|[A-Z]{3}\s)?\s*"
+    r"(?P<amount>\d[\d,]*(?:\.\d+)?)(?P<suffix>[kKmM](?![a-zA-Z]))?"
+)
+_PERIOD_PATTERN = re.compile(
+    r"\b(?:an?|per)\s+(hour|day|week|month|year|annum)\b"
+    r"|\b(hourly|daily|weekly|monthly|yearly|annually)\b",
+    re.IGNORECASE,
+)
+
+
+def normalize_period(value: Any) -> Optional[str]:
+    """
+    Canonical pay period ("hour", "day", "week", "month" or "year").
+
+    Args:
+        value: Provider period such as "HOURLY", "per annum" or "yr"
+
+    Returns:
+        Canonical period, or None if unknown
+    """
+    if not isinstance(value, str):
+        return None
+    return _PERIOD_ALIASES.get(value.strip().lower().replace("_", " "))
+
+
+def infer_period(amount: float) -> str:
+    """Most likely pay period for an amount reported without one."""
+    for ceiling, period in _PERIOD_CEILINGS:
+        if amount <= ceiling:
+            return period
+    return "year"
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Positive float from a number or numeric string, else None."""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, str):
+        value = value.replace(",", "").strip()
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+@lru_cache(maxsize=4096)
+def parse_salary_text(
+    text: str,
+) -> Optional[Tuple[float, float, Optional[str], Optional[str]]]:
+    """
+    Parse a free-text salary such as "$50–$80 an hour" or "120K–150K a year".
+
+    Args:
+        text: Salary text
+
+    Returns:
+        (min, max, currency, period) or None if no amount was found;
+        currency and period are None when the text doesn't say
+    """
+    amounts = []
+    currency = None
+    for match in _AMOUNT_PATTERN.finditer(text):
+        amount = _to_float(match.group("amount"))
+        if amount is None:
+            continue
+        suffix = (match.group("suffix") or "").lower()
+        if suffix == "k":
+            amount *= 1000
+        elif suffix == "m":
+            amount *= 1000000
+        amounts.append(amount)
+
+        symbol = (match.group("currency") or "").strip()
+        if symbol and currency is None:
+            currency = _CURRENCY_SYMBOLS.get(
+                symbol, symbol if len(symbol) == 3 else None
+            )
+
+    if not amounts:
+        return None
+
+    period = None
+    period_match = _PERIOD_PATTERN.search(text)
+    if period_match:
+        word = (period_match.group(1) or period_match.group(2)).lower()
+        period = "year" if word == "annum" else normalize_period(word)
+
+    return min(amounts), max(amounts), currency, period
+
+
+class SalaryNormalizer:
+    """Converts salary ranges to annual amounts in a base currency."""
+
+    def __init__(
+        self,
+        base_currency: str = BASE_CURRENCY,
+        default_currency: str = BASE_CURRENCY,
+        exchange_rates: Optional[Dict[str, float]] = None,
+        hours_per_year: Optional[int] = None,
+    ):
+        """
+        Initialize normalizer.
+
+        Args:
+            base_currency: Currency of the annualized amounts
+            default_currency: Assumed currency when a job doesn't report one
+            exchange_rates: Value of one unit of each currency in USD; merged
+                over DEFAULT_EXCHANGE_RATES
+            hours_per_year: Working hours per year for hourly rates
+        """
+        self.base_currency = base_currency.upper()
+        self.default_currency = default_currency.upper()
+        self.exchange_rates = dict(DEFAULT_EXCHANGE_RATES)
+        for code, rate in (exchange_rates or {}).items():
+            self.exchange_rates[code.upper()] = float(rate)
+        self.periods_per_year = dict(PERIODS_PER_YEAR)
+        if hours_per_year:
+            self.periods_per_year["hour"] = hours_per_year
+
+        if self.base_currency not in self.exchange_rates:
+            raise ValueError(f"No exchange rate for base currency {self.base_currency}")
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "SalaryNormalizer":
+        """
+        Build a normalizer from the ``salary`` config section.
+
+        Args:
+            config: Salary configuration (None for defaults)
+
+        Returns:
+            SalaryNormalizer
+        """
+        config = config or {}
+        return cls(
+            base_currency=config.get("base_currency", BASE_CURRENCY),
+            default_currency=config.get("default_currency", BASE_CURRENCY),
+            exchange_rates=config.get("exchange_rates"),
+            hours_per_year=config.get("hours_per_year"),
+        )
+
+    def resolve(
+        self,
+        salary_min: Any,
+        salary_max: Any,
+        currency: Optional[str] = None,
+        period: Optional[str] = None,
+    ) -> Tuple[Optional[float], Optional[float], str, Optional[str]]:
+        """
+        Clean a reported range and fill in its currency and period.
+
+        Args:
+            salary_min: Reported minimum
+            salary_max: Reported maximum
+            currency: Reported currency code (default: default_currency)
+            period: Reported pay period (default: inferred from the amount)
+
+        Returns:
+            (min, max, currency, period); period is None without amounts
+        """
+        low = _to_float(salary_min)
+        high = _to_float(salary_max)
+        if low is not None and high is not None and low > high:
+            low, high = high, low
+
+        currency = (currency or self.default_currency).upper()
+        period = normalize_period(period)
+        if period is None and (low is not None or high is not None):
+            period = infer_period(high if high is not None else low)
+
+        return low, high, currency, period
+
+    def _annual(
+        self,
+        low: Optional[float],
+        high: Optional[float],
+        currency: str,
+        period: Optional[str],
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """Annual base-currency range for an already resolved salary."""
+        if low is None and high is None:
+            return None, None
+
+        rate = self.exchange_rates.get(currency)
+        if rate is None:
+            logger.debug("No exchange rate for %s, salary not normalized", currency)
+            return None, None
+
+        base_rate = self.exchange_rates[self.base_currency]
+        factor = self.periods_per_year[period] * rate / base_rate
+        low = low if low is not None else high
+        high = high if high is not None else low
+        return round(low * factor, 2), round(high * factor, 2)
+
+    def annualize(
+        self,
+        salary_min: Any,
+        salary_max: Any,
+        currency: Optional[str] = None,
+        period: Optional[str] = None,
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Annual salary range in the base currency.
+
+        A range with only one bound uses it for both, so open-ended postings
+        still match range filters.
+
+        Args:
+            salary_min: Reported minimum
+            salary_max: Reported maximum
+            currency: Reported currency code
+            period: Reported pay period
+
+        Returns:
+            (annual min, annual max), both None if the range is unknown or
+            the currency has no exchange rate
+        """
+        return self._annual(*self.resolve(salary_min, salary_max, currency, period))
+
+    def normalize(
+        self,
+        salary_min: Any,
+        salary_max: Any,
+        currency: Optional[str] = None,
+        period: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Salary column values for a job row.
+
+        Args:
+            salary_min: Reported minimum
+            salary_max: Reported maximum
+            currency: Reported currency code
+            period: Reported pay period
+
+        Returns:
+            Dictionary with salary_min, salary_max, salary_currency,
+            salary_period, annual_salary_min and annual_salary_max
+        """
+        low, high, currency, period = self.resolve(
+            salary_min, salary_max, currency, period
+        )
+        annual_min, annual_max = self._annual(low, high, currency, period)
+        return {
+            "salary_min": low,
+            "salary_max": high,
+            "salary_currency": currency,
+            "salary_period": period,
+            "annual_salary_min": annual_min,
+            "annual_salary_max": annual_max,
+        }